@@ -0,0 +1,222 @@
+# src/cli.py
+"""
+Пакетная обработка папки с файлами съемки без графического интерфейса.
+
+Для каждого файла Excel рассчитываются результирующие векторы и
+превышения допуска, строятся PDF-отчет и Excel с результатами; по всем
+файлам записывается сводка JSON или CSV.
+
+Пример:
+    python -m src.cli surveys/ -o reports/ --azimuth 15 --tolerance 1.0 --workers 4
+"""
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import matplotlib
+
+matplotlib.use('Agg')  # До импорта модулей отрисовки: только растеризация без окон
+
+import numpy as np
+
+from src.utils.excel_loader import load_vectors, save_vectors
+from src.utils.report_builder import ReportBuilder
+
+INPUT_EXTENSIONS = ('.xlsx', '.xls')
+
+DEFAULT_FONT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 'resources', 'fonts', 'ISOCPEUR.ttf')
+
+SUMMARY_FIELDS = ('file', 'status', 'sections', 'load_errors', 'max_magnitude',
+                  'exceed_op1', 'exceed_op2', 'exceed_op3', 'max_excess',
+                  'pdf', 'xlsx', 'seconds', 'error')
+
+
+def find_surveys(directory, recursive=False, exclude=None):
+    """
+    Файлы Excel в папке, отсортированные по пути
+
+    Args:
+        directory (str): Папка с файлами съемки
+        recursive (bool): Искать и во вложенных папках
+        exclude (str): Папка, пропускаемая при обходе (папка отчетов)
+    """
+    paths = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                if recursive and not (exclude and os.path.samefile(entry.path, exclude)):
+                    paths.extend(find_surveys(entry.path, recursive, exclude))
+            elif (entry.name.lower().endswith(INPUT_EXTENSIONS)
+                  and not entry.name.startswith('~$')):  # Файлы блокировки Excel
+                paths.append(entry.path)
+    return sorted(paths)
+
+
+def process_survey(path, output_dir, azimuth, is_clockwise, tolerance,
+                   font_path=None, pdf=True, xlsx=True):
+    """
+    Обработать один файл съемки
+
+    Выполняется в процессах пула; ошибки не выбрасываются, а попадают в
+    сводку. Отчеты записываются в output_dir, папка создается при
+    необходимости.
+
+    Returns:
+        dict: Строка сводки с полями SUMMARY_FIELDS
+    """
+    started = time.perf_counter()
+    stem = os.path.splitext(os.path.basename(path))[0]
+    summary = dict.fromkeys(SUMMARY_FIELDS)
+    summary['file'] = path
+
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        result = load_vectors(path)
+        builder = ReportBuilder(result.dataset, azimuth, is_clockwise, tolerance,
+                                font_path)
+        calculation, analysis = builder.calculation, builder.analysis
+        checks = [analysis.check(column) for column in range(3)]
+
+        if pdf:
+            summary['pdf'] = os.path.join(output_dir, f"{stem}.pdf")
+            builder.write(summary['pdf'])
+
+        if xlsx:
+            summary['xlsx'] = os.path.join(output_dir, f"{stem}_results.xlsx")
+            resultants = calculation.rotated_resultants
+            exceeded = np.column_stack([check.mask[1:] for check in checks])
+            save_vectors(summary['xlsx'], calculation.dataset(), {
+                'Вектор X, мм': resultants[:, 0],
+                'Вектор Y, мм': resultants[:, 1],
+                'Вектор, мм': calculation.magnitudes,
+                'Вне допуска': [", ".join(f"ОП{column + 1}" for column in np.flatnonzero(row))
+                                for row in exceeded],
+            })
+
+        summary.update(
+            status='ok',
+            sections=len(calculation),
+            load_errors=len(result.errors),
+            max_magnitude=round(float(calculation.magnitudes.max()), 1),
+            exceed_op1=checks[0].exceed_count,
+            exceed_op2=checks[1].exceed_count,
+            exceed_op3=checks[2].exceed_count,
+            max_excess=round(max(check.max_excess for check in checks), 1),
+        )
+    except Exception as e:
+        summary.update(status='error', error=str(e))
+
+    summary['seconds'] = round(time.perf_counter() - started, 2)
+    return summary
+
+
+def write_summary(path, rows):
+    """Записать сводку в JSON или CSV по расширению файла"""
+    if path.lower().endswith('.csv'):
+        with open(path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=SUMMARY_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(rows, file, ensure_ascii=False, indent=2)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m src.cli',
+        description="Пакетный расчет векторных диаграмм и отклонений по папке файлов Excel")
+    parser.add_argument('input', help="папка с файлами съемки (.xlsx, .xls)")
+    parser.add_argument('-o', '--output', help="папка для отчетов (по умолчанию input/reports)")
+    parser.add_argument('-a', '--azimuth', type=float, default=0.0, help="азимут, градусы")
+    parser.add_argument('--counterclockwise', action='store_true',
+                        help="обход ОП против часовой стрелки")
+    parser.add_argument('-t', '--tolerance', type=float, default=1.0,
+                        help="допустимое отклонение, мм/м")
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help="число процессов (по умолчанию по числу CPU)")
+    parser.add_argument('-s', '--summary',
+                        help="файл сводки .json или .csv (по умолчанию output/summary.json)")
+    parser.add_argument('-r', '--recursive', action='store_true',
+                        help="обрабатывать вложенные папки")
+    parser.add_argument('--font', default=DEFAULT_FONT_PATH, help="шрифт отчетов (.ttf)")
+    parser.add_argument('--no-pdf', dest='pdf', action='store_false', help="без PDF-отчетов")
+    parser.add_argument('--no-excel', dest='xlsx', action='store_false',
+                        help="без Excel с результатами")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Точка входа командной строки
+
+    Returns:
+        int: Код завершения: 0 - все файлы обработаны, 1 - есть ошибки,
+        2 - неверные аргументы или нет файлов
+    """
+    args = parse_args(argv)
+    if args.workers is not None and args.workers < 1:
+        print("Число процессов должно быть не меньше 1", file=sys.stderr)
+        return 2
+    if not os.path.isdir(args.input):
+        print(f"Папка {args.input} не найдена", file=sys.stderr)
+        return 2
+
+    output_dir = args.output or os.path.join(args.input, 'reports')
+    os.makedirs(output_dir, exist_ok=True)
+
+    paths = find_surveys(args.input, args.recursive, exclude=output_dir)
+    if not paths:
+        print(f"В папке {args.input} нет файлов Excel", file=sys.stderr)
+        return 2
+
+    def report_dir(path):
+        # Вложенные папки повторяются в папке отчетов, чтобы одноименные
+        # файлы из разных папок не перезаписывали отчеты друг друга
+        return os.path.normpath(os.path.join(
+            output_dir, os.path.relpath(os.path.dirname(path), args.input)))
+
+    font_path = args.font if args.font and os.path.exists(args.font) else None
+    options = (args.azimuth, not args.counterclockwise, args.tolerance,
+               font_path, args.pdf, args.xlsx)
+
+    workers = min(args.workers or os.cpu_count() or 1, len(paths))
+    rows = []
+    if workers == 1:
+        for path in paths:
+            rows.append(process_survey(path, report_dir(path), *options))
+            _print_progress(rows[-1], len(rows), len(paths))
+    else:
+        # spawn: одинаковое поведение на всех платформах
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            futures = [executor.submit(process_survey, path, report_dir(path), *options)
+                       for path in paths]
+            for future in as_completed(futures):
+                rows.append(future.result())
+                _print_progress(rows[-1], len(rows), len(paths))
+
+    rows.sort(key=lambda row: row['file'])
+    summary_path = args.summary or os.path.join(output_dir, 'summary.json')
+    write_summary(summary_path, rows)
+
+    failed = sum(row['status'] != 'ok' for row in rows)
+    print(f"Обработано файлов: {len(rows) - failed}, с ошибками: {failed}. "
+          f"Сводка: {summary_path}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def _print_progress(row, done, total):
+    state = row['status'] if row['status'] == 'ok' else f"ошибка: {row['error']}"
+    print(f"[{done}/{total}] {row['file']}: {state} ({row['seconds']} с)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -1,28 +1,218 @@
 # src/components/custom_table.py
-from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem, QWidget, QHBoxLayout, QLabel
-from PyQt6.QtCore import pyqtSignal
-from src.models.vector_data import VectorData
+from contextlib import contextmanager
 
+import numpy as np
+from PyQt6.QtWidgets import QTableView, QAbstractItemView
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from src.models.vector_data import VectorDataset
 
-class CustomTable(QTableWidget):
+
+def parse_clipboard_text(text):
+    """
+    Разобрать табличный текст из буфера обмена.
+
+    Разделитель (табуляция, ';' или ',') определяется по первым строкам,
+    десятичная запятая допускается, если она не является разделителем.
+
+    Пустая ячейка равна 0, нечисловая заменяется на 0 и попадает в список
+    ошибок. Ячейки за концом короткой строки считаются отсутствующими.
+
+    Returns:
+        tuple: (names, lengths, errors) - массив имен (None для отсутствующих
+        ячеек), массив (N, 3) длин (NaN для отсутствующих ячеек) и список
+        RowError для нечисловых значений
+    """
+    lines = text.strip('\r\n').splitlines()
+    if not lines or not text.strip():
+        return np.empty(0, dtype=object), np.empty((0, 3)), []
+
+    import pandas as pd  # Загружается при первой вставке, а не при запуске
+
+    # Табуляция (Excel) приоритетнее ';' (CSV с десятичной запятой) и ','
+    sample = "\n".join(lines[:50])
+    delimiter = next((d for d in ('\t', ';', ',') if d in sample), '\t')
+
+    cells = pd.Series(lines).str.split(delimiter, n=4, expand=True)
+    cells = cells.reindex(columns=range(4), fill_value=None)
+
+    names = cells[0].str.strip()
+    names = names.astype(object).where(names.notna(), None).to_numpy()
+
+    lengths = np.full((len(lines), 3), np.nan)
+    invalid = []
+    for col in range(1, 4):
+        present = cells[col].notna().to_numpy()
+        values = cells[col].str.strip()
+        if delimiter != ',':
+            values = values.str.replace(',', '.', regex=False)
+        numeric = pd.to_numeric(values.where(values != "", "0"),
+                                errors='coerce').to_numpy(dtype=np.float64)
+
+        bad = present & np.isnan(numeric)
+        invalid += [(int(row), col) for row in np.flatnonzero(bad)]
+        lengths[:, col - 1] = np.where(bad, 0.0, numeric)
+
+    errors = []
+    if invalid:
+        from src.utils.excel_loader import RowError
+
+        for row, col in sorted(invalid):
+            value = cells.iat[row, col].strip()
+            errors.append(RowError(row=row + 1, column=col, value=value,
+                                   message=f"Нечисловое значение '{value}' заменено на 0"))
+
+    return names, lengths, errors
+
+
+class VectorTableModel(QAbstractTableModel):
+    """
+    Табличная модель поверх VectorDataset.
+
+    Значения ячеек формируются только для видимых строк, правки
+    записываются напрямую в массивы набора данных.
+    """
+
+    HEADERS = ["Сечение", "ОП1", "ОП2", "ОП3"]
+
+    def __init__(self, dataset=None, parent=None):
+        super().__init__(parent)
+        self._dataset = dataset if dataset is not None else VectorDataset()
+
+    def dataset(self):
+        """Текущий набор данных (без копирования)"""
+        return self._dataset
+
+    def set_dataset(self, dataset):
+        """Заменить набор данных целиком"""
+        self.beginResetModel()
+        self._dataset = dataset
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._dataset)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def _is_blank(self, row):
+        """Строка без имени и с нулевыми длинами отображается пустой"""
+        return (not self._dataset.names[row]
+                and not self._dataset.lengths[row].any())
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return None
+
+        row, col = index.row(), index.column()
+        if col == 0:
+            return str(self._dataset.names[row])
+        if self._is_blank(row):
+            return ""
+        return str(float(self._dataset.column(col - 1)[row]))
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+
+        row, col = index.row(), index.column()
+        if col == 0:
+            self._dataset.set_name(row, str(value).strip())
+        else:
+            text = str(value).strip().replace(',', '.')
+            try:
+                number = float(text) if text else 0.0
+            except ValueError:
+                return False  # Некорректное значение не записываем
+            self._dataset.set_length(row, col - 1, number)
+
+        # Пустая строка могла стать непустой - обновляем всю строку
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+                | Qt.ItemFlag.ItemIsEditable)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+    def write_rows(self, start, names, lengths):
+        """
+        Записать блок строк за один проход
+
+        Отсутствующие имена (None) и значения (NaN) - ячейки за концом
+        короткой вставленной строки - оставляют прежнее содержимое. Недостающие строки добавляются одной операцией.
+
+        Args:
+            start (int): Первая строка блока
+            names (NDArray): Имена, None - без изменений
+            lengths (NDArray): (N, 3) длины, NaN - без изменений
+        """
+        count = len(names)
+        if not count:
+            return
+        if start + count > self.rowCount():
+            self.insertRows(self.rowCount(), start + count - self.rowCount())
+
+        rows = slice(start, start + count)
+        target = self._dataset.lengths[rows]
+        target[...] = np.where(np.isnan(lengths), target, lengths)
+
+        has_name = np.fromiter((name is not None for name in names), dtype=bool,
+                               count=count)
+        if has_name.any():
+            current = self._dataset.names[rows].copy()
+            current[has_name] = names[has_name]
+            self._dataset.set_names(rows, current)
+
+        self.dataChanged.emit(self.index(start, 0),
+                              self.index(start + count - 1, len(self.HEADERS) - 1))
+
+    def insertRows(self, row, count, parent=QModelIndex()):
+        self.beginInsertRows(parent, row, row + count - 1)
+        self._dataset.insert_rows(row, count)
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        self.beginRemoveRows(parent, row, row + count - 1)
+        self._dataset.remove_rows(row, count)
+        self.endRemoveRows()
+        return True
+
+
+class CustomTable(QTableView):
     """
     Кастомный компонент таблицы с расширенным функционалом
     """
-    data_changed = pyqtSignal()  # Сигнал об изменении данных
+    # Сигнал об изменении данных: первая и последняя затронутые строки.
+    # После вставки и удаления строк диапазон продолжается до конца таблицы,
+    # так как строки смещаются; last < first, если удалены только последние строки.
+    data_changed = pyqtSignal(int, int)
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._bulk_depth = 0
+        self._pending_range = None
         self.setup_ui()
         self.connect_signals()
 
     def setup_ui(self):
         """Настройка внешнего вида таблицы"""
-        self.setColumnCount(4)
-        self.setHorizontalHeaderLabels(["Сечение", "ОП1", "ОП2", "ОП3"])
-        self.setRowCount(2)
+        self._model = VectorTableModel(VectorDataset(["", ""]), self)
+        self.setModel(self._model)
         self.horizontalHeader().setStretchLastSection(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ContiguousSelection)
         self.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 border: none;
                 gridline-color: #e5e7eb;
             }
@@ -36,67 +226,95 @@ class CustomTable(QTableWidget):
 
     def connect_signals(self):
         """Подключение сигналов"""
-        self.cellChanged.connect(self._on_cell_changed)
+        self._model.dataChanged.connect(
+            lambda top_left, bottom_right, roles=None:
+            self._on_rows_changed(top_left.row(), bottom_right.row()))
+        self._model.rowsInserted.connect(
+            lambda parent, first, last: self._on_rows_changed(first, self.rowCount() - 1))
+        self._model.rowsRemoved.connect(
+            lambda parent, first, last: self._on_rows_changed(first, self.rowCount() - 1))
+        self._model.modelReset.connect(
+            lambda: self._on_rows_changed(0, self.rowCount() - 1))
+
+    def _on_rows_changed(self, first, last):
+        """Обработка изменения строк модели"""
+        if self._bulk_depth:
+            # В пакетном режиме объединяем диапазоны и откладываем сигнал
+            if self._pending_range:
+                first = min(first, self._pending_range[0])
+                last = max(last, self._pending_range[1])
+            self._pending_range = (first, last)
+        else:
+            self.data_changed.emit(first, last)
 
-    def _on_cell_changed(self, row, col):
-        """Обработка изменения ячейки"""
-        self.data_changed.emit()
+    @contextmanager
+    def bulk_update(self):
+        """
+        Пакетное изменение данных: вместо сигнала на каждое изменение
+        по завершении испускается один data_changed с общим диапазоном строк
+        """
+        self._bulk_depth += 1
+        try:
+            yield self._model
+        finally:
+            self._bulk_depth -= 1
+            if not self._bulk_depth and self._pending_range:
+                first, last = self._pending_range
+                self._pending_range = None
+                self.data_changed.emit(first, last)
+
+    def model_data(self):
+        """Получить табличную модель"""
+        return self._model
+
+    def rowCount(self):
+        """Количество строк в таблице"""
+        return self._model.rowCount()
 
     def add_row(self):
         """Добавить новую строку"""
-        self.insertRow(self.rowCount())
-        self.data_changed.emit()
+        self._model.insertRows(self._model.rowCount(), 1)
 
     def delete_row(self):
         """Удалить выбранную строку"""
-        current_row = self.currentRow()
+        current_row = self.currentIndex().row()
         if current_row >= 0:
-            self.removeRow(current_row)
-            self.data_changed.emit()
+            self._model.removeRows(current_row, 1)
 
     def get_cell_text(self, row, col):
         """Получить текст ячейки с проверкой"""
-        item = self.item(row, col)
-        return item.text() if item else ""
+        return self._model.data(self._model.index(row, col)) or ""
+
+    def get_dataset(self):
+        """Получить все строки таблицы (без копирования)"""
+        return self._model.dataset()
 
     def get_data(self):
-        """Получить данные из таблицы в виде списка VectorData"""
-        data = []
-        for row in range(self.rowCount()):
-            try:
-                name = self.get_cell_text(row, 0)
-                length1 = float(self.get_cell_text(row, 1) or 0)
-                length2 = float(self.get_cell_text(row, 2) or 0)
-                length3 = float(self.get_cell_text(row, 3) or 0)
+        """
+        Получить непустые строки таблицы в виде VectorDataset.
 
-                if any([length1, length2, length3]):  # Пропускаем пустые строки
-                    data.append(VectorData(name, length1, length2, length3))
-            except ValueError:
-                continue  # Пропускаем строки с некорректными данными
-        return data
+        Если пустых строк нет, возвращается сам набор данных без копирования.
+        """
+        dataset = self._model.dataset()
+        mask = dataset.nonempty_mask()  # Пропускаем пустые строки
+        return dataset if mask.all() else dataset[mask]
 
     def paste_data(self, text):
-        """Вставить данные из буфера обмена"""
-        rows = text.strip().split('\n')
-        for row_idx, row in enumerate(rows):
-            if row_idx >= self.rowCount():
-                self.insertRow(self.rowCount())
-
-            columns = row.strip().split('\t')
-            for col_idx, value in enumerate(columns[:4]):
-                self.setItem(row_idx, col_idx, QTableWidgetItem(value))
+        """
+        Вставить данные из буфера обмена
 
-        self.data_changed.emit()
+        Returns:
+            list: RowError для нечисловых значений, замененных на 0
+        """
+        names, lengths, errors = parse_clipboard_text(text)
+        with self.bulk_update() as model:
+            model.write_rows(0, names, lengths)
+        return errors
 
     def set_data(self, data_list):
-        """Установить данные из списка VectorData"""
-        self.setRowCount(0)
-        for vector_data in data_list:
-            row = self.rowCount()
-            self.insertRow(row)
-            self.setItem(row, 0, QTableWidgetItem(str(vector_data.name)))
-            self.setItem(row, 1, QTableWidgetItem(str(vector_data.length1)))
-            self.setItem(row, 2, QTableWidgetItem(str(vector_data.length2)))
-            self.setItem(row, 3, QTableWidgetItem(str(vector_data.length3)))
-
-        self.data_changed.emit()
\ No newline at end of file
+        """Установить данные из VectorDataset или списка VectorData"""
+        dataset = data_list
+        if not isinstance(dataset, VectorDataset):
+            dataset = VectorDataset.from_vector_data(data_list)
+        with self.bulk_update() as model:
+            model.set_dataset(dataset)
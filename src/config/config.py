@@ -10,10 +10,18 @@ class AppConfig:
     # Настройки очистки файлов
     TEMP_FILES_TTL_DAYS = 1
     LOG_FILES_TTL_DAYS = 30
+    CACHE_FILES_TTL_DAYS = 7
+    HOUSEKEEPING_INTERVAL_HOURS = 24  # Очистка не чаще одного раза за интервал
+    HOUSEKEEPING_DELAY_MS = 5000  # Запуск фоновой очистки после старта окна
 
     # Настройки графиков
     PLOT_DPI = 100
     PLOT_FORMAT = 'png'
+    VECTOR_PIXMAP_CACHE_SIZE = 300  # Отрисованных векторных диаграмм в кэше
+    # Отрисовка векторных диаграмм: 'matplotlib' или 'native' (QPainter)
+    VECTOR_RENDERER = 'matplotlib'
+    PREVIEW_MAX_FPS = 30  # Частота перерисовки при перемещении слайдера азимута
+    TOLERANCE_DEBOUNCE_MS = 300  # Задержка применения допуска при вводе, мс
 
     # Настройки интерфейса
     FONT_SIZE = 14
@@ -21,6 +29,8 @@ class AppConfig:
 
     # Настройки экспорта
     PDF_DPI = 300
+    PDF_EXPORT_MODE = 'raster'  # 'raster' - изображения, 'vector' - векторная графика
+    EXPORT_WORKERS = None  # Процессов растеризации при экспорте, None - по числу CPU
     EXCEL_ENCODING = 'utf-8'
 
     # Пути к ресурсам (относительно корня приложения)
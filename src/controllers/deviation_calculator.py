@@ -0,0 +1,207 @@
+from typing import Iterator, List, NamedTuple
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+
+class ToleranceCheck(NamedTuple):
+    """
+    Result of checking one deviation series against a tolerance envelope.
+
+    Attributes:
+        heights: (N,) heights in m
+        deviations: (N,) deviations in mm
+        limits: (N,) allowed absolute deviation at each height in mm
+        mask: (N,) bool mask of points outside tolerance
+        exceed_count: Number of points outside tolerance
+        max_excess: Largest amount by which a deviation exceeds its limit,
+            0.0 if every point is within tolerance
+        worst_index: Index of the point with the largest excess, -1 if none
+    """
+    heights: NDArray
+    deviations: NDArray
+    limits: NDArray
+    mask: NDArray
+    exceed_count: int
+    max_excess: float
+    worst_index: int
+
+    @property
+    def exceed_ratio(self) -> float:
+        """Share of points outside tolerance"""
+        return self.exceed_count / len(self.mask) if len(self.mask) else 0.0
+
+
+class DeviationCalculator:
+    """
+    Vectorized tolerance checks for vertical deviation series.
+    All methods are static and thread-safe.
+    """
+
+    @staticmethod
+    def tolerance_limits(heights: ArrayLike, tolerance_mm_per_m: float) -> NDArray:
+        """
+        Calculate the allowed absolute deviation for each height.
+
+        Args:
+            heights: Heights in m
+            tolerance_mm_per_m: Allowable deviation in mm per meter of height
+
+        Returns:
+            NDArray: Limits in mm, same shape as heights
+        """
+        return np.asarray(heights, dtype=np.float64) * tolerance_mm_per_m
+
+    @staticmethod
+    def check_tolerance(heights: ArrayLike, deviations: ArrayLike,
+                        tolerance_mm_per_m: float) -> ToleranceCheck:
+        """
+        Check a deviation series against the tolerance envelope in one pass.
+
+        A point is outside tolerance if |deviation| > height * tolerance.
+        Points with NaN height or deviation are never outside tolerance.
+
+        Args:
+            heights: (N,) heights in m
+            deviations: (N,) deviations in mm
+            tolerance_mm_per_m: Allowable deviation in mm per meter of height
+
+        Returns:
+            ToleranceCheck: Mask and exceedance statistics
+        """
+        heights = np.asarray(heights, dtype=np.float64)
+        deviations = np.asarray(deviations, dtype=np.float64)
+        if heights.shape != deviations.shape:
+            raise ValueError("Heights and deviations must have the same shape")
+        return DeviationCalculator.check_columns(heights, deviations[:, None],
+                                                 tolerance_mm_per_m)[0]
+
+    @staticmethod
+    def check_columns(heights: ArrayLike, deviations: ArrayLike,
+                      tolerance_mm_per_m: float) -> List[ToleranceCheck]:
+        """
+        Check K deviation series sharing the same heights in one pass.
+
+        Args:
+            heights: (N,) heights in m
+            deviations: (N, K) deviations in mm
+            tolerance_mm_per_m: Allowable deviation in mm per meter of height
+
+        Returns:
+            List[ToleranceCheck]: One check per column; arrays are views
+            into the shared inputs and results
+        """
+        heights = np.asarray(heights, dtype=np.float64)
+        deviations = np.asarray(deviations, dtype=np.float64)
+        if deviations.ndim != 2 or deviations.shape[0] != heights.shape[0]:
+            raise ValueError("Deviations must have shape (N, K) matching heights")
+
+        limits = DeviationCalculator.tolerance_limits(heights, tolerance_mm_per_m)
+        with np.errstate(invalid='ignore'):
+            excess = np.abs(deviations) - limits[:, None]
+            mask = excess > 0
+
+        counts = np.count_nonzero(mask, axis=0)
+        if len(heights):
+            worst = np.argmax(np.where(mask, excess, -np.inf), axis=0)
+        else:
+            worst = np.zeros(deviations.shape[1], dtype=np.intp)
+
+        checks = []
+        for column in range(deviations.shape[1]):
+            if counts[column]:
+                worst_index = int(worst[column])
+                max_excess = float(excess[worst_index, column])
+            else:
+                worst_index, max_excess = -1, 0.0
+            checks.append(ToleranceCheck(heights, deviations[:, column], limits,
+                                         mask[:, column], int(counts[column]),
+                                         max_excess, worst_index))
+        return checks
+
+
+class DeviationAnalysis:
+    """
+    Deviation series of all three OP columns, computed once per dataset.
+
+    Heights are parsed once; the plots get views of the shared arrays.
+    A tolerance change recomputes only the envelope and the masks.
+    """
+
+    def __init__(self, dataset, tolerance_mm_per_m: float = 1.0):
+        """
+        Args:
+            dataset (VectorDataset): Plotted rows
+            tolerance_mm_per_m: Allowable deviation in mm per meter of height
+        """
+        # Ряд начинается с точки (0, 0)
+        self.heights = np.concatenate([[0.0], dataset.heights])
+        self.deviations = np.vstack([np.zeros((1, 3)), dataset.lengths])
+        self.min_height = 0.0
+        self.max_height = float(np.nanmax(self.heights))
+        self.set_tolerance(tolerance_mm_per_m)
+
+    @classmethod
+    def _from_arrays(cls, heights, deviations, tolerance_mm_per_m):
+        """Анализ поверх готовых массивов без копирования"""
+        analysis = cls.__new__(cls)
+        analysis.heights = heights
+        analysis.deviations = deviations
+        with np.errstate(invalid='ignore'):
+            analysis.min_height = float(np.nanmin(heights))
+            analysis.max_height = float(np.nanmax(heights))
+        analysis.set_tolerance(tolerance_mm_per_m)
+        return analysis
+
+    def set_tolerance(self, tolerance_mm_per_m: float) -> None:
+        """
+        Recompute the tolerance envelope and exceedance masks.
+
+        Args:
+            tolerance_mm_per_m: Allowable deviation in mm per meter of height
+        """
+        self.tolerance = tolerance_mm_per_m
+        self.height_range = np.array([self.min_height, self.max_height])
+        self.envelope = DeviationCalculator.tolerance_limits(self.height_range,
+                                                             tolerance_mm_per_m)
+        self.checks = DeviationCalculator.check_columns(self.heights, self.deviations,
+                                                        tolerance_mm_per_m)
+
+    def __len__(self):
+        """Number of points per series, including the origin"""
+        return len(self.heights)
+
+    def series(self, column: int) -> NDArray:
+        """(N,) deviations of one OP column (view)"""
+        return self.deviations[:, column]
+
+    def check(self, column: int) -> ToleranceCheck:
+        """Tolerance check of one OP column"""
+        return self.checks[column]
+
+    def window(self, start: int, stop: int) -> 'DeviationAnalysis':
+        """
+        Points [start, stop) as a separate analysis with the same tolerance.
+
+        The envelope of a window spans only its own heights.
+        """
+        return self._from_arrays(self.heights[start:stop],
+                                 self.deviations[start:stop], self.tolerance)
+
+    def windows(self, size: int) -> Iterator['DeviationAnalysis']:
+        """
+        Split the series into windows of at most size points.
+
+        Consecutive windows share their boundary point, so the plotted
+        lines continue from page to page.
+
+        Args:
+            size: Points per window, at least 2
+        """
+        step = max(size - 1, 1)
+        for start in range(0, max(len(self) - 1, 1), step):
+            yield self.window(start, start + step + 1)
+
+    def window_count(self, size: int) -> int:
+        """Number of windows produced by windows(size)"""
+        step = max(size - 1, 1)
+        return max(-(-(len(self) - 1) // step), 1)
@@ -0,0 +1,180 @@
+from typing import NamedTuple
+import numpy as np
+from numpy.typing import NDArray
+
+from src.controllers.vector_calculator import VectorCalculator
+from src.models.vector_data import VectorDataset
+
+
+class CalculationUpdate(NamedTuple):
+    """
+    Changes produced by an incremental recalculation.
+
+    Attributes:
+        plot_indices: Indices of plotted rows whose diagrams must be redrawn
+        columns: (3,) bool mask of OP columns whose deviation series changed
+        layout_changed: True if the set of plotted rows changed
+    """
+    plot_indices: NDArray
+    columns: NDArray
+    layout_changed: bool
+
+
+class SurveyCalculation:
+    """
+    Calculation results for every table row with incremental updates.
+
+    Keeps a snapshot of the table data and the per-row results, so that a
+    change of a few rows recomputes only those rows. Only non-empty rows
+    are plotted; plot index i corresponds to table row rows[i].
+    """
+
+    def __init__(self, dataset: VectorDataset, azimuth: float, is_clockwise: bool):
+        """
+        Args:
+            dataset: All table rows, including empty ones
+            azimuth: Azimuth in degrees
+            is_clockwise: Direction of rotation
+        """
+        self.azimuth = azimuth
+        self.is_clockwise = is_clockwise
+        self._snapshot = dataset.copy()
+        self._resultants = np.zeros((0, 2))
+        self._rotated = np.zeros((0, 2))
+        self._magnitudes = np.zeros(0)
+        self._calculate(0, len(self._snapshot))
+        self.rows = np.flatnonzero(self._snapshot.nonempty_mask())
+
+    def _calculate(self, start, stop):
+        """Пересчитать строки [start, stop) снимка"""
+        size = len(self._snapshot)
+        if len(self._resultants) != size:
+            self._resultants = np.resize(self._resultants, (size, 2))
+            self._rotated = np.resize(self._rotated, (size, 2))
+            self._magnitudes = np.resize(self._magnitudes, size)
+
+        if stop <= start:
+            return
+        result = VectorCalculator.calculate_batch(self._snapshot.lengths[start:stop],
+                                                  self.is_clockwise)
+        self._resultants[start:stop] = result.resultants
+        self._rotated[start:stop] = VectorCalculator.rotate_vectors(result.resultants,
+                                                                    self.azimuth)
+        self._magnitudes[start:stop] = result.magnitudes
+
+    def set_orientation(self, azimuth: float, is_clockwise: bool) -> bool:
+        """
+        Change azimuth and direction without re-reading the table.
+
+        An azimuth change is a single batched rotation of the stored
+        resultants; a direction change recomputes all rows in one batch.
+
+        Args:
+            azimuth: Azimuth in degrees
+            is_clockwise: Direction of rotation
+
+        Returns:
+            bool: True if anything changed
+        """
+        if azimuth == self.azimuth and is_clockwise == self.is_clockwise:
+            return False
+
+        self.azimuth = azimuth
+        if is_clockwise != self.is_clockwise:
+            self.is_clockwise = is_clockwise
+            self._calculate(0, len(self._snapshot))
+        else:
+            self._rotated = VectorCalculator.rotate_vectors(self._resultants, azimuth)
+        return True
+
+    def update_rows(self, dataset: VectorDataset, first: int, last: int) -> CalculationUpdate:
+        """
+        Recalculate table rows [first, last] after a change.
+
+        Args:
+            dataset: All table rows after the change
+            first: First changed row
+            last: Last changed row; rows were inserted or removed if the
+                table size changed, and every row from first is then dirty
+
+        Returns:
+            CalculationUpdate: What has to be redrawn
+        """
+        size = len(dataset)
+        first = max(first, 0)
+        structural = size != len(self._snapshot)
+        stop = size if structural else min(last + 1, size)
+
+        if structural:
+            # Строки сместились: заменяем хвост снимка начиная с first
+            self._snapshot = VectorDataset.concat([self._snapshot[:first],
+                                                   dataset[first:].copy()])
+            changed_rows = np.arange(first, size)
+            columns = np.ones(3, dtype=bool)
+        else:
+            old_lengths = self._snapshot.lengths[first:stop]
+            new_lengths = dataset.lengths[first:stop]
+            lengths_changed = old_lengths != new_lengths
+            names_changed = self._snapshot.names[first:stop] != dataset.names[first:stop]
+
+            changed_rows = first + np.flatnonzero(lengths_changed.any(axis=1) | names_changed)
+            # Смена имени меняет высоту во всех трех сериях отклонений
+            columns = lengths_changed.any(axis=0) | names_changed.any()
+
+            old_lengths[...] = new_lengths
+            self._snapshot.set_names(slice(first, stop), dataset.names[first:stop])
+
+        if len(changed_rows):
+            self._calculate(int(changed_rows[0]), int(changed_rows[-1]) + 1)
+        else:
+            self._calculate(0, 0)
+
+        rows = np.flatnonzero(self._snapshot.nonempty_mask())
+        layout_changed = not np.array_equal(rows, self.rows)
+        if layout_changed:
+            # Перерисовываем все диаграммы начиная с первой затронутой строки
+            plot_indices = np.arange(np.searchsorted(rows, first), len(rows))
+            columns = np.ones(3, dtype=bool)
+        else:
+            plot_indices = np.flatnonzero(np.isin(rows, changed_rows))
+        self.rows = rows
+
+        return CalculationUpdate(plot_indices, columns, layout_changed)
+
+    def __len__(self):
+        """Number of plotted rows"""
+        return len(self.rows)
+
+    @property
+    def names(self):
+        """Names of plotted rows"""
+        return self._snapshot.names[self.rows]
+
+    @property
+    def resultants(self):
+        """Resultants of plotted rows (not rotated)"""
+        return self._resultants[self.rows]
+
+    @property
+    def rotated_resultants(self):
+        """Resultants of plotted rows rotated by azimuth"""
+        return self._rotated[self.rows]
+
+    @property
+    def magnitudes(self):
+        """Resultant magnitudes of plotted rows"""
+        return self._magnitudes[self.rows]
+
+    def plot_item(self, index):
+        """
+        Get (name, rotated resultant, magnitude) for one plotted row
+
+        Args:
+            index (int): Plot index
+        """
+        row = self.rows[index]
+        return self._snapshot.names[row], self._rotated[row], self._magnitudes[row]
+
+    def dataset(self):
+        """Plotted rows as a VectorDataset"""
+        return self._snapshot[self.rows]
@@ -1,7 +1,24 @@
-from typing import List, Tuple, Union
+from typing import List, NamedTuple, Tuple, Union
 import numpy as np
 from functools import lru_cache
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
+
+
+class BatchResult(NamedTuple):
+    """
+    Result of a batched vector calculation for N rows.
+
+    Attributes:
+        vectors: (N, 3, 2) array of vector coordinates
+        resultants: (N, 2) array of resultant vectors
+        magnitudes: (N,) array of resultant magnitudes
+        angles: (N,) array of resultant angles in degrees [0, 360),
+            NaN for zero resultants
+    """
+    vectors: NDArray
+    resultants: NDArray
+    magnitudes: NDArray
+    angles: NDArray
 
 
 class VectorCalculator:
@@ -12,6 +29,14 @@ class VectorCalculator:
 
     EPSILON = 1e-10  # Constant for floating point comparisons
 
+    # Unit vectors for the 0, 1 and 2 direction slots (angles 0, ±120, ±240)
+    _CLOCKWISE_UNITS = np.stack([np.cos(np.radians([0, -120, -240])),
+                                 np.sin(np.radians([0, -120, -240]))], axis=1)
+    _COUNTERCLOCKWISE_UNITS = np.stack([np.cos(np.radians([0, 120, 240])),
+                                        np.sin(np.radians([0, 120, 240]))], axis=1)
+    _CLOCKWISE_UNITS.setflags(write=False)
+    _COUNTERCLOCKWISE_UNITS.setflags(write=False)
+
     @staticmethod
     def validate_lengths(lengths: List[float]) -> None:
         """
@@ -30,6 +55,161 @@ class VectorCalculator:
         if any(x < 0 for x in lengths):
             raise ValueError("Vector lengths cannot be negative")
 
+    @staticmethod
+    def validate_lengths_batch(lengths: ArrayLike) -> NDArray:
+        """
+        Validate a batch of vector lengths and convert it to a float array.
+
+        Unlike validate_lengths, signed values are accepted: the table stores
+        deviations, which may be negative.
+
+        Args:
+            lengths: (N, 3) array-like of vector lengths
+
+        Returns:
+            NDArray: (N, 3) float64 array
+
+        Raises:
+            ValueError: If lengths are not an (N, 3) numeric array
+        """
+        try:
+            array = np.asarray(lengths, dtype=np.float64)
+        except (TypeError, ValueError):
+            raise ValueError("All lengths must be numeric")
+        if array.ndim != 2 or array.shape[1] != 3:
+            raise ValueError("Lengths must be an (N, 3) array")
+        return array
+
+    @staticmethod
+    def calculate_vectors_batch(lengths: ArrayLike, is_clockwise: bool) -> NDArray:
+        """
+        Calculate vectors for N rows of lengths in one vectorized pass.
+
+        Zero-length vectors are skipped and do not advance the direction,
+        exactly as in calculate_vectors.
+
+        Args:
+            lengths: (N, 3) array-like of vector lengths
+            is_clockwise: Direction of rotation
+
+        Returns:
+            NDArray: (N, 3, 2) array of vector coordinates
+
+        Raises:
+            ValueError: If input validation fails
+        """
+        lengths = VectorCalculator.validate_lengths_batch(lengths)
+
+        nonzero = np.abs(lengths) >= VectorCalculator.EPSILON
+        # Номер направления для каждого вектора без учета нулевых векторов
+        slots = np.cumsum(nonzero, axis=1) - nonzero
+        units = (VectorCalculator._CLOCKWISE_UNITS if is_clockwise
+                 else VectorCalculator._COUNTERCLOCKWISE_UNITS)
+
+        vectors = lengths[..., np.newaxis] * units[slots]
+        vectors[~nonzero] = 0.0
+        return vectors
+
+    @staticmethod
+    def calculate_resultants(vectors: NDArray) -> NDArray:
+        """
+        Calculate resultant vectors for a batch of vector sets.
+
+        Args:
+            vectors: (N, K, 2) array of vectors
+
+        Returns:
+            NDArray: (N, 2) array of resultant vectors
+
+        Raises:
+            ValueError: If vectors array is invalid
+        """
+        if not isinstance(vectors, np.ndarray):
+            raise ValueError("Vectors must be a numpy array")
+        if vectors.ndim != 3 or vectors.shape[2] != 2:
+            raise ValueError("Vectors must be an (N, K, 2) array")
+
+        resultants = np.sum(vectors, axis=1)
+        resultants[np.all(np.abs(resultants) < VectorCalculator.EPSILON, axis=1)] = 0.0
+        return resultants
+
+    @staticmethod
+    def rotate_vectors(vectors: NDArray, angle_degrees: float) -> NDArray:
+        """
+        Rotate a batch of vectors by given angle.
+
+        Args:
+            vectors: (..., 2) array of vectors
+            angle_degrees: Rotation angle in degrees
+
+        Returns:
+            NDArray: Rotated vectors of the same shape
+        """
+        rotation_matrix = VectorCalculator._calculate_rotation_matrix(angle_degrees)
+        x = vectors[..., 0]
+        y = vectors[..., 1]
+
+        rotated = np.stack([
+            rotation_matrix[0, 0] * x + rotation_matrix[0, 1] * y,
+            rotation_matrix[1, 0] * x + rotation_matrix[1, 1] * y
+        ], axis=-1)
+        rotated[np.all(np.abs(vectors) < VectorCalculator.EPSILON, axis=-1)] = 0.0
+        return rotated
+
+    @staticmethod
+    def vector_magnitudes(vectors: NDArray) -> NDArray:
+        """
+        Calculate magnitudes for a batch of vectors.
+
+        Args:
+            vectors: (..., 2) array of vectors
+
+        Returns:
+            NDArray: Array of magnitudes
+        """
+        magnitudes = np.linalg.norm(vectors, axis=-1)
+        magnitudes[magnitudes < VectorCalculator.EPSILON] = 0.0
+        return magnitudes
+
+    @staticmethod
+    def vector_angles(vectors: NDArray) -> NDArray:
+        """
+        Calculate angles for a batch of vectors.
+
+        Args:
+            vectors: (..., 2) array of vectors
+
+        Returns:
+            NDArray: Angles in degrees [0, 360), NaN for zero vectors
+        """
+        angles = np.degrees(np.arctan2(vectors[..., 1], vectors[..., 0])) % 360
+        return np.where(np.all(np.abs(vectors) < VectorCalculator.EPSILON, axis=-1),
+                        np.nan, angles)
+
+    @staticmethod
+    def calculate_batch(lengths: ArrayLike, is_clockwise: bool) -> BatchResult:
+        """
+        Calculate vectors, resultants, magnitudes and angles for N rows.
+
+        Args:
+            lengths: (N, 3) array-like of vector lengths
+            is_clockwise: Direction of rotation
+
+        Returns:
+            BatchResult: Calculation results for all rows
+
+        Raises:
+            ValueError: If input validation fails
+        """
+        vectors = VectorCalculator.calculate_vectors_batch(lengths, is_clockwise)
+        resultants = VectorCalculator.calculate_resultants(vectors)
+        return BatchResult(
+            vectors=vectors,
+            resultants=resultants,
+            magnitudes=VectorCalculator.vector_magnitudes(resultants),
+            angles=VectorCalculator.vector_angles(resultants)
+        )
+
     @staticmethod
     def calculate_vectors(lengths: List[float], is_clockwise: bool) -> NDArray:
         """
@@ -46,22 +226,7 @@ class VectorCalculator:
             ValueError: If input validation fails
         """
         VectorCalculator.validate_lengths(lengths)
-
-        vectors = np.zeros((3, 2))
-        angle = 0
-
-        for i, length in enumerate(lengths):
-            if abs(length) < VectorCalculator.EPSILON:
-                continue  # Skip zero-length vectors
-
-            radians = np.radians(angle)
-            vectors[i] = [
-                length * np.cos(radians),
-                length * np.sin(radians)
-            ]
-            angle += -120 if is_clockwise else 120
-
-        return vectors
+        return VectorCalculator.calculate_vectors_batch([lengths], is_clockwise)[0]
 
     @staticmethod
     def calculate_resultant(vectors: NDArray) -> NDArray:
@@ -82,11 +247,7 @@ class VectorCalculator:
         if vectors.shape[1] != 2:
             raise ValueError("Each vector must have 2 coordinates")
 
-        resultant = np.sum(vectors, axis=0)
-        if np.all(np.abs(resultant) < VectorCalculator.EPSILON):
-            return np.zeros(2)  # Return zero vector explicitly
-
-        return resultant
+        return VectorCalculator.calculate_resultants(vectors[np.newaxis])[0]
 
     @staticmethod
     @lru_cache(maxsize=128)
@@ -101,10 +262,12 @@ class VectorCalculator:
             NDArray: 2x2 rotation matrix
         """
         angle_rad = np.radians(angle_degrees)
-        return np.array([
+        rotation_matrix = np.array([
             [np.cos(angle_rad), -np.sin(angle_rad)],
             [np.sin(angle_rad), np.cos(angle_rad)]
         ])
+        rotation_matrix.setflags(write=False)  # Матрица разделяется через кэш
+        return rotation_matrix
 
     @staticmethod
     def rotate_vector(vector: NDArray, angle_degrees: float) -> NDArray:
@@ -124,11 +287,7 @@ class VectorCalculator:
         if not isinstance(vector, np.ndarray) or vector.shape != (2,):
             raise ValueError("Vector must be a 2D numpy array")
 
-        if np.all(np.abs(vector) < VectorCalculator.EPSILON):
-            return np.zeros(2)  # No need to rotate zero vector
-
-        rotation_matrix = VectorCalculator._calculate_rotation_matrix(angle_degrees)
-        return np.dot(rotation_matrix, vector)
+        return VectorCalculator.rotate_vectors(vector, angle_degrees)
 
     @staticmethod
     def vector_magnitude(vector: NDArray) -> float:
@@ -147,8 +306,7 @@ class VectorCalculator:
         if not isinstance(vector, np.ndarray):
             raise ValueError("Vector must be a numpy array")
 
-        magnitude = np.linalg.norm(vector)
-        return 0.0 if magnitude < VectorCalculator.EPSILON else magnitude
+        return float(VectorCalculator.vector_magnitudes(vector.reshape(1, -1))[0])
 
     @staticmethod
     def vector_angle(vector: NDArray) -> float:
@@ -170,4 +328,4 @@ class VectorCalculator:
         if np.all(np.abs(vector) < VectorCalculator.EPSILON):
             raise ValueError("Cannot calculate angle for zero vector")
 
-        return np.degrees(np.arctan2(vector[1], vector[0])) % 360
\ No newline at end of file
+        return float(VectorCalculator.vector_angles(vector))
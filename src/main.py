@@ -3,10 +3,10 @@ import sys
 import os
 import shutil
 import atexit
+import multiprocessing
 import tempfile
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QIcon
-from src.views.main_window import MainWindow
+from src.utils import import_timer
+from src.utils.profiler import STARTUP, profiler
 
 
 def cleanup_temp():
@@ -32,10 +32,32 @@ def cleanup_temp():
 
 
 if __name__ == '__main__':
+    # Пул процессов экспорта в собранном приложении
+    multiprocessing.freeze_support()
+
+    # Замер времени запуска (флаг --import-time); Qt и окно импортируются
+    # после установки таймера, чтобы попасть в отчет
+    timer = import_timer.start_from_argv()
+    startup = profiler.start("Запуск до показа окна", STARTUP)
+
+    with profiler.phase("Импорт модулей", STARTUP):
+        from PyQt6.QtCore import QTimer
+        from PyQt6.QtWidgets import QApplication
+        from PyQt6.QtGui import QIcon
+        from src.utils.app_manager import AppManager
+        from src.views.main_window import MainWindow
+
+    if timer:
+        timer.mark("Импорт модулей")
+
     # Регистрация функции очистки
     atexit.register(cleanup_temp)
 
-    app = QApplication(sys.argv)
+    with profiler.phase("Создание QApplication", STARTUP):
+        app = QApplication(sys.argv)
+
+    # Пути, журнал, очистка и настройки (этапы замеряются внутри)
+    app_manager = AppManager()
 
     # Установка иконки приложения
     icon_path = os.path.join(
@@ -47,13 +69,25 @@ if __name__ == '__main__':
         app.setWindowIcon(QIcon(icon_path))
 
     # Создание и отображение главного окна
-    window = MainWindow()
-    window.show()
+    with profiler.phase("Создание главного окна", STARTUP):
+        window = MainWindow()
+        window.show()
+
+    def report_startup():
+        profiler.finish(startup)
+        if timer:
+            timer.mark("Первое окно показано")
+            timer.stop()
+            print(timer.report(), file=sys.stderr)
+
+    # Выполняется в цикле событий после первой отрисовки окна
+    QTimer.singleShot(0, report_startup)
 
     # Запуск приложения
     exit_code = app.exec()
 
     # Очистка перед выходом
+    app_manager.cleanup_on_exit()
     cleanup_temp()
 
     sys.exit(exit_code)
\ No newline at end of file
@@ -1,4 +1,19 @@
+import numpy as np
+from src.controllers.vector_calculator import VectorCalculator
+
+
 class VectorData:
+    """
+    Vector data for one section.
+
+    Uses __slots__ to avoid a per-instance __dict__. Derived values (height,
+    resultant, magnitude, angle) are computed lazily, cached per direction
+    and invalidated whenever the row changes.
+    """
+
+    __slots__ = ('_name', '_length1', '_length2', '_length3',
+                 '_height', '_clockwise_result', '_counterclockwise_result')
+
     def __init__(self, name="", length1=0.0, length2=0.0, length3=0.0):
         """
         Initialize a VectorData object
@@ -9,10 +24,53 @@ class VectorData:
             length2 (float): Length of second vector
             length3 (float): Length of third vector
         """
-        self.name = name
-        self.length1 = length1
-        self.length2 = length2
-        self.length3 = length3
+        self._name = name
+        self._length1 = length1
+        self._length2 = length2
+        self._length3 = length3
+        self._invalidate()
+
+    def _invalidate(self):
+        """Сбросить кэшированные производные значения"""
+        self._height = None
+        self._clockwise_result = None
+        self._counterclockwise_result = None
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+        self._invalidate()
+
+    @property
+    def length1(self):
+        return self._length1
+
+    @length1.setter
+    def length1(self, value):
+        self._length1 = value
+        self._invalidate()
+
+    @property
+    def length2(self):
+        return self._length2
+
+    @length2.setter
+    def length2(self, value):
+        self._length2 = value
+        self._invalidate()
+
+    @property
+    def length3(self):
+        return self._length3
+
+    @length3.setter
+    def length3(self, value):
+        self._length3 = value
+        self._invalidate()
 
     def __str__(self):
         """String representation of the vector data"""
@@ -29,7 +87,251 @@ class VectorData:
         Args:
             data_dict (dict): Dictionary with keys 'name', 'length1', 'length2', 'length3'
         """
-        self.name = data_dict.get('name', '')
-        self.length1 = float(data_dict.get('length1', 0))
-        self.length2 = float(data_dict.get('length2', 0))
-        self.length3 = float(data_dict.get('length3', 0))
\ No newline at end of file
+        self._name = data_dict.get('name', '')
+        self._length1 = float(data_dict.get('length1', 0))
+        self._length2 = float(data_dict.get('length2', 0))
+        self._length3 = float(data_dict.get('length3', 0))
+        self._invalidate()
+
+    @property
+    def height(self):
+        """Section height parsed from name (cached)"""
+        if self._height is None:
+            self._height = VectorDataset.parse_height(self._name)
+        return self._height
+
+    def _result(self, is_clockwise):
+        """Get cached (resultant, magnitude, angle) for given direction"""
+        result = self._clockwise_result if is_clockwise else self._counterclockwise_result
+        if result is None:
+            batch = VectorCalculator.calculate_batch([self.as_list()], is_clockwise)
+            resultant = batch.resultants[0]
+            resultant.setflags(write=False)
+            result = (resultant, float(batch.magnitudes[0]), float(batch.angles[0]))
+            if is_clockwise:
+                self._clockwise_result = result
+            else:
+                self._counterclockwise_result = result
+        return result
+
+    def resultant(self, is_clockwise):
+        """
+        Resultant vector for given direction (cached, read-only)
+
+        Args:
+            is_clockwise (bool): Direction of rotation
+        """
+        return self._result(is_clockwise)[0]
+
+    def magnitude(self, is_clockwise):
+        """Resultant magnitude for given direction (cached)"""
+        return self._result(is_clockwise)[1]
+
+    def angle(self, is_clockwise):
+        """Resultant angle in degrees for given direction, NaN for zero resultant (cached)"""
+        return self._result(is_clockwise)[2]
+
+
+class VectorDataset:
+    """
+    Columnar container for vector data.
+
+    Names are stored in an object array, the three OP columns in one
+    contiguous (3, N) float64 block and the parsed section heights in a
+    float64 array. Column accessors and slices are views, not copies.
+    """
+
+    COLUMN_NAMES = ('length1', 'length2', 'length3')
+
+    def __init__(self, names=(), lengths=None):
+        """
+        Initialize a VectorDataset
+
+        Args:
+            names (sequence): Section names, one per row
+            lengths (array-like): (N, 3) array of vector lengths
+        """
+        names = np.array(list(names), dtype=object).reshape(-1)
+        if lengths is None:
+            lengths = np.zeros((len(names), 3))
+        lengths = np.asarray(lengths, dtype=np.float64).reshape(-1, 3)
+        if len(lengths) != len(names):
+            raise ValueError("Names and lengths must have the same number of rows")
+
+        self._names = names
+        self._columns = np.ascontiguousarray(lengths.T)
+        self._heights = self.parse_heights(names)
+
+    @classmethod
+    def _from_arrays(cls, names, columns, heights):
+        """Создать набор данных поверх готовых массивов без копирования"""
+        dataset = cls.__new__(cls)
+        dataset._names = names
+        dataset._columns = columns
+        dataset._heights = heights
+        return dataset
+
+    @classmethod
+    def from_vector_data(cls, data_list):
+        """
+        Create a dataset from a list of VectorData objects
+
+        Args:
+            data_list (list): List of VectorData objects
+        """
+        return cls([data.name for data in data_list],
+                   [data.as_list() for data in data_list])
+
+    @classmethod
+    def concat(cls, datasets):
+        """
+        Concatenate several datasets into one
+
+        Args:
+            datasets (iterable): VectorDataset objects
+        """
+        datasets = list(datasets)
+        if not datasets:
+            return cls()
+        return cls._from_arrays(
+            np.concatenate([dataset._names for dataset in datasets]),
+            np.concatenate([dataset._columns for dataset in datasets], axis=1),
+            np.concatenate([dataset._heights for dataset in datasets])
+        )
+
+    @staticmethod
+    def parse_height(name):
+        """
+        Parse section height from its name
+
+        Returns:
+            float: Height in meters, 0.0 for an empty name, NaN if not numeric
+        """
+        if name is None or str(name).strip() == "":
+            return 0.0
+        try:
+            return float(str(name).strip().replace(',', '.'))
+        except ValueError:
+            return np.nan
+
+    @staticmethod
+    def parse_heights(names):
+        """Parse section heights for a sequence of names"""
+        return np.fromiter((VectorDataset.parse_height(name) for name in names),
+                           dtype=np.float64, count=len(names))
+
+    def __len__(self):
+        return len(self._names)
+
+    def __iter__(self):
+        """Iterate over rows as VectorData objects"""
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index):
+        """
+        Get a row or a subset of rows
+
+        Args:
+            index (int | slice | array): Integer index returns a VectorData,
+                a slice returns a view, an index or mask array returns a copy
+        """
+        if isinstance(index, (int, np.integer)):
+            length1, length2, length3 = self._columns[:, index].tolist()
+            return VectorData(self._names[index], length1, length2, length3)
+        return self._from_arrays(self._names[index],
+                                 self._columns[:, index],
+                                 self._heights[index])
+
+    def __repr__(self):
+        return f"VectorDataset({len(self)} rows)"
+
+    @property
+    def names(self):
+        """Section names (object array view)"""
+        return self._names
+
+    @property
+    def heights(self):
+        """Parsed section heights (float64 array view)"""
+        return self._heights
+
+    @property
+    def lengths(self):
+        """Vector lengths as an (N, 3) view"""
+        return self._columns.T
+
+    def column(self, index):
+        """
+        Get one OP column as a contiguous view
+
+        Args:
+            index (int): Column index (0 for ОП1, 1 for ОП2, 2 for ОП3)
+        """
+        return self._columns[index]
+
+    @property
+    def length1(self):
+        return self._columns[0]
+
+    @property
+    def length2(self):
+        return self._columns[1]
+
+    @property
+    def length3(self):
+        return self._columns[2]
+
+    def copy(self):
+        """Independent copy of the dataset"""
+        return self._from_arrays(self._names.copy(), self._columns.copy(),
+                                 self._heights.copy())
+
+    def set_name(self, row, name):
+        """Set section name of a row and update its parsed height"""
+        self._names[row] = name
+        self._heights[row] = self.parse_height(name)
+
+    def set_names(self, rows, names):
+        """Set section names for a slice of rows and update their heights"""
+        self._names[rows] = names
+        self._heights[rows] = self.parse_heights(self._names[rows])
+
+    def set_length(self, row, column, value):
+        """
+        Set one length value in place
+
+        Args:
+            row (int): Row index
+            column (int): Column index (0 for ОП1, 1 for ОП2, 2 for ОП3)
+            value (float): New length
+        """
+        self._columns[column, row] = value
+
+    def insert_rows(self, position, count=1):
+        """Insert empty rows before position"""
+        names = np.full(count, "", dtype=object)
+        self._names = np.concatenate([self._names[:position], names,
+                                      self._names[position:]])
+        self._columns = np.concatenate([self._columns[:, :position],
+                                        np.zeros((3, count)),
+                                        self._columns[:, position:]], axis=1)
+        self._heights = np.concatenate([self._heights[:position], np.zeros(count),
+                                        self._heights[position:]])
+
+    def remove_rows(self, position, count=1):
+        """Remove count rows starting at position"""
+        removed = slice(position, position + count)
+        self._names = np.delete(self._names, removed)
+        self._columns = np.delete(self._columns, removed, axis=1)
+        self._heights = np.delete(self._heights, removed)
+
+    def nonempty_mask(self):
+        """Mask of rows with at least one non-zero length"""
+        return np.any(self._columns != 0, axis=0)
+
+    def to_vector_data(self):
+        """Convert the dataset to a list of VectorData objects"""
+        return [VectorData(name, length1, length2, length3)
+                for name, (length1, length2, length3)
+                in zip(self._names.tolist(), self._columns.T.tolist())]
@@ -8,29 +8,42 @@ import logging
 import time
 from datetime import datetime
 from pathlib import Path
-from PyQt6.QtCore import QSettings
+from PyQt6.QtCore import QSettings, QThread, QTimer
 from src.config.config import AppConfig
+from src.utils.housekeeping import HousekeepingThread
+from src.utils.profiler import HOUSEKEEPING, STARTUP, profiler
 
 
 class AppManager:
     """Менеджер приложения для управления ресурсами и настройками"""
 
+    HOUSEKEEPING_KEY = 'housekeeping/last_run'  # Время последней очистки, с эпохи
+
     def __init__(self):
         self.config = AppConfig
+        self.profiler = profiler
         self.settings = QSettings(self.config.APP_NAME, self.config.APP_NAME)
+        self._housekeeping = None  # Поток фоновой очистки
 
-        # Инициализация путей
-        self.paths = self._initialize_paths()
+        # Каждый этап запуска замеряется; записи до настройки журнала
+        # попадают в него при подключении журнала замеров
+        with profiler.phase("Инициализация путей", STARTUP):
+            self.paths = self._initialize_paths()
 
         # Настройка базовой структуры
-        self._setup_directories()
-        self._setup_logging()
+        with profiler.phase("Создание директорий", STARTUP):
+            self._setup_directories()
+        with profiler.phase("Настройка журнала", STARTUP):
+            self._setup_logging()
+            self._setup_timing_log()
 
-        # Очистка при запуске
-        self._cleanup_old_files()
+        # Очистка старых файлов - в фоновом потоке после запуска
+        with profiler.phase("Планирование очистки", STARTUP):
+            self.start_housekeeping()
 
         # Загрузка пользовательских настроек
-        self.load_settings()
+        with profiler.phase("Загрузка настроек", STARTUP):
+            self.load_settings()
 
     def _initialize_paths(self):
         """Инициализация всех путей приложения"""
@@ -95,34 +108,82 @@ class AppManager:
         self.logger = logging.getLogger(self.config.APP_NAME)
         self.logger.info(f"Приложение запущено. Версия: {self.config.VERSION}")
 
-    def _cleanup_old_files(self):
-        """Очистка старых файлов"""
-        try:
-            # Очистка временных файлов
-            self._cleanup_directory(
-                self.paths['temp'],
-                days=self.config.TEMP_FILES_TTL_DAYS
-            )
-
-            # Очистка логов
-            self._cleanup_directory(
-                self.paths['logs'],
-                days=self.config.LOG_FILES_TTL_DAYS
-            )
-
-            # Очистка кэша
-            self._cleanup_directory(
-                self.paths['cache'],
-                days=7  # Неделя для кэша
-            )
-
-            # Очистка пустых директорий
-            for path in [self.paths['temp'], self.paths['cache']]:
-                self._cleanup_empty_dirs(path)
-
-            self.logger.info("Очистка старых файлов выполнена успешно")
-        except Exception as e:
-            self.logger.error(f"Ошибка при очистке файлов: {e}")
+    def _setup_timing_log(self):
+        """Журнал замеров этапов: одна JSON-запись на строку, файл на день"""
+        self.timing_log_file = os.path.join(
+            self.paths['logs'],
+            f"{self.config.APP_NAME}_timings_{datetime.now().strftime('%Y%m%d')}.jsonl"
+        )
+
+        handler = logging.FileHandler(self.timing_log_file, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(message)s'))
+
+        timing_logger = logging.getLogger(f"{self.config.APP_NAME}.timing")
+        timing_logger.setLevel(logging.INFO)
+        timing_logger.propagate = False  # Замеры не дублируются в основном журнале
+        timing_logger.addHandler(handler)
+        profiler.attach_log(timing_logger)
+
+    def start_housekeeping(self, delay_ms=None):
+        """
+        Запланировать фоновую очистку временных файлов, журналов и кэша
+
+        Очистка выполняется в потоке с низким приоритетом не чаще одного раза
+        за HOUSEKEEPING_INTERVAL_HOURS; время последнего запуска хранится в
+        QSettings. Запуск откладывается, чтобы не конкурировать с
+        созданием главного окна.
+
+        Returns:
+            bool: True если очистка запланирована
+        """
+        last_run = float(self.settings.value(self.HOUSEKEEPING_KEY, 0.0) or 0.0)
+        if time.time() - last_run < self.config.HOUSEKEEPING_INTERVAL_HOURS * 3600:
+            self.logger.debug("Очистка старых файлов пропущена: интервал не истек")
+            return False
+
+        if delay_ms is None:
+            delay_ms = self.config.HOUSEKEEPING_DELAY_MS
+        QTimer.singleShot(delay_ms, self._run_housekeeping)
+        return True
+
+    def _run_housekeeping(self):
+        if self._housekeeping is not None:
+            return
+
+        targets = [
+            (self.paths['temp'], self.config.TEMP_FILES_TTL_DAYS, True),
+            (self.paths['logs'], self.config.LOG_FILES_TTL_DAYS, False),
+            (self.paths['cache'], self.config.CACHE_FILES_TTL_DAYS, True),
+        ]
+        self._housekeeping = HousekeepingThread(targets)
+        self._housekeeping.completed.connect(self._on_housekeeping_completed)
+        self._housekeeping.start(QThread.Priority.LowestPriority)
+
+    def _on_housekeeping_completed(self, stats):
+        """Итог фоновой очистки (вызывается в потоке интерфейса)"""
+        self._housekeeping.wait()
+        self._housekeeping = None
+
+        profiler.record("Очистка старых файлов", HOUSEKEEPING, stats.wall, stats.cpu,
+                        scanned=stats.scanned, removed=stats.removed,
+                        removed_dirs=stats.removed_dirs, errors=stats.errors,
+                        interrupted=stats.interrupted)
+        if stats.interrupted:
+            return  # Незавершенная очистка будет повторена при следующем запуске
+
+        self.settings.setValue(self.HOUSEKEEPING_KEY, time.time())
+        self.logger.info(f"Очистка старых файлов выполнена: просмотрено {stats.scanned}, "
+                         f"удалено файлов {stats.removed}, директорий {stats.removed_dirs}, "
+                         f"ошибок {stats.errors}")
+
+    def stop_housekeeping(self):
+        """Остановить фоновую очистку, если она выполняется"""
+        if self._housekeeping is not None:
+            # Итог прерванной очистки уже не нужен: цикл событий завершается
+            self._housekeeping.completed.disconnect(self._on_housekeeping_completed)
+            self._housekeeping.requestInterruption()
+            self._housekeeping.wait()
+            self._housekeeping = None
 
     def load_settings(self):
         """Загрузка пользовательских настроек"""
@@ -162,6 +223,9 @@ class AppManager:
     def cleanup_on_exit(self):
         """Очистка при выходе из приложения"""
         try:
+            # Незавершенная очистка прерывается и повторяется при следующем запуске
+            self.stop_housekeeping()
+
             # Сохраняем настройки
             self.save_settings()
 
@@ -176,32 +240,3 @@ class AppManager:
             logging.shutdown()
         except Exception as e:
             print(f"Ошибка при завершении работы: {e}")
-
-    def _cleanup_directory(self, directory, days):
-        """Очистка файлов в директории старше указанного количества дней"""
-        if not os.path.exists(directory):
-            return
-
-        cutoff_time = time.time() - (days * 86400)
-
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                file_path = os.path.join(root, file)
-                try:
-                    if os.path.getctime(file_path) < cutoff_time:
-                        os.remove(file_path)
-                        self.logger.debug(f"Удален старый файл: {file_path}")
-                except Exception as e:
-                    self.logger.error(f"Ошибка при удалении файла {file_path}: {e}")
-
-    def _cleanup_empty_dirs(self, directory):
-        """Рекурсивное удаление пустых директорий"""
-        for root, dirs, files in os.walk(directory, topdown=False):
-            for dirname in dirs:
-                dir_path = os.path.join(root, dirname)
-                try:
-                    if not os.listdir(dir_path):
-                        os.rmdir(dir_path)
-                        self.logger.debug(f"Удалена пустая директория: {dir_path}")
-                except Exception as e:
-                    self.logger.error(f"Ошибка при удалении директории {dir_path}: {e}")
\ No newline at end of file
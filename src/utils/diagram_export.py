@@ -0,0 +1,175 @@
+# src/utils/diagram_export.py
+"""
+Растеризация векторных диаграмм для экспорта без зависимостей от Qt.
+
+Диаграммы строятся на figure Agg по результатам расчета, а не по живым
+виджетам; большие отчеты рисуются в пуле процессов.
+"""
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from src.views.diagram_figure import (create_diagram_figure, draw_vector_diagram,
+                                      get_plot_fonts)
+
+# Диаграмм в одном задании пула (одна страница PDF)
+CHUNK_SIZE = 6
+
+# Меньшие отчеты рисуются в текущем процессе: запуск пула дороже
+PARALLEL_THRESHOLD = 24
+
+# Период опроса отмены и обработки событий при ожидании результатов, с
+POLL_INTERVAL = 0.05
+
+_figure = None  # Figure и Axes процесса, переиспользуются между заданиями
+
+
+class ExportCancelled(Exception):
+    """Экспорт отменен пользователем"""
+
+
+class RasterImage(NamedTuple):
+    """
+    Rendered figure as RGBA8888 pixels.
+
+    Attributes:
+        data: Pixel buffer, width * height * 4 bytes, rows top to bottom
+        width: Width in pixels
+        height: Height in pixels
+    """
+    data: object
+    width: int
+    height: int
+
+
+def render_figure(figure, width_px, copy=True):
+    """
+    Rasterize a figure to RGBA pixels at an exact pixel width.
+
+    Args:
+        figure (Figure): Figure with an Agg canvas
+        width_px (int): Target width; the height follows the figure aspect
+        copy (bool): Copy the pixels; without a copy the buffer is valid
+            only until the next draw of the figure
+
+    Returns:
+        RasterImage: Rendered pixels
+    """
+    figure.set_dpi(width_px / figure.get_figwidth())
+    figure.canvas.draw()
+    buffer = figure.canvas.buffer_rgba()
+    height, width = buffer.shape[:2]
+    return RasterImage(bytes(buffer) if copy else buffer, width, height)
+
+
+def render_chunk(items, azimuth, is_clockwise, font_path=None, size_px=1000):
+    """
+    Render a chunk of vector diagrams to RGBA pixels.
+
+    Runs in worker processes as well as in the GUI process; the Agg figure
+    is created once per process.
+
+    Args:
+        items (list): (name, rotated resultant, magnitude) tuples
+        azimuth (float): Azimuth in degrees
+        is_clockwise (bool): Direction of rotation
+        font_path (str): Path to the diagram font, default font if None
+        size_px (int): Side of the square output image in pixels
+
+    Returns:
+        list: RasterImage per item, in item order
+    """
+    global _figure
+    if _figure is None:
+        figure, axes = create_diagram_figure()
+        FigureCanvasAgg(figure)
+        _figure = (figure, axes)
+    figure, axes = _figure
+
+    custom_font, result_font = get_plot_fonts(font_path) if font_path else (None, None)
+
+    images = []
+    for name, resultant, magnitude in items:
+        draw_vector_diagram(figure, axes, name, resultant, magnitude,
+                            azimuth, is_clockwise, custom_font, result_font)
+        images.append(render_figure(figure, size_px))
+    return images
+
+
+def iter_rendered(items: Iterable,
+                  azimuth: float,
+                  is_clockwise: bool,
+                  font_path: Optional[str] = None,
+                  size_px: int = 1000,
+                  workers: Optional[int] = None,
+                  is_cancelled: Optional[Callable[[], bool]] = None,
+                  poll: Optional[Callable[[], None]] = None) -> Iterator[RasterImage]:
+    """
+    Render vector diagrams and yield RGBA images in item order.
+
+    Large exports are split into chunks rendered by a process pool; at most
+    two chunks per worker are in flight, so memory stays bounded.
+
+    Args:
+        items: (name, rotated resultant, magnitude) tuples
+        azimuth: Azimuth in degrees
+        is_clockwise: Direction of rotation
+        font_path: Path to the diagram font
+        size_px: Side of the square output images in pixels
+        workers: Number of worker processes, by CPU count if None;
+            1 renders in the current process
+        is_cancelled: Callback polled between chunks and while waiting
+        poll: Callback invoked while waiting for workers (e.g. to process
+            GUI events)
+
+    Yields:
+        RasterImage: Pixels of the next diagram
+
+    Raises:
+        ExportCancelled: If is_cancelled returned True
+    """
+    items = list(items)
+    chunks = [items[i:i + CHUNK_SIZE] for i in range(0, len(items), CHUNK_SIZE)]
+    workers = workers or max((os.cpu_count() or 1) - 1, 1)
+
+    if workers == 1 or len(items) < PARALLEL_THRESHOLD:
+        for chunk in chunks:
+            if is_cancelled and is_cancelled():
+                raise ExportCancelled()
+            yield from render_chunk(chunk, azimuth, is_clockwise, font_path, size_px)
+            if poll:
+                poll()
+        return
+
+    # spawn: дочерние процессы не наследуют состояние Qt родителя
+    context = multiprocessing.get_context('spawn')
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+    try:
+        pending = deque()
+        remaining = iter(chunks)
+        for chunk in remaining:
+            pending.append(executor.submit(render_chunk, chunk, azimuth,
+                                           is_clockwise, font_path, size_px))
+            if len(pending) >= 2 * workers:
+                break
+
+        while pending:
+            future = pending.popleft()
+            while not future.done():
+                if is_cancelled and is_cancelled():
+                    raise ExportCancelled()
+                wait([future], timeout=POLL_INTERVAL)
+                if poll:
+                    poll()
+
+            chunk = next(remaining, None)
+            if chunk is not None:
+                pending.append(executor.submit(render_chunk, chunk, azimuth,
+                                               is_clockwise, font_path, size_px))
+            yield from future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
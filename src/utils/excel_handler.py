@@ -1,138 +1,119 @@
 # src/utils/excel_handler.py
 from PyQt6.QtWidgets import QFileDialog, QMessageBox
-import pandas as pd
-from src.models.vector_data import VectorData
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+from src.models.vector_data import VectorDataset
 
+# pandas и openpyxl (через excel_loader) загружаются при первом обращении к
+# файлам, чтобы не замедлять запуск приложения
+
+
+class ExcelLoadSignals(QObject):
+    """Сигналы фоновой загрузки Excel"""
+    progress = pyqtSignal(int, int)  # Прочитано строк, всего строк (0 - неизвестно)
+    finished = pyqtSignal(object)  # LoadResult
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+
+class ExcelLoadWorker(QRunnable):
+    """
+    Фоновая загрузка Excel файла через load_vectors.
+
+    Результат передается сигналами в поток GUI.
+    """
+
+    def __init__(self, file_name, sheet=None, columns=None):
+        super().__init__()
+        self.file_name = file_name
+        self.sheet = sheet
+        self.columns = columns
+        self.signals = ExcelLoadSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        """Запросить отмену загрузки"""
+        self._cancelled = True
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def run(self):
+        from src.utils.excel_loader import DEFAULT_COLUMNS, LoadCancelled, load_vectors
 
-class ExcelHandler:
-    @staticmethod
-    def load_from_excel():
-        """
-        Открывает диалоговое окно для выбора Excel файла и загружает векторные данные.
-        """
         try:
-            dialog = QFileDialog(None)
-            dialog.setWindowTitle("Выберите Excel файл")
-            dialog.setNameFilter("Excel Files (*.xlsx *.xls)")
-            dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
-            dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
-            dialog.setViewMode(QFileDialog.ViewMode.Detail)
-
-            if dialog.exec() == QFileDialog.DialogCode.Accepted:
-                file_name = dialog.selectedFiles()[0]
-            else:
-                return []
-
-            print(f"Selected file: {file_name}")  # Для отладки
-
-            # Чтение Excel файла
-            df = pd.read_excel(
-                file_name,
-                engine='openpyxl'  # Явно указываем движок для xlsx
+            result = load_vectors(
+                self.file_name,
+                sheet=self.sheet,
+                columns=self.columns or DEFAULT_COLUMNS,
+                progress=self.signals.progress.emit,
+                is_cancelled=self.is_cancelled
             )
-
-            # Проверяем наличие данных
-            if df.empty:
-                QMessageBox.warning(None, "Предупреждение", "Excel файл пуст")
-                return []
-
-            # Проверяем количество столбцов
-            if len(df.columns) < 4:
-                QMessageBox.warning(None, "Предупреждение",
-                                    "Excel файл должен содержать минимум 4 столбца:\n"
-                                    "Сечение, ОП1, ОП2, ОП3")
-                return []
-
-            # Обработка данных
-            vector_data_list = []
-
-            # Используем только первые 4 столбца
-            df = df.iloc[:, :4]
-
-            for index, row in df.iterrows():
-                try:
-                    # Преобразуем значения
-                    name = str(row.iloc[0]) if not pd.isna(row.iloc[0]) else ""
-
-                    # Получаем числовые значения
-                    lengths = []
-                    for i in range(1, 4):
-                        value = row.iloc[i]
-                        if pd.isna(value):
-                            lengths.append(0.0)
-                        else:
-                            try:
-                                lengths.append(float(value))
-                            except (ValueError, TypeError):
-                                lengths.append(0.0)
-
-                    # Пропускаем строки, где все значения нулевые и имя пустое
-                    if any(lengths) or name.strip():
-                        vector_data = VectorData(
-                            name=name,
-                            length1=lengths[0],
-                            length2=lengths[1],
-                            length3=lengths[2]
-                        )
-                        vector_data_list.append(vector_data)
-
-                except Exception as e:
-                    print(f"Ошибка в строке {index + 1}: {str(e)}")
-                    continue
-
-            if not vector_data_list:
-                QMessageBox.warning(
-                    None,
-                    "Предупреждение",
-                    "Не удалось загрузить данные из файла"
-                )
-                return []
-
-            print(f"Loaded {len(vector_data_list)} records")  # Для отладки
-            return vector_data_list
-
-        except pd.errors.EmptyDataError:
-            QMessageBox.critical(None, "Ошибка", "Excel файл пуст")
-            return []
+        except LoadCancelled:
+            self.signals.cancelled.emit()
+        except ValueError as e:
+            self.signals.failed.emit(str(e))
         except Exception as e:
-            QMessageBox.critical(
-                None,
-                "Ошибка",
+            self.signals.failed.emit(
                 f"Ошибка при загрузке файла: {str(e)}\n"
                 f"Убедитесь, что файл имеет формат .xlsx или .xls"
             )
-            return []
+        else:
+            self.signals.finished.emit(result)
 
+
+class ExcelHandler:
     @staticmethod
-    def _safe_float_convert(value):
+    def select_file(parent=None):
         """
-        Безопасно преобразует значение в float.
+        Открывает диалоговое окно для выбора Excel файла.
+
+        Returns:
+            str | None: Путь к файлу или None при отмене
         """
-        try:
-            if pd.isna(value):
-                return 0.0
-            result = float(value)
-            return result if not pd.isna(result) else 0.0
-        except (ValueError, TypeError):
-            return 0.0
+        dialog = QFileDialog(parent)
+        dialog.setWindowTitle("Выберите Excel файл")
+        dialog.setNameFilter("Excel Files (*.xlsx *.xls)")
+        dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+        dialog.setViewMode(QFileDialog.ViewMode.Detail)
+
+        if dialog.exec() == QFileDialog.DialogCode.Accepted:
+            return dialog.selectedFiles()[0]
+        return None
+
+    @staticmethod
+    def format_errors(errors, limit=10):
+        """
+        Сформировать текст предупреждения по ошибкам строк.
+
+        Args:
+            errors (list): Список RowError
+            limit (int): Максимальное количество перечисляемых ошибок
+        """
+        column_names = {1: "ОП1", 2: "ОП2", 3: "ОП3"}
+        lines = [f"Строка {error.row}, {column_names.get(error.column, error.column)}: "
+                 f"{error.message}" for error in errors[:limit]]
+        if len(errors) > limit:
+            lines.append(f"... и еще {len(errors) - limit}")
+        return "\n".join(lines)
 
     @staticmethod
     def save_to_excel(vector_data_list, file_path):
         """
         Сохраняет векторные данные в Excel файл.
+
+        Args:
+            vector_data_list: VectorDataset или список VectorData
+            file_path (str): Путь к файлу
         """
+        from src.utils.excel_loader import save_vectors
+
         try:
-            data = []
-            for vector_data in vector_data_list:
-                data.append({
-                    'Сечение': vector_data.name,
-                    'ОП1': vector_data.length1,
-                    'ОП2': vector_data.length2,
-                    'ОП3': vector_data.length3
-                })
-
-            df = pd.DataFrame(data)
-            df.to_excel(file_path, index=False, engine='openpyxl')
+            dataset = vector_data_list
+            if not isinstance(dataset, VectorDataset):
+                dataset = VectorDataset.from_vector_data(vector_data_list)
+
+            save_vectors(file_path, dataset)
 
         except Exception as e:
             QMessageBox.critical(
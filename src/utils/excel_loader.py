@@ -0,0 +1,265 @@
+# src/utils/excel_loader.py
+"""
+Загрузка векторных данных из Excel без зависимостей от Qt.
+
+Модуль можно использовать из рабочих потоков, пакетных заданий и бенчмарков.
+"""
+import math
+from typing import Callable, List, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+from src.models.vector_data import VectorDataset
+
+# Столбцы по умолчанию: Сечение, ОП1, ОП2, ОП3
+DEFAULT_COLUMNS = (0, 1, 2, 3)
+
+# Размер блока строк при потоковом чтении
+CHUNK_SIZE = 10000
+
+COLUMNS_MESSAGE = ("Excel файл должен содержать минимум 4 столбца:\n"
+                   "Сечение, ОП1, ОП2, ОП3")
+
+
+class RowError(NamedTuple):
+    """
+    Ошибка преобразования значения в строке Excel.
+
+    Attributes:
+        row: Номер строки на листе (с 1, включая заголовок)
+        column: Номер столбца в наборе (1 - ОП1, 2 - ОП2, 3 - ОП3)
+        value: Исходное значение ячейки
+        message: Описание ошибки
+    """
+    row: int
+    column: int
+    value: object
+    message: str
+
+
+class LoadResult(NamedTuple):
+    """Результат загрузки: набор данных и список ошибок по строкам"""
+    dataset: VectorDataset
+    errors: List[RowError]
+
+
+class LoadCancelled(Exception):
+    """Загрузка отменена пользователем"""
+
+
+def load_vectors(path: str,
+                 sheet: Union[str, int, None] = None,
+                 columns: Sequence[Union[int, str]] = DEFAULT_COLUMNS,
+                 progress: Optional[Callable[[int, int], None]] = None,
+                 is_cancelled: Optional[Callable[[], bool]] = None,
+                 chunk_size: int = CHUNK_SIZE) -> LoadResult:
+    """
+    Load vector data from an Excel file.
+
+    .xlsx files are streamed through openpyxl in read_only mode, other
+    formats are read with pandas. Non-numeric OP values are replaced with
+    zeros and reported in the error list.
+
+    Args:
+        path: Path to the Excel file
+        sheet: Sheet name or index, the first sheet by default
+        columns: Four column indices or header names for the section name
+            and the ОП1, ОП2, ОП3 values
+        progress: Callback receiving (rows_read, total_rows); total_rows
+            is 0 when unknown
+        is_cancelled: Callback polled between chunks
+        chunk_size: Number of rows per streamed chunk
+
+    Returns:
+        LoadResult: Loaded dataset and row errors
+
+    Raises:
+        ValueError: If the file is empty or the columns are missing
+        LoadCancelled: If is_cancelled returned True
+    """
+    if len(columns) != 4:
+        raise ValueError("Необходимо указать 4 столбца: Сечение, ОП1, ОП2, ОП3")
+
+    errors = []
+    if str(path).lower().endswith('.xlsx'):
+        chunks = iter_chunks(path, sheet, columns, chunk_size, errors,
+                             progress, is_cancelled)
+        dataset = VectorDataset.concat(chunks)
+    else:
+        df = pd.read_excel(path, sheet_name=0 if sheet is None else sheet,
+                           header=None)
+        if is_cancelled and is_cancelled():
+            raise LoadCancelled()
+        if df.empty or len(df) < 2:
+            raise ValueError("Excel файл пуст")
+        indices = _resolve_columns(tuple(df.iloc[0]), columns)
+        dataset = frame_to_dataset(df.iloc[1:, indices], first_row=2,
+                                   errors=errors)
+        if progress:
+            progress(len(df) - 1, len(df) - 1)
+
+    return LoadResult(dataset, errors)
+
+
+def iter_chunks(path, sheet=None, columns=DEFAULT_COLUMNS, chunk_size=CHUNK_SIZE,
+                errors=None, progress=None, is_cancelled=None):
+    """
+    Stream an .xlsx sheet in openpyxl read_only mode as dataset chunks.
+
+    Args:
+        path (str): Path to the .xlsx file
+        sheet (str | int | None): Sheet name or index, the first sheet by default
+        columns (sequence): Four column indices or header names
+        chunk_size (int): Number of rows per chunk
+        errors (list): Optional list collecting RowError entries
+        progress (callable): Callback receiving (rows_read, total_rows)
+        is_cancelled (callable): Callback polled between chunks
+
+    Yields:
+        VectorDataset: Next chunk of rows
+
+    Raises:
+        ValueError: If the file is empty or the columns are missing
+        LoadCancelled: If is_cancelled returned True
+    """
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        if sheet is None:
+            worksheet = workbook.worksheets[0]
+        elif isinstance(sheet, int):
+            worksheet = workbook.worksheets[sheet]
+        else:
+            worksheet = workbook[sheet]
+
+        rows = worksheet.iter_rows(values_only=True)
+
+        # Первая строка - заголовок, как в pd.read_excel
+        header = next(rows, None)
+        if header is None:
+            raise ValueError("Excel файл пуст")
+        indices = _resolve_columns(header, columns)
+        width = max(indices) + 1
+        total = max((worksheet.max_row or 1) - 1, 0)
+
+        first_row = 2
+        chunk = []
+        for row in rows:
+            if len(row) < width:
+                row = row + (None,) * (width - len(row))
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield _chunk_to_dataset(chunk, indices, first_row, errors)
+                first_row += len(chunk)
+                chunk = []
+                if progress:
+                    progress(first_row - 2, total)
+                if is_cancelled and is_cancelled():
+                    raise LoadCancelled()
+        if chunk:
+            yield _chunk_to_dataset(chunk, indices, first_row, errors)
+            first_row += len(chunk)
+        if progress:
+            progress(first_row - 2, first_row - 2)
+    finally:
+        workbook.close()
+
+
+def save_vectors(path: str, dataset: VectorDataset,
+                 extra_columns: Optional[dict] = None) -> None:
+    """
+    Save vector data to an .xlsx file readable by load_vectors.
+
+    Args:
+        path: Output path
+        dataset: Rows to save
+        extra_columns: Additional columns appended after ОП3, header name
+            to a sequence with one value per row
+    """
+    columns = {
+        'Сечение': dataset.names,
+        'ОП1': dataset.length1,
+        'ОП2': dataset.length2,
+        'ОП3': dataset.length3
+    }
+    columns.update(extra_columns or {})
+    pd.DataFrame(columns).to_excel(path, index=False, engine='openpyxl')
+
+
+def frame_to_dataset(df, first_row=2, errors=None):
+    """
+    Convert a four-column DataFrame to a VectorDataset in one vectorized step.
+
+    Non-numeric and empty OP values become zeros; rows with an empty name
+    and zero lengths are dropped. Names are formatted cell by cell, so the
+    result does not depend on the dtype pandas infers for the column.
+
+    Args:
+        df (DataFrame): Columns: name, ОП1, ОП2, ОП3
+        first_row (int): Sheet row number of the first frame row
+        errors (list): Optional list collecting RowError entries
+
+    Returns:
+        VectorDataset: Converted rows
+    """
+    names = df.iloc[:, 0].astype(object).map(_name_text)
+
+    raw = df.iloc[:, 1:4]
+    numeric = raw.apply(pd.to_numeric, errors='coerce')
+    if errors is not None:
+        _collect_errors(raw, numeric, first_row, errors)
+    lengths = numeric.fillna(0.0).to_numpy(dtype=np.float64)
+
+    keep = lengths.any(axis=1) | (names.str.strip() != "").to_numpy()
+    return VectorDataset(names.to_numpy()[keep], lengths[keep])
+
+
+def _chunk_to_dataset(chunk, indices, first_row, errors):
+    """Преобразовать блок строк openpyxl в VectorDataset"""
+    # dtype=object: тип столбца имен не должен зависеть от пустых ячеек в блоке
+    df = pd.DataFrame(chunk, dtype=object)
+    return frame_to_dataset(df.iloc[:, indices], first_row, errors)
+
+
+def _name_text(value):
+    """Текст имени сечения: пустая ячейка - "", целое число без дробной части"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _collect_errors(raw, numeric, first_row, errors):
+    """Добавить в список ошибки для непустых значений, не ставших числами"""
+    invalid = (numeric.isna() & raw.notna()).to_numpy()
+    for i, j in zip(*np.nonzero(invalid)):
+        value = raw.iat[i, j]
+        if isinstance(value, str) and not value.strip():
+            continue  # Пустая строка равносильна пустой ячейке
+        errors.append(RowError(
+            row=first_row + int(i),
+            column=int(j) + 1,
+            value=value,
+            message=f"Нечисловое значение '{value}' заменено на 0"
+        ))
+
+
+def _resolve_columns(header, columns):
+    """Преобразовать имена столбцов из заголовка в индексы"""
+    header = list(header)
+    labels = ["" if value is None else str(value).strip() for value in header]
+
+    indices = []
+    for column in columns:
+        if isinstance(column, str):
+            if column.strip() not in labels:
+                raise ValueError(f"Столбец '{column}' не найден")
+            indices.append(labels.index(column.strip()))
+        else:
+            indices.append(int(column))
+
+    if any(index >= len(header) for index in indices):
+        raise ValueError(COLUMNS_MESSAGE)
+    return indices
@@ -0,0 +1,156 @@
+# src/utils/housekeeping.py
+"""
+Фоновая очистка временных файлов, журналов и кэша.
+
+Обход выполняется через os.scandir порциями; между порциями поток
+проверяет запрос на остановку и уступает процессор интерфейсу.
+"""
+import os
+import time
+from typing import Callable, Iterable, NamedTuple, Optional, Tuple
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+BATCH_SIZE = 200  # Записей каталога между проверками остановки
+
+
+class CleanupStats(NamedTuple):
+    """
+    Итог очистки.
+
+    Attributes:
+        scanned: Просмотрено файлов
+        removed: Удалено файлов
+        removed_dirs: Удалено пустых директорий
+        errors: Ошибок удаления
+        wall: Реальное время, с
+        cpu: Процессорное время потока, с
+        interrupted: Очистка прервана до завершения
+    """
+    scanned: int
+    removed: int
+    removed_dirs: int
+    errors: int
+    wall: float
+    cpu: float
+    interrupted: bool
+
+
+class Interrupted(Exception):
+    """Очистка прервана"""
+
+
+def cleanup_directory(directory: str, max_age_days: float,
+                      should_stop: Optional[Callable[[], bool]] = None,
+                      batch_size: int = BATCH_SIZE,
+                      remove_empty_dirs: bool = False) -> Tuple[int, int, int, int]:
+    """
+    Remove files older than max_age_days from a directory tree.
+
+    Args:
+        directory: Root directory, missing directories are skipped
+        max_age_days: Files with ctime older than this are removed
+        should_stop: Callback polled after every batch of entries
+        batch_size: Directory entries per batch
+        remove_empty_dirs: Also remove subdirectories left empty
+
+    Returns:
+        tuple: (scanned, removed, removed_dirs, errors)
+
+    Raises:
+        Interrupted: If should_stop returned True
+    """
+    if not os.path.isdir(directory):
+        return 0, 0, 0, 0
+
+    cutoff_time = time.time() - max_age_days * 86400
+    scanned = removed = removed_dirs = errors = 0
+    processed = 0
+
+    # Обход в глубину без рекурсии; директории запоминаются для удаления
+    # пустых в обратном порядке (сначала вложенные)
+    pending = [directory]
+    visited = []
+    while pending:
+        current = pending.pop()
+        visited.append(current)
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    processed += 1
+                    if processed % batch_size == 0:
+                        if should_stop and should_stop():
+                            raise Interrupted()
+                        time.sleep(0)  # Отдать GIL потоку интерфейса
+
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                            continue
+                        scanned += 1
+                        if entry.stat(follow_symlinks=False).st_ctime < cutoff_time:
+                            os.remove(entry.path)
+                            removed += 1
+                    except OSError:
+                        errors += 1
+        except OSError:
+            errors += 1
+
+    if remove_empty_dirs:
+        for path in reversed(visited[1:]):
+            try:
+                os.rmdir(path)  # Ошибка для непустой директории
+                removed_dirs += 1
+            except OSError:
+                pass
+
+    return scanned, removed, removed_dirs, errors
+
+
+def run_cleanup(targets: Iterable[Tuple[str, float, bool]],
+                should_stop: Optional[Callable[[], bool]] = None,
+                batch_size: int = BATCH_SIZE) -> CleanupStats:
+    """
+    Clean several directories.
+
+    Args:
+        targets: (directory, max_age_days, remove_empty_dirs) tuples
+        should_stop: Callback polled after every batch of entries
+        batch_size: Directory entries per batch
+
+    Returns:
+        CleanupStats: Totals over all directories
+    """
+    started, cpu_started = time.perf_counter(), time.thread_time()
+    totals = [0, 0, 0, 0]
+    interrupted = False
+    try:
+        for directory, max_age_days, remove_empty in targets:
+            result = cleanup_directory(directory, max_age_days, should_stop,
+                                       batch_size, remove_empty)
+            totals = [total + value for total, value in zip(totals, result)]
+    except Interrupted:
+        interrupted = True
+
+    return CleanupStats(*totals, wall=time.perf_counter() - started,
+                        cpu=time.thread_time() - cpu_started, interrupted=interrupted)
+
+
+class HousekeepingThread(QThread):
+    """Очистка в фоновом потоке с низким приоритетом"""
+
+    completed = pyqtSignal(object)  # CleanupStats
+
+    def __init__(self, targets, batch_size=BATCH_SIZE, parent=None):
+        """
+        Args:
+            targets (list): (директория, возраст в днях, удалять пустые директории)
+            batch_size (int): Записей каталога между проверками остановки
+        """
+        super().__init__(parent)
+        self.targets = list(targets)
+        self.batch_size = batch_size
+
+    def run(self):
+        stats = run_cleanup(self.targets, self.isInterruptionRequested, self.batch_size)
+        self.completed.emit(stats)
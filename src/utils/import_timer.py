@@ -0,0 +1,101 @@
+# src/utils/import_timer.py
+"""
+Замер времени запуска: импорт модулей и появление первого окна.
+
+Включается флагом --import-time при запуске приложения; отчет по
+образцу python -X importtime выводится в stderr после показа окна.
+"""
+import builtins
+import importlib.util
+import sys
+import time
+
+FLAG = '--import-time'
+
+
+class ImportTimer:
+    """
+    Import time profiler based on a builtins.__import__ hook.
+
+    Only the first import of each module is timed; imports through
+    importlib.import_module are attributed to the importing module.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.records = []  # (имя, собственное время, суммарное время, глубина)
+        self.marks = []  # (этап, время от запуска)
+        self._stack = []  # Время вложенных импортов для текущих уровней
+        self._original_import = None
+
+    def start(self):
+        """Install the import hook"""
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+        return self
+
+    def stop(self):
+        """Remove the import hook"""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def mark(self, phase):
+        """Record a startup phase with the time since start"""
+        self.marks.append((phase, time.perf_counter() - self.started))
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        try:
+            module_name = (importlib.util.resolve_name('.' * level + name,
+                                                       globals.get('__package__'))
+                           if level else name)
+        except (AttributeError, ImportError, ValueError):
+            module_name = name
+        if not module_name or module_name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = time.perf_counter() - start
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += cumulative
+            self.records.append((module_name, cumulative - children, cumulative,
+                                 len(self._stack)))
+
+    def report(self, limit=30):
+        """
+        Report text: startup phases and the slowest imports
+
+        Args:
+            limit (int): Number of modules listed by cumulative time
+        """
+        lines = ["Время запуска:"]
+        lines += [f"  {phase:<30} {elapsed * 1000:9.1f} мс" for phase, elapsed in self.marks]
+
+        top_level = sum(cumulative for _, _, cumulative, depth in self.records if depth == 0)
+        lines.append(f"Импорт модулей: {len(self.records)}, всего {top_level * 1000:.1f} мс")
+        lines.append(f"  {'собств., мс':>12} | {'суммарно, мс':>12} | модуль")
+        slowest = sorted(self.records, key=lambda record: record[2], reverse=True)[:limit]
+        for module_name, own, cumulative, _ in slowest:
+            lines.append(f"  {own * 1000:12.1f} | {cumulative * 1000:12.1f} | {module_name}")
+        return "\n".join(lines)
+
+
+def start_from_argv(argv=None):
+    """
+    Start an ImportTimer if the startup flag is present.
+
+    The flag is removed from argv so that it does not reach QApplication.
+
+    Returns:
+        ImportTimer | None: Running timer or None if timing is off
+    """
+    argv = sys.argv if argv is None else argv
+    if FLAG not in argv:
+        return None
+    argv.remove(FLAG)
+    return ImportTimer().start()
@@ -1,9 +1,19 @@
-from PyQt6.QtWidgets import QFileDialog, QMessageBox
+from PyQt6.QtWidgets import QApplication, QFileDialog, QMessageBox, QProgressDialog
 from PyQt6.QtPrintSupport import QPrinter
 from PyQt6.QtGui import QPainter, QPageSize, QPageLayout, QImage
 from PyQt6.QtCore import QRectF, QSizeF, Qt
-import tempfile
 import os
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from src.config.config import AppConfig
+from src.views.deviation_figure import TITLES, draw_deviation_plot, get_deviation_font
+from src.views.diagram_geometry import static_geometry, result_geometry
+from src.utils.diagram_export import ExportCancelled, iter_rendered, render_figure
+from src.utils.profiler import EXPORT, profiler
+from src.utils.report_builder import ReportBuilder
+from src.utils.vector_pdf import DEVIATION_POINTS_PER_PAGE
+from src.views.vector_diagram_item import paint_vector_diagram
+from src.views.vector_plot_view import VectorPlotView
 
 
 class PDFExportHandler:
@@ -47,10 +57,19 @@ class PDFExportHandler:
 
     def export_vectors_to_pdf(self):
         """Export vector plots to PDF file"""
+        phase = None
         try:
+            calculation = self.main_window.calculation
+            if calculation is None or not len(calculation):
+                raise ValueError("Нет данных для экспорта")
+
             file_name = self._get_save_filename("vectors.pdf")
             if not file_name:
                 return False
+            phase = profiler.start("Экспорт диаграмм в PDF", EXPORT, mode=AppConfig.PDF_EXPORT_MODE)
+
+            if AppConfig.PDF_EXPORT_MODE == 'vector':
+                return self._write_report(file_name, self._report_builder(('vectors',)))
 
             printer = self._setup_printer(file_name)
 
@@ -67,74 +86,188 @@ class PDFExportHandler:
             else:
                 plot_height = plot_width / aspect_ratio
 
+            # Диаграммы рисуются вне экрана по результатам расчета,
+            # так как сетка держит живые виджеты только для видимых ячеек
+            count = len(calculation)
+            items = zip(calculation.names, calculation.rotated_resultants,
+                        calculation.magnitudes)
+
+            # QPainter рисует диаграммы в PDF векторно, без растеризации
+            native = AppConfig.VECTOR_RENDERER == VectorPlotView.RENDERER_NATIVE
+            if native:
+                static = static_geometry(calculation.azimuth, calculation.is_clockwise)
+                images = (None for _ in range(count))
+            else:
+                images = iter_rendered(
+                    items, calculation.azimuth, calculation.is_clockwise,
+                    font_path=getattr(self.main_window, 'font_path', None),
+                    size_px=self._raster_size(printer, plot_width),
+                    workers=AppConfig.EXPORT_WORKERS,
+                    is_cancelled=lambda: progress.wasCanceled(),
+                    poll=QApplication.processEvents)
+
+            progress = QProgressDialog("Экспорт диаграмм...", "Отмена", 0, count,
+                                       self.main_window)
+            progress.setWindowTitle("Экспорт в PDF")
+            progress.setWindowModality(Qt.WindowModality.WindowModal)
+            progress.setMinimumDuration(500)
+
             painter = QPainter()
             painter.begin(printer)
+            try:
+                for i, image in enumerate(images):
+                    plot_index_on_page = i % plots_per_page
+                    row = plot_index_on_page // 2
+                    col = plot_index_on_page % 2
+
+                    if plot_index_on_page == 0 and i > 0:
+                        printer.newPage()
+
+                    x = margin + col * (plot_width + margin)
+                    y = margin + row * (plot_height + margin)
+                    plot_rect = QRectF(x, y, plot_width, plot_height)
+
+                    if native:
+                        name, resultant, magnitude = calculation.plot_item(i)
+                        paint_vector_diagram(painter, plot_rect, static,
+                                             result_geometry(name, resultant, magnitude))
+                    else:
+                        self._draw_image(painter, plot_rect, image)
+
+                    progress.setValue(i + 1)
+                    if progress.wasCanceled():
+                        raise ExportCancelled()
+            finally:
+                images.close()  # Останавливает пул процессов при отмене и ошибках
+                painter.end()
+                progress.close()
 
-            # Получаем все графики из контейнера
-            vector_plots = []
-            layout = self.main_window.vector_container.layout()
-            for i in range(layout.count()):
-                item = layout.itemAt(i)
-                if item and item.widget():
-                    # VectorPlotView содержит сцену с графиком
-                    plot = item.widget()
-                    vector_plots.append(plot)
-
-            for i, plot in enumerate(vector_plots):
-                plot_index_on_page = i % plots_per_page
-                row = plot_index_on_page // 2
-                col = plot_index_on_page % 2
-
-                if plot_index_on_page == 0 and i > 0:
-                    printer.newPage()
-
-                x = margin + col * (plot_width + margin)
-                y = margin + row * (plot_height + margin)
-                plot_rect = QRectF(x, y, plot_width, plot_height)
-
-                # Сохраняем график во временный файл
-                temp_path = os.path.join(tempfile.gettempdir(), f'plot_{i}.png')
-                # Используем figure из matplotlib canvas
-                plot.canvas.figure.savefig(temp_path, bbox_inches='tight', dpi=300)
-
-                image = QImage(temp_path)
-                scaled_image = image.scaled(
-                    int(plot_width),
-                    int(plot_height),
-                    aspectRatioMode=Qt.AspectRatioMode.KeepAspectRatio
-                )
-
-                # Центрируем изображение
-                x_offset = (plot_width - scaled_image.width()) / 2 if scaled_image.width() < plot_width else 0
-                y_offset = (plot_height - scaled_image.height()) / 2 if scaled_image.height() < plot_height else 0
-
-                draw_rect = QRectF(
-                    plot_rect.x() + x_offset,
-                    plot_rect.y() + y_offset,
-                    scaled_image.width(),
-                    scaled_image.height()
-                )
-
-                painter.drawImage(draw_rect, scaled_image)
-                os.remove(temp_path)
-
-            painter.end()
             return True
 
+        except ExportCancelled:
+            # Незавершенный файл не оставляем
+            os.remove(file_name)
+            profiler.finish(phase, status='cancelled')
+            phase = None
+            return False
         except Exception as e:
+            # Замер записывается до показа сообщения: ожидание пользователя не в счет
+            profiler.finish(phase, status='error')
+            phase = None
             QMessageBox.critical(
                 self.main_window,
                 "Ошибка",
                 f"Ошибка при сохранении PDF: {str(e)}"
             )
             return False
+        finally:
+            profiler.finish(phase)
+
+    def _raster_size(self, printer, width):
+        """Ширина растра в пикселях для ширины на странице в точках принтера"""
+        return max(round(width * AppConfig.PDF_DPI / printer.resolution()), 1)
+
+    def _draw_image(self, painter, plot_rect, image):
+        """
+        Нарисовать RGBA-растр по центру прямоугольника
+
+        Растр уже построен в нужном размере и оборачивается в QImage без
+        копирования; PDF хранит его в исходном разрешении.
+        """
+        qimage = QImage(image.data, image.width, image.height, image.width * 4,
+                        QImage.Format.Format_RGBA8888)
+
+        # Центрируем изображение с сохранением пропорций
+        scale = min(plot_rect.width() / image.width, plot_rect.height() / image.height)
+        width = image.width * scale
+        height = image.height * scale
+        draw_rect = QRectF(
+            plot_rect.x() + (plot_rect.width() - width) / 2,
+            plot_rect.y() + (plot_rect.height() - height) / 2,
+            width,
+            height
+        )
+
+        painter.drawImage(draw_rect, qimage)
+
+    def _report_builder(self, sections):
+        """Построитель отчета по данным последнего расчета"""
+        calculation = self.main_window.calculation
+        analysis = self.main_window.deviation_analysis
+        if calculation is None or not len(calculation):
+            raise ValueError("Нет данных для экспорта")
+        tolerance = analysis.tolerance if analysis is not None else 1.0
+        return ReportBuilder(calculation.dataset(), calculation.azimuth,
+                             calculation.is_clockwise, tolerance,
+                             getattr(self.main_window, 'font_path', None), sections)
+
+    def _write_report(self, file_name, builder):
+        """
+        Записать отчет с индикатором прогресса
+
+        Raises:
+            ExportCancelled: Если пользователь отменил экспорт
+        """
+        progress = QProgressDialog("Построение отчета...", "Отмена", 0,
+                                   builder.page_count(), self.main_window)
+        progress.setWindowTitle("Экспорт в PDF")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+
+        def on_progress(pages):
+            progress.setValue(pages)
+            QApplication.processEvents()
+
+        try:
+            builder.write(file_name, on_progress, progress.wasCanceled)
+        finally:
+            progress.close()
+        return True
+
+    def export_report_to_pdf(self):
+        """Export vector diagrams, deviation plots and summary table to one PDF file"""
+        phase = None
+        try:
+            file_name = self._get_save_filename("report.pdf")
+            if not file_name:
+                return False
+            phase = profiler.start("Экспорт отчета в PDF", EXPORT)
+            return self._write_report(file_name, self._report_builder(ReportBuilder.SECTIONS))
+
+        except ExportCancelled:
+            # Незавершенный файл не оставляем
+            os.remove(file_name)
+            profiler.finish(phase, status='cancelled')
+            phase = None
+            return False
+        except Exception as e:
+            # Замер записывается до показа сообщения: ожидание пользователя не в счет
+            profiler.finish(phase, status='error')
+            phase = None
+            QMessageBox.critical(
+                self.main_window,
+                "Ошибка",
+                f"Ошибка при сохранении PDF: {str(e)}"
+            )
+            return False
+        finally:
+            profiler.finish(phase)
 
     def export_deviations_to_pdf(self):
         """Export deviation plots to PDF file"""
+        phase = None
         try:
+            analysis = self.main_window.deviation_analysis
+            if analysis is None:
+                raise ValueError("Нет данных для экспорта")
+
             file_name = self._get_save_filename("deviations.pdf")
             if not file_name:
                 return False
+            phase = profiler.start("Экспорт отклонений в PDF", EXPORT, mode=AppConfig.PDF_EXPORT_MODE)
+
+            if AppConfig.PDF_EXPORT_MODE == 'vector':
+                return self._write_report(file_name, self._report_builder(('deviations',)))
 
             printer = self._setup_printer(file_name)
 
@@ -144,55 +277,51 @@ class PDFExportHandler:
             plot_width = (page_rect.width() - 4 * margin) / 3
             plot_height = plot_width * 1.5
 
+            # Графики строятся по данным на отдельной figure: живые
+            # виджеты не меняют размер и не перерисовываются
+            font_path = getattr(self.main_window, 'font_path', None)
+            custom_font = get_deviation_font(font_path) if font_path else None
+            figure = Figure(figsize=(8, 12))
+            FigureCanvasAgg(figure)
+            axes = figure.add_subplot(111)
+            size_px = self._raster_size(printer, plot_width)
+
             painter = QPainter()
             painter.begin(printer)
 
-            deviation_plots = []
-            for i in range(self.main_window.deviation_container.layout().count()):
-                plot = self.main_window.deviation_container.layout().itemAt(i).widget()
-                if plot:
-                    deviation_plots.append(plot)
-
-            for i, plot in enumerate(deviation_plots):
-                x = margin + (plot_width + margin) * i
-                y = margin
-                plot_rect = QRectF(x, y, plot_width, plot_height)
-
-                # Сохраняем во временный файл
-                temp_path = os.path.join(tempfile.gettempdir(), f'dev_plot_{i}.png')
-                plot.figure.set_size_inches(8, 12)
-                plot.figure.savefig(temp_path, bbox_inches='tight', dpi=300)
-
-                image = QImage(temp_path)
-                scaled_image = image.scaled(
-                    int(plot_width),
-                    int(plot_height),
-                    aspectRatioMode=Qt.AspectRatioMode.KeepAspectRatio
-                )
-
-                # Центрирование изображения в прямоугольнике
-                x_offset = (plot_width - scaled_image.width()) / 2 if scaled_image.width() < plot_width else 0
-                y_offset = (plot_height - scaled_image.height()) / 2 if scaled_image.height() < plot_height else 0
-
-                draw_rect = QRectF(
-                    plot_rect.x() + x_offset,
-                    plot_rect.y() + y_offset,
-                    scaled_image.width(),
-                    scaled_image.height()
-                )
-
-                painter.drawImage(draw_rect, scaled_image)
-
-                # Удаляем временный файл
-                os.remove(temp_path)
+            # Длинные ряды разбиваются по высоте на страницы
+            for page, window in enumerate(analysis.windows(DEVIATION_POINTS_PER_PAGE)):
+                if page > 0:
+                    printer.newPage()
+
+                for i in range(len(TITLES)):
+                    x = margin + (plot_width + margin) * i
+                    y = margin
+                    plot_rect = QRectF(x, y, plot_width, plot_height)
+
+                    draw_deviation_plot(figure, axes, window, i, custom_font)
+                    # Буфер figure действителен до следующей отрисовки
+                    self._draw_image(painter, plot_rect,
+                                     render_figure(figure, size_px, copy=False))
 
             painter.end()
             return True
 
+        except ExportCancelled:
+            # Незавершенный файл не оставляем
+            os.remove(file_name)
+            profiler.finish(phase, status='cancelled')
+            phase = None
+            return False
         except Exception as e:
+            # Замер записывается до показа сообщения: ожидание пользователя не в счет
+            profiler.finish(phase, status='error')
+            phase = None
             QMessageBox.critical(
                 self.main_window,
                 "Ошибка",
                 f"Ошибка при сохранении PDF: {str(e)}"
             )
-            return False
\ No newline at end of file
+            return False
+        finally:
+            profiler.finish(phase)
@@ -0,0 +1,186 @@
+# src/utils/profiler.py
+"""
+Замер длительности этапов запуска и операций пользователя.
+
+Для каждого этапа фиксируются реальное время и процессорное время
+процесса; записи хранятся в памяти для панели диагностики и пишутся
+в структурированный журнал (JSON Lines).
+"""
+import json
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+# Категории этапов
+STARTUP = 'startup'
+IMPORT = 'import'
+CALCULATE = 'calculate'
+RENDER = 'render'
+EXPORT = 'export'
+HOUSEKEEPING = 'housekeeping'
+
+MAX_RECORDS = 1000  # Записей в памяти; журнал хранит все
+
+
+class PhaseRecord(NamedTuple):
+    """
+    Timing of one phase.
+
+    Attributes:
+        name: Phase name
+        category: Phase category (STARTUP, IMPORT, CALCULATE, RENDER, EXPORT,
+            HOUSEKEEPING)
+        started: Wall clock start time (datetime)
+        wall: Elapsed wall time in seconds
+        cpu: CPU time of the process (all threads) in seconds
+        details: Additional values, e.g. number of rows
+    """
+    name: str
+    category: str
+    started: datetime
+    wall: float
+    cpu: float
+    details: Dict
+
+    def as_dict(self) -> Dict:
+        """Record as a JSON-serializable dict"""
+        return {
+            'time': self.started.isoformat(timespec='milliseconds'),
+            'phase': self.name,
+            'category': self.category,
+            'wall_ms': round(self.wall * 1000, 2),
+            'cpu_ms': round(self.cpu * 1000, 2),
+            **self.details,
+        }
+
+
+class PhaseToken(NamedTuple):
+    """Started phase, passed to PhaseProfiler.finish"""
+    name: str
+    category: str
+    started: datetime
+    wall: float
+    cpu: float
+    details: Dict
+
+
+class PhaseProfiler:
+    """
+    Collects phase timings for the diagnostics panel and the timing log.
+
+    Phases are measured either with the phase() context manager or with
+    start()/finish() when the phase spans several event loop iterations.
+    Methods are meant to be called from the GUI thread.
+    """
+
+    def __init__(self, max_records: int = MAX_RECORDS):
+        self.records = deque(maxlen=max_records)
+        self._logger: Optional[logging.Logger] = None
+        self._listeners: List[Callable[[PhaseRecord], None]] = []
+
+    def start(self, name: str, category: str, **details) -> PhaseToken:
+        """Start timing a phase"""
+        return PhaseToken(name, category, datetime.now(), time.perf_counter(),
+                          time.process_time(), details)
+
+    def finish(self, token: Optional[PhaseToken], **details) -> Optional[PhaseRecord]:
+        """
+        Finish a phase started with start().
+
+        Args:
+            token: Token returned by start(); None is ignored
+            details: Values added to the record
+
+        Returns:
+            PhaseRecord: Recorded timing, None for a None token
+        """
+        if token is None:
+            return None
+        return self.record(token.name, token.category,
+                           time.perf_counter() - token.wall,
+                           time.process_time() - token.cpu,
+                           started=token.started, **{**token.details, **details})
+
+    @contextmanager
+    def phase(self, name: str, category: str, **details):
+        """
+        Time the enclosed block.
+
+        Yields:
+            dict: Details of the record, may be extended inside the block
+        """
+        token = self.start(name, category)
+        try:
+            yield details
+        finally:
+            self.finish(token, **details)
+
+    def record(self, name: str, category: str, wall: float, cpu: float,
+               started: Optional[datetime] = None, **details) -> PhaseRecord:
+        """Add an already measured phase"""
+        record = PhaseRecord(name, category, started or datetime.now(), wall, cpu, details)
+        self.records.append(record)
+        if self._logger is not None:
+            self._logger.info(json.dumps(record.as_dict(), ensure_ascii=False, default=str))
+        for listener in list(self._listeners):
+            listener(record)
+        return record
+
+    def attach_log(self, logger: logging.Logger) -> None:
+        """
+        Write records to a logger as JSON lines.
+
+        Records collected before the call are written first, so startup
+        phases that precede logging setup are not lost.
+        """
+        self._logger = logger
+        for record in self.records:
+            logger.info(json.dumps(record.as_dict(), ensure_ascii=False, default=str))
+
+    @property
+    def log_file(self) -> Optional[str]:
+        """Path of the timing log file, None if records are not logged to a file"""
+        if self._logger is None:
+            return None
+        for handler in self._logger.handlers:
+            if isinstance(handler, logging.FileHandler):
+                return handler.baseFilename
+        return None
+
+    def add_listener(self, listener: Callable[[PhaseRecord], None]) -> None:
+        """Call listener with every new record"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[PhaseRecord], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def summary(self) -> List[Dict]:
+        """
+        Aggregate records by phase name.
+
+        Returns:
+            list: Dicts with name, category, count, wall and cpu totals and
+            the longest wall time, sorted by total wall time
+        """
+        totals = {}
+        for record in self.records:
+            entry = totals.setdefault(record.name, {
+                'name': record.name, 'category': record.category, 'count': 0,
+                'wall': 0.0, 'cpu': 0.0, 'max_wall': 0.0,
+            })
+            entry['count'] += 1
+            entry['wall'] += record.wall
+            entry['cpu'] += record.cpu
+            entry['max_wall'] = max(entry['max_wall'], record.wall)
+        return sorted(totals.values(), key=lambda entry: entry['wall'], reverse=True)
+
+    def clear(self) -> None:
+        self.records.clear()
+
+
+# Общий профилировщик приложения
+profiler = PhaseProfiler()
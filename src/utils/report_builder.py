@@ -0,0 +1,137 @@
+# src/utils/report_builder.py
+"""
+Построение полного PDF-отчета по набору данных без участия виджетов.
+
+Отчет состоит из векторных диаграмм, графиков отклонений по страницам и
+сводной таблицы; страницы пишутся в файл по мере построения.
+"""
+import math
+from typing import Callable, Optional, Sequence
+
+from matplotlib.backends.backend_pdf import PdfPages
+
+from src.controllers.deviation_calculator import DeviationAnalysis
+from src.controllers.survey_calculation import SurveyCalculation
+from src.utils.vector_pdf import (DEVIATION_POINTS_PER_PAGE, DIAGRAM_COLUMNS, DIAGRAM_ROWS,
+                                  SUMMARY_ROWS_PER_PAGE, summary_rows,
+                                  write_deviation_pages, write_summary_table,
+                                  write_vector_diagrams)
+
+
+class ReportBuilder:
+    """
+    Paginated PDF report built from a VectorDataset.
+
+    Sections are written in order through one PdfPages document; every
+    page is saved as soon as it is drawn, so memory does not grow with
+    the number of sections in the survey.
+    """
+
+    SECTIONS = ('vectors', 'deviations', 'summary')
+
+    def __init__(self, dataset, azimuth: float, is_clockwise: bool,
+                 tolerance_mm_per_m: float = 1.0, font_path: Optional[str] = None,
+                 sections: Sequence[str] = SECTIONS):
+        """
+        Args:
+            dataset (VectorDataset): Survey rows, empty rows are skipped
+            azimuth: Azimuth in degrees
+            is_clockwise: Direction of rotation
+            tolerance_mm_per_m: Allowable deviation in mm per meter of height
+            font_path: Path to the report font, default font if None
+            sections: Report sections in output order, from SECTIONS
+        """
+        unknown = set(sections) - set(self.SECTIONS)
+        if unknown:
+            raise ValueError(f"Неизвестные разделы отчета: {', '.join(sorted(unknown))}")
+
+        self.calculation = SurveyCalculation(dataset, azimuth, is_clockwise)
+        if not len(self.calculation):
+            raise ValueError("Нет данных для отчета")
+        self.analysis = DeviationAnalysis(self.calculation.dataset(), tolerance_mm_per_m)
+        self.font_path = font_path
+        self.sections = tuple(sections)
+
+    def page_count(self) -> int:
+        """Number of pages the report will have"""
+        count = len(self.calculation)
+        pages = {
+            'vectors': math.ceil(count / (DIAGRAM_COLUMNS * DIAGRAM_ROWS)),
+            'deviations': self.analysis.window_count(DEVIATION_POINTS_PER_PAGE),
+            'summary': math.ceil(count / SUMMARY_ROWS_PER_PAGE),
+        }
+        return sum(pages[section] for section in self.sections)
+
+    def summary_header(self):
+        """Lines above the summary table"""
+        calculation = self.calculation
+        direction = "по часовой" if calculation.is_clockwise else "против часовой"
+        lines = [
+            f"Сечений: {len(calculation)}",
+            f"Азимут: {calculation.azimuth:g}°, направление {direction}",
+            f"Допуск: {self.analysis.tolerance:g} мм/м",
+        ]
+        for column in range(3):
+            check = self.analysis.check(column)
+            lines.append(f"ОП{column + 1}: вне допуска {check.exceed_count}, "
+                         f"наибольшее превышение {check.max_excess:.1f} мм")
+        return lines
+
+    def write(self, file_name: str,
+              progress: Optional[Callable[[int], None]] = None,
+              is_cancelled: Optional[Callable[[], bool]] = None) -> int:
+        """
+        Write the report to a PDF file.
+
+        Args:
+            file_name: Output path
+            progress: Callback receiving the number of pages written
+            is_cancelled: Callback polled after each page
+
+        Returns:
+            int: Number of pages written
+
+        Raises:
+            ExportCancelled: If is_cancelled returned True; the file is
+                left incomplete
+        """
+        with PdfPages(file_name) as pdf:
+            return self.write_pages(pdf, progress, is_cancelled)
+
+    def write_pages(self, pdf: PdfPages,
+                    progress: Optional[Callable[[int], None]] = None,
+                    is_cancelled: Optional[Callable[[], bool]] = None) -> int:
+        """
+        Write the report sections to an open PdfPages document.
+
+        Returns:
+            int: Number of pages written
+        """
+        written = 0
+
+        def on_pages(pages):
+            if progress:
+                progress(written + pages)
+
+        for section in self.sections:
+            if section == 'vectors':
+                per_page = DIAGRAM_COLUMNS * DIAGRAM_ROWS
+                calculation = self.calculation
+                written += write_vector_diagrams(
+                    pdf,
+                    zip(calculation.names, calculation.rotated_resultants,
+                        calculation.magnitudes),
+                    calculation.azimuth, calculation.is_clockwise, self.font_path,
+                    progress=lambda done: on_pages(math.ceil(done / per_page)),
+                    is_cancelled=is_cancelled)
+            elif section == 'deviations':
+                written += write_deviation_pages(pdf, self.analysis, self.font_path,
+                                                 progress=on_pages,
+                                                 is_cancelled=is_cancelled)
+            elif section == 'summary':
+                rows = summary_rows(self.calculation.names, self.calculation.magnitudes,
+                                    self.analysis)
+                written += write_summary_table(pdf, rows, self.summary_header(),
+                                               self.font_path, progress=on_pages,
+                                               is_cancelled=is_cancelled)
+        return written
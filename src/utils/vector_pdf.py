@@ -0,0 +1,278 @@
+# src/utils/vector_pdf.py
+"""
+Экспорт диаграмм в PDF векторной графикой (matplotlib PdfPages).
+
+Страницы строятся по данным, без виджетов и без растеризации; каждая
+страница записывается в файл сразу после построения.
+"""
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+from src.utils.diagram_export import ExportCancelled
+from src.views.deviation_figure import draw_deviation_plot, get_deviation_font
+from src.views.diagram_figure import draw_vector_diagram, get_plot_fonts
+
+A4_PORTRAIT = (8.27, 11.69)  # Размер страницы в дюймах
+PAGE_MARGIN = 0.4  # Поля и промежутки между диаграммами, дюймы
+
+DIAGRAM_COLUMNS = 2
+DIAGRAM_ROWS = 3
+DIAGRAM_FIGURE_SIZE = 6.0  # Размер figure живой диаграммы, для масштаба шрифтов
+
+DEVIATION_FONT_SIZE = 9
+DEVIATION_POINTS_PER_PAGE = 60  # Точек ряда на странице графиков отклонений
+
+SUMMARY_FONT_SIZE = 8
+SUMMARY_ROWS_PER_PAGE = 45
+SUMMARY_COLUMNS = ("Сечение", "ОП1, мм", "ОП2, мм", "ОП3, мм", "Вектор, мм",
+                   "Допуск, мм", "Вне допуска")
+
+
+def diagram_cells(page_size=A4_PORTRAIT, margin=PAGE_MARGIN,
+                  columns=DIAGRAM_COLUMNS, rows=DIAGRAM_ROWS):
+    """
+    Квадратные ячейки диаграмм на странице в долях страницы
+
+    Returns:
+        tuple: (список [left, bottom, width, height], размер ячейки в дюймах)
+    """
+    width, height = page_size
+    cell = min((width - (columns + 1) * margin) / columns,
+               (height - (rows + 1) * margin) / rows)
+
+    cells = []
+    for row in range(rows):
+        for col in range(columns):
+            left = margin + col * (cell + margin)
+            top = margin + row * (cell + margin)
+            cells.append([left / width, 1 - (top + cell) / height,
+                          cell / width, cell / height])
+    return cells, cell
+
+
+def write_vector_diagrams(pdf: PdfPages,
+                          items: Iterable,
+                          azimuth: float,
+                          is_clockwise: bool,
+                          font_path: Optional[str] = None,
+                          progress: Optional[Callable[[int], None]] = None,
+                          is_cancelled: Optional[Callable[[], bool]] = None) -> int:
+    """
+    Write vector diagram pages, six diagrams per A4 page.
+
+    Args:
+        pdf: Open PdfPages document
+        items: (name, rotated resultant, magnitude) tuples
+        azimuth: Azimuth in degrees
+        is_clockwise: Direction of rotation
+        font_path: Path to the diagram font
+        progress: Callback receiving the number of diagrams written
+        is_cancelled: Callback polled after each page
+
+    Returns:
+        int: Number of pages written
+
+    Raises:
+        ExportCancelled: If is_cancelled returned True
+    """
+    cells, cell_size = diagram_cells()
+    custom_font = result_font = None
+    if font_path:
+        custom_font, result_font = get_plot_fonts(font_path,
+                                                  cell_size / DIAGRAM_FIGURE_SIZE)
+
+    figure = Figure(figsize=A4_PORTRAIT)
+    pages = 0
+    done = 0
+    page_axes = []
+    for name, resultant, magnitude in items:
+        if not page_axes:
+            figure.clear()
+            page_axes = [figure.add_axes(rect) for rect in cells]
+            page_axes.reverse()
+
+        axes = page_axes.pop()
+        draw_vector_diagram(figure, axes, name, resultant, magnitude, azimuth,
+                            is_clockwise, custom_font, result_font,
+                            tight_layout=False)
+        done += 1
+
+        if not page_axes:
+            pages += _save_page(pdf, figure, progress, done, is_cancelled)
+
+    if page_axes:
+        for axes in page_axes:
+            axes.remove()  # Пустые ячейки последней страницы
+        pages += _save_page(pdf, figure, progress, done, is_cancelled)
+    return pages
+
+
+def write_deviation_plots(pdf: PdfPages, analysis, font_path: Optional[str] = None,
+                          title: Optional[str] = None, bottom: float = 0.35) -> int:
+    """
+    Write the three OP deviation plots side by side on one A4 page.
+
+    Args:
+        pdf: Open PdfPages document
+        analysis (DeviationAnalysis): Heights, deviations and tolerance checks
+        font_path: Path to the plot font
+        title: Page title above the plots
+        bottom: Lower edge of the plots as a fraction of the page height
+
+    Returns:
+        int: Number of pages written
+    """
+    custom_font = get_deviation_font(font_path, DEVIATION_FONT_SIZE) if font_path else None
+
+    figure = Figure(figsize=A4_PORTRAIT)
+    grid = figure.add_gridspec(1, 3, left=0.08, right=0.98, top=0.92, bottom=bottom,
+                               wspace=0.45)
+    for column in range(3):
+        axes = figure.add_subplot(grid[0, column])
+        draw_deviation_plot(figure, axes, analysis, column, custom_font,
+                            tight_layout=False)
+    if title:
+        figure.suptitle(title, fontproperties=custom_font)
+    pdf.savefig(figure)
+    return 1
+
+
+def write_deviation_pages(pdf: PdfPages,
+                          analysis,
+                          font_path: Optional[str] = None,
+                          points_per_page: int = DEVIATION_POINTS_PER_PAGE,
+                          progress: Optional[Callable[[int], None]] = None,
+                          is_cancelled: Optional[Callable[[], bool]] = None) -> int:
+    """
+    Write deviation plots split by height, one height window per page.
+
+    Args:
+        pdf: Open PdfPages document
+        analysis (DeviationAnalysis): Full deviation series
+        font_path: Path to the plot font
+        points_per_page: Series points per page
+        progress: Callback receiving the number of pages written
+        is_cancelled: Callback polled after each page
+
+    Returns:
+        int: Number of pages written
+
+    Raises:
+        ExportCancelled: If is_cancelled returned True
+    """
+    if analysis.window_count(points_per_page) == 1:
+        pages = write_deviation_plots(pdf, analysis, font_path)
+        return _report_page(progress, pages, is_cancelled)
+
+    # Страница на окно высот: графики занимают всю высоту листа
+    pages = 0
+    for window in analysis.windows(points_per_page):
+        title = f"Отметки {window.min_height:g} - {window.max_height:g} м"
+        pages += write_deviation_plots(pdf, window, font_path, title, bottom=0.06)
+        _report_page(progress, pages, is_cancelled)
+    return pages
+
+
+def summary_rows(names, magnitudes, analysis):
+    """
+    Rows of the summary table, one per plotted section.
+
+    Args:
+        names: Section names
+        magnitudes: Resultant magnitudes in mm
+        analysis (DeviationAnalysis): Deviations and tolerance checks;
+            row i of the table is point i + 1 of the series
+
+    Returns:
+        list: Rows of formatted cells, columns as in SUMMARY_COLUMNS
+    """
+    deviations = analysis.deviations[1:]
+    limits = analysis.check(0).limits[1:]
+    exceeded = np.column_stack([analysis.check(column).mask[1:] for column in range(3)])
+
+    rows = []
+    for name, lengths, magnitude, limit, flags in zip(names, deviations, magnitudes,
+                                                      limits, exceeded):
+        rows.append([str(name), *(f"{value:.1f}" for value in lengths),
+                     f"{magnitude:.1f}", f"{limit:.1f}",
+                     ", ".join(f"ОП{column + 1}" for column in np.flatnonzero(flags))])
+    return rows
+
+
+def write_summary_table(pdf: PdfPages,
+                        rows,
+                        header: Iterable[str] = (),
+                        font_path: Optional[str] = None,
+                        rows_per_page: int = SUMMARY_ROWS_PER_PAGE,
+                        progress: Optional[Callable[[int], None]] = None,
+                        is_cancelled: Optional[Callable[[], bool]] = None) -> int:
+    """
+    Write the numeric summary as a table split across A4 pages.
+
+    Args:
+        pdf: Open PdfPages document
+        rows: Table rows, columns as in SUMMARY_COLUMNS
+        header: Lines printed above the table on the first page
+        font_path: Path to the table font
+        rows_per_page: Table rows per page
+        progress: Callback receiving the number of pages written
+        is_cancelled: Callback polled after each page
+
+    Returns:
+        int: Number of pages written
+
+    Raises:
+        ExportCancelled: If is_cancelled returned True
+    """
+    custom_font = get_deviation_font(font_path, SUMMARY_FONT_SIZE) if font_path else None
+    header = list(header)
+
+    figure = Figure(figsize=A4_PORTRAIT)
+    pages = 0
+    for start in range(0, max(len(rows), 1), rows_per_page):
+        figure.clear()
+        top = 1 - PAGE_MARGIN / A4_PORTRAIT[1]
+        if header and start == 0:
+            figure.text(PAGE_MARGIN / A4_PORTRAIT[0], top, "\n".join(header),
+                        verticalalignment='top', fontproperties=custom_font)
+            top -= (len(header) + 1) * 0.014
+
+        page_rows = rows[start:start + rows_per_page]
+        axes = figure.add_axes([PAGE_MARGIN / A4_PORTRAIT[0], 0,
+                                1 - 2 * PAGE_MARGIN / A4_PORTRAIT[0], top])
+        axes.axis('off')
+        if page_rows:
+            table = axes.table(cellText=page_rows, colLabels=SUMMARY_COLUMNS,
+                               loc='upper center', cellLoc='center')
+            table.auto_set_font_size(False)
+            for cell in table.get_celld().values():
+                cell.set_height(1 / (rows_per_page + 2))
+                if custom_font:
+                    cell.get_text().set_fontproperties(custom_font)
+                else:
+                    cell.get_text().set_fontsize(SUMMARY_FONT_SIZE)
+
+        pdf.savefig(figure)
+        pages += 1
+        _report_page(progress, pages, is_cancelled)
+    return pages
+
+
+def _report_page(progress, pages, is_cancelled):
+    if progress:
+        progress(pages)
+    if is_cancelled and is_cancelled():
+        raise ExportCancelled()
+    return pages
+
+
+def _save_page(pdf, figure, progress, done, is_cancelled):
+    pdf.savefig(figure)
+    if progress:
+        progress(done)
+    if is_cancelled and is_cancelled():
+        raise ExportCancelled()
+    return 1
@@ -1,8 +1,12 @@
 from PyQt6.QtWidgets import QWidget
-import numpy as np
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 from matplotlib.figure import Figure
-from matplotlib.font_manager import FontProperties
+from src.controllers.deviation_calculator import DeviationAnalysis
+from src.models.vector_data import VectorDataset
+from src.views.deviation_figure import (get_deviation_font, draw_deviation_plot,
+                                        update_deviation_series,
+                                        update_deviation_tolerance,
+                                        refresh_deviation_plot)
 
 
 class VerticalDeviationPlot(FigureCanvasQTAgg):
@@ -11,6 +15,9 @@ class VerticalDeviationPlot(FigureCanvasQTAgg):
         self.axes = self.fig.add_subplot(111)
         super().__init__(self.fig)
         self.setParent(parent)
+        self.tolerance_check = None  # ToleranceCheck последнего построения
+        self._artists = None  # Артисты для обновления на месте
+        self._reference_point = None
         self.setup_font()
 
     def setup_font(self):
@@ -22,8 +29,7 @@ class VerticalDeviationPlot(FigureCanvasQTAgg):
                 main_window = main_window.parent()
 
             if main_window and hasattr(main_window, 'font_path'):
-                self.custom_font = FontProperties(fname=main_window.font_path)
-                self.custom_font.set_size(14)  # Размер шрифта для графиков
+                self.custom_font = get_deviation_font(main_window.font_path)
             else:
                 self.custom_font = None
         except Exception as e:
@@ -35,113 +41,87 @@ class VerticalDeviationPlot(FigureCanvasQTAgg):
         Plot vertical deviations for specific reference point (ОП)
 
         Args:
-            data_list (list): List of VectorData objects
+            data_list (VectorDataset | list): Dataset or list of VectorData objects
             reference_point (int): Index of reference point (0 for ОП1, 1 for ОП2, 2 for ОП3)
             tolerance_mm_per_m (float): Allowable deviation in mm per meter of height
         """
         try:
-            self.axes.clear()
+            dataset = data_list
+            if not isinstance(dataset, VectorDataset):
+                dataset = VectorDataset.from_vector_data(data_list)
+            self.plot_analysis(DeviationAnalysis(dataset, tolerance_mm_per_m),
+                               reference_point)
+        except Exception as e:
+            print(f"Error plotting deviations: {str(e)}")
 
-            # Extract heights and deviations
-            heights = [float(data.name) if data.name else 0 for data in data_list]
-            if reference_point == 0:
-                deviations = [data.length1 for data in data_list]
-                title = "Отклонения ОП1"
-            elif reference_point == 1:
-                deviations = [data.length2 for data in data_list]
-                title = "Отклонения ОП2"
-            else:
-                deviations = [data.length3 for data in data_list]
-                title = "Отклонения ОП3"
-
-            # Добавляем начальную точку (0,0)
-            heights.insert(0, 0)
-            deviations.insert(0, 0)
-
-            # Calculate tolerance lines
-            min_height = 0  # Начинаем с нуля
-            max_height = max(heights)
-            height_range = np.array([min_height, max_height])
-            tolerance_lines = height_range * tolerance_mm_per_m
-
-            # Plot tolerance lines
-            self.axes.plot(tolerance_lines, height_range, 'r--', alpha=0.5,
-                           label='Допустимое отклонение')
-            self.axes.plot(-tolerance_lines, height_range, 'r--', alpha=0.5)
-
-            # Fill tolerance area
-            self.axes.fill_betweenx(height_range, -tolerance_lines, tolerance_lines,
-                                    color='red', alpha=0.1)
-
-            # Plot vertical line at x=0 (vertical axis)
-            self.axes.axvline(x=0, color='black', linestyle='-', linewidth=0.5)
-
-            # Plot deviations
-            self.axes.scatter(deviations, heights, color='blue', zorder=3)
-            self.axes.plot(deviations, heights, color='blue', linestyle='-', zorder=2,
-                           label='Отклонения')
-
-            # Highlight points outside tolerance
-            for height, deviation in zip(heights, deviations):
-                tolerance = height * tolerance_mm_per_m
-                if abs(deviation) > tolerance:
-                    self.axes.scatter(deviation, height, color='red', s=100,
-                                      zorder=4, alpha=0.5)
-                    # Добавляем подпись для точек вне допуска
-                    if self.custom_font:
-                        self.axes.annotate(
-                            f'{deviation:.1f}',
-                            (deviation, height),
-                            xytext=(5, 5),
-                            textcoords='offset points',
-                            fontproperties=self.custom_font,
-                            color='red'
-                        )
-
-            # Применяем кастомный шрифт к элементам графика
-            if self.custom_font:
-                # Заголовок
-                self.axes.set_title(f"{title}\n(допуск {tolerance_mm_per_m} мм/м)",
-                                    fontproperties=self.custom_font,
-                                    pad=20)
+    def plot_analysis(self, analysis, reference_point):
+        """
+        Plot vertical deviations from a shared analysis pass
+
+        The figure is built once; later calls for the same reference point
+        update the existing artists in place.
+
+        Args:
+            analysis (DeviationAnalysis): Heights, deviations and tolerance checks
+            reference_point (int): Index of reference point (0 for ОП1, 1 for ОП2, 2 for ОП3)
+        """
+        try:
+            if self._artists is None or reference_point != self._reference_point:
+                self._build(analysis, reference_point)
+                return
 
-                # Подписи осей
-                self.axes.set_xlabel('Отклонение (мм)',
-                                     fontproperties=self.custom_font,
-                                     labelpad=10)
-                self.axes.set_ylabel('Высота (м)',
-                                     fontproperties=self.custom_font,
-                                     labelpad=10)
+            self._update_series(analysis)
+            self._update_tolerance(analysis)
+            self._refresh()
 
-                # Легенда
-                legend = self.axes.legend(prop=self.custom_font)
+        except Exception as e:
+            print(f"Error plotting deviations: {str(e)}")
 
-                # Значения на осях
-                for label in self.axes.get_xticklabels() + self.axes.get_yticklabels():
-                    label.set_fontproperties(self.custom_font)
+    def update_tolerance(self, analysis):
+        """
+        Update only the tolerance envelope, highlighting and labels
 
-            # Настройка сетки
-            self.axes.grid(True, linestyle='--', alpha=0.3)
+        Args:
+            analysis (DeviationAnalysis): Analysis after set_tolerance
+        """
+        try:
+            if self._artists is None:
+                return
+            self._update_tolerance(analysis)
+            self._refresh()
+        except Exception as e:
+            print(f"Error updating tolerance: {str(e)}")
 
-            # Добавляем отступы вокруг графика
-            self.axes.margins(x=0.1, y=0.1)
+    def _build(self, analysis, reference_point):
+        """Построить график заново и сохранить артисты для обновлений на месте"""
+        self._reference_point = reference_point
+        self.tolerance_check = analysis.check(reference_point)
+        self._artists = draw_deviation_plot(self.fig, self.axes, analysis,
+                                            reference_point, self.custom_font)
 
-            # Устанавливаем соотношение сторон
-            self.axes.set_aspect('auto')
+        # Обновляем холст
+        self.draw()
 
-            # Настраиваем плотную компоновку
-            self.fig.tight_layout()
+    def _update_series(self, analysis):
+        """Обновить точки и линию отклонений"""
+        update_deviation_series(self._artists, analysis, self._reference_point)
 
-            # Обновляем холст
-            self.draw()
+    def _update_tolerance(self, analysis):
+        """Обновить границы допуска, заливку, подсветку и заголовок"""
+        self.tolerance_check = analysis.check(self._reference_point)
+        update_deviation_tolerance(self._artists, analysis, self._reference_point)
 
-        except Exception as e:
-            print(f"Error plotting deviations: {str(e)}")
+    def _refresh(self):
+        """Пересчитать пределы осей, обновить подписи и перерисовать холст"""
+        refresh_deviation_plot(self.axes, self._artists, self.tolerance_check,
+                               self.custom_font)
+        self.draw_idle()
 
     def clear_plot(self):
         """Clear the plot"""
         try:
             self.axes.clear()
+            self._artists = None
             self.draw()
         except Exception as e:
             print(f"Error clearing plot: {str(e)}")
@@ -169,6 +149,8 @@ class VerticalDeviationPlot(FigureCanvasQTAgg):
         """
         try:
             if self.custom_font:
+                # Шрифт общий для всех графиков - меняем только свою копию
+                self.custom_font = self.custom_font.copy()
                 self.custom_font.set_size(size)
                 # Перерисовываем график с новым размером шрифта
                 self.draw()
@@ -0,0 +1,202 @@
+# src/views/deviation_figure.py
+"""
+Отрисовка графика вертикальных отклонений средствами matplotlib без Qt.
+
+Используется виджетом VerticalDeviationPlot и экспортом в PDF.
+"""
+from functools import lru_cache
+
+import numpy as np
+from matplotlib.font_manager import FontProperties
+
+TITLES = ("Отклонения ОП1", "Отклонения ОП2", "Отклонения ОП3")
+LABEL_CELL = (3.0, 1.5)  # Ячейка отбора подписей в размерах шрифта (ширина, высота)
+
+
+@lru_cache(maxsize=None)
+def get_deviation_font(font_path, size=14):
+    """Шрифт графиков отклонений, общий для всех графиков"""
+    custom_font = FontProperties(fname=font_path)
+    custom_font.set_size(size)  # Размер шрифта для графиков
+    return custom_font
+
+
+def draw_deviation_plot(figure, axes, analysis, reference_point, custom_font=None,
+                        tight_layout=True):
+    """
+    Draw vertical deviations of one reference point (ОП)
+
+    Args:
+        figure (Figure): Figure that owns the axes
+        axes (Axes): Target axes, cleared before drawing
+        analysis (DeviationAnalysis): Heights, deviations and tolerance checks
+        reference_point (int): Index of reference point (0 for ОП1, 1 for ОП2, 2 for ОП3)
+        custom_font (FontProperties): Font for titles, labels and ticks
+        tight_layout (bool): Apply figure.tight_layout (off when the caller
+            lays out several axes itself)
+
+    Returns:
+        dict: Artists for in-place updates
+    """
+    axes.clear()
+
+    heights = analysis.heights
+    deviations = analysis.series(reference_point)
+    check = analysis.check(reference_point)
+
+    height_range = analysis.height_range
+    tolerance_lines = analysis.envelope
+
+    # Plot tolerance lines
+    upper, = axes.plot(tolerance_lines, height_range, 'r--', alpha=0.5,
+                       label='Допустимое отклонение')
+    lower, = axes.plot(-tolerance_lines, height_range, 'r--', alpha=0.5)
+
+    # Fill tolerance area
+    fill = axes.fill_betweenx(height_range, -tolerance_lines, tolerance_lines,
+                              color='red', alpha=0.1)
+
+    # Plot vertical line at x=0 (vertical axis)
+    axes.axvline(x=0, color='black', linestyle='-', linewidth=0.5)
+
+    # Plot deviations
+    points = axes.scatter(deviations, heights, color='blue', zorder=3)
+    line, = axes.plot(deviations, heights, color='blue', linestyle='-', zorder=2,
+                      label='Отклонения')
+
+    # Highlight points outside tolerance одной коллекцией
+    mask = check.mask
+    highlight = axes.scatter(deviations[mask], heights[mask], color='red', s=100,
+                             zorder=4, alpha=0.5)
+
+    # Применяем кастомный шрифт к элементам графика
+    title = None
+    if custom_font:
+        # Заголовок
+        title = axes.set_title(title_text(analysis, reference_point),
+                               fontproperties=custom_font,
+                               pad=20)
+
+        # Подписи осей
+        axes.set_xlabel('Отклонение (мм)',
+                        fontproperties=custom_font,
+                        labelpad=10)
+        axes.set_ylabel('Высота (м)',
+                        fontproperties=custom_font,
+                        labelpad=10)
+
+        # Легенда
+        axes.legend(prop=custom_font)
+
+        # Значения на осях
+        for label in axes.get_xticklabels() + axes.get_yticklabels():
+            label.set_fontproperties(custom_font)
+
+    # Настройка сетки
+    axes.grid(True, linestyle='--', alpha=0.3)
+
+    # Добавляем отступы вокруг графика
+    axes.margins(x=0.1, y=0.1)
+
+    # Устанавливаем соотношение сторон
+    axes.set_aspect('auto')
+
+    # Настраиваем плотную компоновку
+    if tight_layout:
+        figure.tight_layout()
+
+    artists = {
+        'upper': upper, 'lower': lower, 'fill': fill, 'points': points,
+        'line': line, 'highlight': highlight, 'title': title, 'labels': [],
+    }
+
+    # Подписи точек вне допуска (после компоновки, так как
+    # перекрытия определяются в экранных координатах)
+    if custom_font:
+        artists['labels'] = label_exceedances(axes, check, custom_font)
+    return artists
+
+
+def update_deviation_series(artists, analysis, reference_point):
+    """Обновить точки и линию отклонений"""
+    heights = analysis.heights
+    deviations = analysis.series(reference_point)
+    artists['points'].set_offsets(np.column_stack([deviations, heights]))
+    artists['line'].set_data(deviations, heights)
+
+
+def update_deviation_tolerance(artists, analysis, reference_point):
+    """Обновить границы допуска, заливку, подсветку и заголовок"""
+    check = analysis.check(reference_point)
+    height_range = analysis.height_range
+    envelope = analysis.envelope
+
+    artists['upper'].set_data(envelope, height_range)
+    artists['lower'].set_data(-envelope, height_range)
+    artists['fill'].set_verts([np.column_stack([
+        [-envelope[0], -envelope[1], envelope[1], envelope[0]],
+        [height_range[0], height_range[1], height_range[1], height_range[0]],
+    ])])
+
+    mask = check.mask
+    artists['highlight'].set_offsets(
+        np.column_stack([check.deviations[mask], check.heights[mask]]))
+
+    if artists['title'] is not None:
+        artists['title'].set_text(title_text(analysis, reference_point))
+
+
+def refresh_deviation_plot(axes, artists, check, custom_font=None):
+    """Пересчитать пределы осей и заново расставить подписи точек вне допуска"""
+    axes.relim()
+    axes.autoscale_view()
+
+    for label in artists['labels']:
+        label.remove()
+    artists['labels'] = []
+    if custom_font:
+        artists['labels'] = label_exceedances(axes, check, custom_font)
+
+
+def title_text(analysis, reference_point):
+    return (f"{TITLES[reference_point]}\n"
+            f"(допуск {analysis.tolerance} мм/м)")
+
+
+def label_exceedances(axes, check, custom_font):
+    """
+    Подписать точки вне допуска, отбросив перекрывающиеся подписи
+
+    Экранная плоскость делится на ячейки размером с подпись; в каждой
+    ячейке подписывается только точка с наибольшим превышением допуска.
+
+    Returns:
+        list: Созданные подписи
+    """
+    indices = np.flatnonzero(check.mask)
+    if not len(indices):
+        return []
+
+    # Сначала точки с наибольшим превышением
+    excess = np.abs(check.deviations[indices]) - check.limits[indices]
+    indices = indices[np.argsort(-excess, kind='stable')]
+
+    points = np.column_stack([check.deviations[indices], check.heights[indices]])
+    display = axes.transData.transform(points)
+
+    size = custom_font.get_size_in_points() * axes.figure.dpi / 72
+    cells = np.floor(display / (size * np.asarray(LABEL_CELL))).astype(np.int64)
+    _, first = np.unique(cells, axis=0, return_index=True)
+
+    labels = []
+    for index in indices[np.sort(first)]:
+        deviation = check.deviations[index]
+        labels.append(axes.annotate(
+            f'{deviation:.1f}',
+            (deviation, check.heights[index]),
+            xytext=(5, 5),
+            textcoords='offset points',
+            fontproperties=custom_font,
+            color='red'
+        ))
+    return labels
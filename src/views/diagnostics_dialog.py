@@ -0,0 +1,136 @@
+# src/views/diagnostics_dialog.py
+import json
+
+from PyQt6.QtWidgets import (QApplication, QDialog, QHBoxLayout, QHeaderView, QLabel,
+                             QTabWidget, QTableWidget, QTableWidgetItem, QVBoxLayout)
+from PyQt6.QtCore import Qt
+
+from src.components.styled_widgets import StyledButton
+from src.utils.profiler import profiler
+
+CATEGORY_NAMES = {
+    'startup': "Запуск",
+    'import': "Импорт",
+    'calculate': "Расчет",
+    'render': "Отрисовка",
+    'export': "Экспорт",
+    'housekeeping': "Обслуживание",
+}
+
+
+class DiagnosticsDialog(QDialog):
+    """
+    Панель диагностики: время этапов запуска и операций пользователя
+
+    Показывает сводку по этапам и журнал замеров; пока панель открыта,
+    новые замеры добавляются сразу.
+    """
+
+    SUMMARY_HEADERS = ("Этап", "Категория", "Раз", "Всего, мс", "CPU, мс", "Макс., мс")
+    RECORD_HEADERS = ("Время", "Этап", "Категория", "Длительность, мс", "CPU, мс", "Детали")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Диагностика производительности")
+        self.resize(800, 500)
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Настройка интерфейса"""
+        layout = QVBoxLayout(self)
+
+        self.tabs = QTabWidget()
+        self.summary_table = self._create_table(self.SUMMARY_HEADERS)
+        self.records_table = self._create_table(self.RECORD_HEADERS)
+        self.tabs.addTab(self.summary_table, "Сводка")
+        self.tabs.addTab(self.records_table, "Журнал")
+        layout.addWidget(self.tabs)
+
+        log_file = profiler.log_file
+        self.log_label = QLabel(f"Журнал замеров: {log_file}" if log_file
+                                else "Журнал замеров не ведется")
+        self.log_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.log_label.setStyleSheet("color: #666666;")
+        layout.addWidget(self.log_label)
+
+        buttons = QHBoxLayout()
+        self.copy_btn = StyledButton("Копировать")
+        self.copy_btn.clicked.connect(self.copy_records)
+        self.clear_btn = StyledButton("Очистить")
+        self.clear_btn.clicked.connect(self.clear_records)
+        self.close_btn = StyledButton("Закрыть")
+        self.close_btn.clicked.connect(self.close)
+
+        buttons.addWidget(self.copy_btn)
+        buttons.addWidget(self.clear_btn)
+        buttons.addStretch()
+        buttons.addWidget(self.close_btn)
+        layout.addLayout(buttons)
+
+    def _create_table(self, headers):
+        table = QTableWidget(0, len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        table.horizontalHeader().setStretchLastSection(True)
+        return table
+
+    def refresh(self):
+        """Заполнить таблицы по текущим замерам"""
+        summary = profiler.summary()
+        self.summary_table.setRowCount(len(summary))
+        for row, entry in enumerate(summary):
+            self._set_row(self.summary_table, row, (
+                entry['name'],
+                CATEGORY_NAMES.get(entry['category'], entry['category']),
+                entry['count'],
+                entry['wall'] * 1000,
+                entry['cpu'] * 1000,
+                entry['max_wall'] * 1000,
+            ))
+
+        # Последние замеры сверху
+        records = list(reversed(profiler.records))
+        self.records_table.setRowCount(len(records))
+        for row, record in enumerate(records):
+            self._set_row(self.records_table, row, (
+                record.started.strftime('%H:%M:%S.%f')[:-3],
+                record.name,
+                CATEGORY_NAMES.get(record.category, record.category),
+                record.wall * 1000,
+                record.cpu * 1000,
+                ", ".join(f"{key}={value}" for key, value in record.details.items()),
+            ))
+
+    def _set_row(self, table, row, values):
+        for column, value in enumerate(values):
+            if isinstance(value, float):
+                item = QTableWidgetItem(f"{value:.1f}")
+                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            else:
+                item = QTableWidgetItem(str(value))
+            table.setItem(row, column, item)
+
+    def copy_records(self):
+        """Скопировать замеры в буфер обмена (JSON, по записи в строке)"""
+        QApplication.clipboard().setText("\n".join(
+            json.dumps(record.as_dict(), ensure_ascii=False, default=str)
+            for record in profiler.records))
+
+    def clear_records(self):
+        """Очистить замеры в памяти (журнал на диске сохраняется)"""
+        profiler.clear()
+        self.refresh()
+
+    def _on_record(self, record):
+        self.refresh()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        profiler.add_listener(self._on_record)
+
+    def hideEvent(self, event):
+        profiler.remove_listener(self._on_record)
+        super().hideEvent(event)
@@ -0,0 +1,146 @@
+# src/views/diagram_figure.py
+"""
+Отрисовка векторной диаграммы средствами matplotlib без зависимостей от Qt.
+
+Используется живыми VectorPlotView и экспортом, в том числе в отдельных
+процессах.
+"""
+from functools import lru_cache
+
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
+from matplotlib.patches import Polygon
+
+from src.views.diagram_geometry import static_geometry, result_geometry
+
+
+@lru_cache(maxsize=None)
+def get_plot_fonts(font_path, scale=1.0):
+    """
+    Шрифты диаграмм, общие для всех VectorPlotView
+
+    Args:
+        font_path (str): Путь к файлу шрифта
+        scale (float): Масштаб относительно диаграммы 6x6 дюймов
+
+    Returns:
+        tuple: (основной шрифт, шрифт результирующего вектора)
+    """
+    # Основной шрифт для обычного текста
+    custom_font = FontProperties(fname=font_path)
+    custom_font.set_size(12 * scale)  # Уменьшили базовый размер шрифта
+
+    # Шрифт для результирующего вектора
+    result_font = FontProperties(fname=font_path)
+    result_font.set_size(14 * scale)  # Уменьшили размер шрифта результата
+    result_font.set_weight('bold')
+    return custom_font, result_font
+
+
+def create_diagram_figure():
+    """
+    Создать figure и axes диаграммы с теми же размерами, что у VectorPlotView
+
+    Returns:
+        tuple: (Figure, Axes)
+    """
+    # Уменьшаем размер figure
+    figure = Figure(figsize=(6, 6), dpi=100)
+    # Минимальные отступы
+    figure.subplots_adjust(left=0.05, right=0.95, top=0.95, bottom=0.05)
+    axes = figure.add_subplot(111)
+    return figure, axes
+
+
+def draw_vector_diagram(figure, axes, name, resultant, magnitude, azimuth,
+                        is_clockwise, custom_font=None, result_font=None,
+                        tight_layout=True):
+    """
+    Draw a vector diagram on matplotlib axes
+
+    Args:
+        figure (Figure): Figure that owns the axes
+        axes (Axes): Target axes, cleared before drawing
+        name (str): Section name
+        resultant (NDArray): Resultant vector already rotated by azimuth
+        magnitude (float): Resultant magnitude in mm
+        azimuth (float): Azimuth in degrees
+        is_clockwise (bool): Direction of rotation
+        custom_font (FontProperties): Font for OP labels
+        result_font (FontProperties): Font for the resultant label
+        tight_layout (bool): Apply figure.tight_layout (off when the caller
+            lays out several diagrams on one figure)
+    """
+    axes.clear()
+
+    draw_static_layer(axes, static_geometry(azimuth, is_clockwise), custom_font)
+    draw_resultant(axes, result_geometry(name, resultant, magnitude), result_font)
+    set_plot_properties(figure, axes, tight_layout)
+
+
+def draw_static_layer(axes, static, custom_font=None):
+    """Draw the triangle and perpendiculars that depend only on azimuth and direction"""
+    axes.add_patch(Polygon(static.triangle, fill=False, color='black', linewidth=1.0))
+    _draw_perpendiculars(axes, static, custom_font)
+
+
+def _draw_perpendiculars(axes, static, custom_font=None):
+    """Draw perpendicular lines with labels"""
+    for (start, end), label_pos, label in zip(static.perpendiculars,
+                                              static.label_positions,
+                                              static.labels):
+        axes.plot([start[0], end[0]], [start[1], end[1]],
+                  'gray', linestyle='--', linewidth=0.8)
+
+        text = axes.text(label_pos[0], label_pos[1],
+                         label,
+                         color='gray',
+                         horizontalalignment='center',
+                         verticalalignment='center',
+                         fontsize=10)  # Явно задаем размер шрифта
+
+        if custom_font:
+            text.set_fontproperties(custom_font)
+
+
+def draw_resultant(axes, result, result_font=None, animated=False):
+    """
+    Draw resultant vector with labels
+
+    Returns:
+        tuple: (Quiver, Text) artists; animated artists are skipped by
+        canvas.draw() and drawn by blitting
+    """
+    # Рисуем результирующий вектор
+    quiver = axes.quiver(0, 0,
+                         result.arrow[0], result.arrow[1],
+                         angles='xy', scale_units='xy', scale=1,
+                         color='red', width=0.006, animated=animated)
+
+    # Подпись результата
+    text = axes.text(*result.text_position,
+                     result.text,
+                     horizontalalignment='center',
+                     verticalalignment='center',
+                     color='red',
+                     bbox=dict(facecolor='white',
+                               edgecolor='none',
+                               alpha=0.8,
+                               pad=1),  # Уменьшили отступ вокруг текста
+                     animated=animated)
+
+    if result_font:
+        text.set_fontproperties(result_font)
+    return quiver, text
+
+
+def set_plot_properties(figure, axes, tight_layout=True):
+    """Set matplotlib plot properties"""
+    axes.set_aspect('equal')
+    axes.grid(True, linestyle='--', alpha=0.2, linewidth=0.5)
+    # Уменьшаем область отображения
+    axes.set_xlim(-1.0, 1.0)
+    axes.set_ylim(-1.0, 1.0)
+    axes.axis('off')
+    if tight_layout:
+        figure.tight_layout(pad=0.1)  # Минимальные отступы
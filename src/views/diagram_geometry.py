@@ -0,0 +1,97 @@
+# src/views/diagram_geometry.py
+"""
+Геометрия векторной диаграммы, общая для всех способов отрисовки.
+
+Координаты заданы в системе диаграммы: центр в (0, 0), ось Y вверх,
+основная область [-1, 1] по обеим осям. Модуль не зависит ни от Qt,
+ни от matplotlib.
+"""
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from src.controllers.vector_calculator import VectorCalculator
+
+TRIANGLE_SCALE = 0.8  # Размер треугольника
+PERPENDICULAR_LENGTH = 0.2  # Длина перпендикуляров к сторонам
+LABEL_OFFSET = 1.1  # Положение подписи ОП относительно длины перпендикуляра
+ARROW_LENGTH = 0.7  # Длина нормированного результирующего вектора
+RESULT_TEXT_POSITION = (0.0, 1.1)  # Положение подписи результата
+
+
+class StaticGeometry(NamedTuple):
+    """
+    Part of the diagram that depends only on azimuth and direction.
+
+    Attributes:
+        triangle: (3, 2) triangle vertices
+        perpendiculars: (3, 2, 2) start and end points of the dashed lines
+        label_positions: (3, 2) positions of the OP labels
+        labels: OP label texts
+    """
+    triangle: NDArray
+    perpendiculars: NDArray
+    label_positions: NDArray
+    labels: Tuple[str, str, str]
+
+
+class ResultGeometry(NamedTuple):
+    """
+    Part of the diagram that depends on the row.
+
+    Attributes:
+        arrow: (2,) end point of the normalized resultant arrow
+        text: Resultant label text
+        text_position: (x, y) position of the label
+    """
+    arrow: NDArray
+    text: str
+    text_position: Tuple[float, float]
+
+
+@lru_cache(maxsize=64)
+def static_geometry(azimuth: float, is_clockwise: bool) -> StaticGeometry:
+    """
+    Calculate (and cache) the static part of the diagram.
+
+    Args:
+        azimuth: Azimuth in degrees
+        is_clockwise: Direction of rotation
+    """
+    scale = TRIANGLE_SCALE
+    points = np.array([
+        [0, scale],
+        [-np.sqrt(3) / 2 * scale, -0.5 * scale],
+        [np.sqrt(3) / 2 * scale, -0.5 * scale]
+    ])
+    # Треугольник поворачивается навстречу результирующему вектору
+    triangle = VectorCalculator.rotate_vectors(points, -azimuth)
+
+    mids = (triangle + np.roll(triangle, -1, axis=0)) / 2
+    perps = mids / np.linalg.norm(mids, axis=1, keepdims=True) * PERPENDICULAR_LENGTH
+    perpendiculars = np.stack([mids, mids + perps], axis=1)
+    label_positions = mids + perps * LABEL_OFFSET
+
+    labels = ("ОП2", "ОП1", "ОП3") if is_clockwise else ("ОП3", "ОП1", "ОП2")
+
+    for array in (triangle, perpendiculars, label_positions):
+        array.setflags(write=False)  # Результат разделяется через кэш
+    return StaticGeometry(triangle, perpendiculars, label_positions, labels)
+
+
+def result_geometry(name, resultant: NDArray, magnitude: float) -> ResultGeometry:
+    """
+    Calculate the row-dependent part of the diagram.
+
+    Args:
+        name: Section name
+        resultant: Resultant vector already rotated by azimuth
+        magnitude: Resultant magnitude in mm
+    """
+    resultant = np.asarray(resultant, dtype=np.float64)
+    norm = np.linalg.norm(resultant)
+    arrow = resultant / norm * ARROW_LENGTH if norm != 0 else resultant
+    return ResultGeometry(arrow, f"отм. + {name} м\n{round(magnitude)} мм",
+                          RESULT_TEXT_POSITION)
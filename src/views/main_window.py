@@ -1,20 +1,27 @@
 # src/views/main_window.py
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QMessageBox, QScrollArea, QApplication, QGridLayout, QLabel, QLineEdit, QFileDialog
+    QTabWidget, QMessageBox, QApplication, QLabel, QLineEdit, QFileDialog,
+    QProgressDialog
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFontDatabase, QFont
+from PyQt6.QtCore import Qt, QThreadPool, QTimer
+from PyQt6.QtGui import QFontDatabase, QFont, QKeySequence, QShortcut
 import os
+import sys
+import time
+import numpy as np
 
 from src.components.styled_widgets import StyledButton
+from src.config.config import AppConfig
 from src.views import IconHelper
 from src.views.data_panel import DataPanel
 from src.views.control_panel import ControlPanel
-from src.views.vector_plot_view import VectorPlotView
-from src.views.VerticalDeviationPlot import VerticalDeviationPlot
-from src.utils.excel_handler import ExcelHandler
+from src.views.vector_grid_view import VectorGridView
+from src.utils.excel_handler import ExcelHandler, ExcelLoadWorker
 from src.models.vector_data import VectorData
+from src.controllers.survey_calculation import SurveyCalculation
+from src.controllers.deviation_calculator import DeviationAnalysis
+from src.utils.profiler import CALCULATE, IMPORT, RENDER, profiler
 
 
 class MainWindow(QMainWindow):
@@ -23,6 +30,8 @@ class MainWindow(QMainWindow):
     Управляет всеми компонентами и их взаимодействием.
     """
 
+    DIAGNOSTICS_SHORTCUT = "Ctrl+Shift+D"
+
     def __init__(self):  # Убрали параметр app_manager
         super().__init__()
         self._init_dependencies()
@@ -33,6 +42,18 @@ class MainWindow(QMainWindow):
     def _init_dependencies(self):
         """Инициализация зависимостей"""
         self.excel_handler = ExcelHandler()
+        self._load_progress = None
+        self._load_worker = None  # Текущая фоновая загрузка Excel
+        self._load_phase = None  # Замер текущей загрузки Excel
+        self._calculation = None  # Результаты последнего расчета
+        self._deviation_plots = []
+        self._deviation_analysis = None  # Общий расчет отклонений для трех графиков
+
+        # Предпросмотр при смене азимута: не чаще PREVIEW_MAX_FPS раз в секунду
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.timeout.connect(self._apply_direction_preview)
+        self._last_preview = 0.0
 
     def setup_font(self):
         """Настройка пользовательского шрифта"""
@@ -111,22 +132,18 @@ class MainWindow(QMainWindow):
         self.export_pdf_btn.clicked.connect(self.export_to_pdf)
         control_panel.addWidget(self.export_pdf_btn)
 
+        # Кнопка экспорта полного отчета
+        self.export_report_btn = StyledButton("Отчет в PDF", style_type="default")
+        IconHelper.setup_button_with_icon(self.export_report_btn, "pdf")
+        self.export_report_btn.clicked.connect(self.export_report_to_pdf)
+        control_panel.addWidget(self.export_report_btn)
+
         control_panel.addStretch()
         layout.addLayout(control_panel)
 
-        # Область прокрутки для графиков
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-
-        # Контейнер для графиков
-        self.vector_container = QWidget()
-        grid = QGridLayout(self.vector_container)
-        grid.setSpacing(20)
-        grid.setContentsMargins(20, 20, 20, 20)
-
-        scroll.setWidget(self.vector_container)
-        layout.addWidget(scroll)
+        # Виртуализированная сетка диаграмм с прокруткой
+        self.vector_grid = VectorGridView()
+        layout.addWidget(self.vector_grid)
 
     def setup_deviation_tab(self):
         """Настройка вкладки отклонений"""
@@ -140,6 +157,12 @@ class MainWindow(QMainWindow):
         tolerance_layout = QHBoxLayout()
         self.tolerance_label = QLabel("Допустимое отклонение (мм/м):")
         self.tolerance_input = QLineEdit("1.0")
+        # Допуск применяется после паузы в вводе
+        self._tolerance_timer = QTimer(self)
+        self._tolerance_timer.setSingleShot(True)
+        self._tolerance_timer.setInterval(AppConfig.TOLERANCE_DEBOUNCE_MS)
+        self._tolerance_timer.timeout.connect(self._on_tolerance_edited)
+        self.tolerance_input.textChanged.connect(self._tolerance_timer.start)
         tolerance_layout.addWidget(self.tolerance_label)
         tolerance_layout.addWidget(self.tolerance_input)
         controls.addLayout(tolerance_layout)
@@ -169,10 +192,19 @@ class MainWindow(QMainWindow):
         self.control_panel.calculate_clicked.connect(self._on_calculate)
         self.control_panel.excel_button.clicked.connect(self._on_load_excel)
         self.control_panel.clipboard_button.clicked.connect(self._on_paste)
+        self.control_panel.azimuth_changed.connect(self._on_direction_changed)
+        self.control_panel.direction_changed.connect(self._on_direction_changed)
+
+        # Инкрементальный пересчет при изменении таблицы
+        self.data_panel.get_table().data_changed.connect(self._on_table_data_changed)
 
         # Сигналы изменения вкладок
         self.tabs.currentChanged.connect(self._on_tab_changed)
 
+        # Панель диагностики производительности
+        self.diagnostics_shortcut = QShortcut(QKeySequence(self.DIAGNOSTICS_SHORTCUT), self)
+        self.diagnostics_shortcut.activated.connect(self.show_diagnostics)
+
     def _on_calculate(self):
         """Обработчик нажатия кнопки расчета"""
         try:
@@ -184,8 +216,18 @@ class MainWindow(QMainWindow):
             # Получение параметров направления
             direction_values = self.control_panel.get_direction_values()
 
+            # Расчет по всем строкам таблицы, дальнейшие правки - инкрементально
+            dataset = self.data_panel.get_table().get_dataset()
+            with profiler.phase("Расчет", CALCULATE, rows=len(dataset)):
+                self._calculation = SurveyCalculation(
+                    dataset,
+                    direction_values['azimuth'],
+                    direction_values['is_clockwise']
+                )
+
             # Обновление графиков
-            self._update_plots(data, direction_values)
+            with profiler.phase("Построение графиков", RENDER, plots=len(self._calculation)):
+                self._update_plots()
 
             # Переключение на вкладку векторов
             self.tabs.setCurrentIndex(1)
@@ -195,31 +237,169 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Критическая ошибка", f"Неожиданная ошибка: {str(e)}")
 
+    @property
+    def calculation(self):
+        """Результаты последнего расчета (SurveyCalculation) или None"""
+        return self._calculation
+
+    @property
+    def deviation_analysis(self):
+        """Расчет отклонений (DeviationAnalysis) текущих графиков или None"""
+        return self._deviation_analysis
+
     def _get_table_data(self):
         """Получение данных из таблицы"""
         return self.data_panel.get_table().get_data()
 
+    def _on_table_data_changed(self, first, last):
+        """Пересчет только измененных строк после правки таблицы"""
+        if self._calculation is None:
+            return
 
+        with profiler.phase("Пересчет строк", CALCULATE, rows=last - first + 1):
+            update = self._calculation.update_rows(
+                self.data_panel.get_table().get_dataset(), first, last
+            )
+        self._refresh_vector_plots(update.plot_indices)
 
-    def _update_deviation_plots(self, data):
+        if update.columns.any() and self._deviation_analysis is not None:
+            self._deviation_analysis = DeviationAnalysis(
+                self._calculation.dataset(), self._deviation_analysis.tolerance
+            )
+            for column in np.flatnonzero(update.columns):
+                if column < len(self._deviation_plots):
+                    self._deviation_plots[column].plot_analysis(
+                        self._deviation_analysis, column
+                    )
+
+    def _on_direction_changed(self, *args):
+        """Отложенный предпросмотр после изменения азимута или направления"""
+        if self._calculation is None or self._preview_timer.isActive():
+            return  # Изменения, пришедшие до срабатывания таймера, объединяются
+
+        frame = 1.0 / AppConfig.PREVIEW_MAX_FPS
+        wait = max(frame - (time.perf_counter() - self._last_preview), 0.0)
+        self._preview_timer.start(int(wait * 1000))
+
+    def _apply_direction_preview(self):
+        """Повернуть рассчитанные векторы и перерисовать видимые диаграммы"""
+        if self._calculation is None:
+            return
+        self._last_preview = time.perf_counter()
+
+        values = self.control_panel.get_direction_values()
+        if self._calculation.set_orientation(values['azimuth'], values['is_clockwise']):
+            self.vector_grid.redraw_visible()
+
+    def _update_deviation_plots(self, data, tolerance):
         """Обновление графиков отклонений"""
-        self._clear_container(self.deviation_container)
+        self._deviation_analysis = DeviationAnalysis(data, tolerance)
+
+        if len(self._deviation_plots) == 3:
+            # Графики уже созданы - обновляем их на месте
+            for i, plot in enumerate(self._deviation_plots):
+                plot.plot_analysis(self._deviation_analysis, i)
+            return
+
+        # matplotlib загружается при первом построении графиков, а не при запуске
+        from src.views.VerticalDeviationPlot import VerticalDeviationPlot
 
+        self._clear_container(self.deviation_container)
+        self._deviation_plots = []
         for i in range(3):
             plot = VerticalDeviationPlot(self)
-            plot.plot_deviations(data, i, 1.0)  # 1.0 - стандартное отклонение
+            plot.plot_analysis(self._deviation_analysis, i)
             self.deviation_container.layout().addWidget(plot)
+            self._deviation_plots.append(plot)
 
     def _on_load_excel(self):
         """Обработчик загрузки Excel файла"""
-        data_list = self.excel_handler.load_from_excel()
-        if data_list:
-            self.data_panel.get_table().set_data(data_list)
+        file_name = self.excel_handler.select_file(self)
+        if not file_name:
+            return
+
+        worker = ExcelLoadWorker(file_name)
+        self._load_worker = worker
+        self._load_phase = profiler.start("Загрузка Excel", IMPORT,
+                                          file=os.path.basename(file_name))
+
+        self._load_progress = QProgressDialog("Загрузка данных...", "Отмена", 0, 0, self)
+        self._load_progress.setWindowTitle("Импорт Excel")
+        self._load_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self._load_progress.setMinimumDuration(500)
+        self._load_progress.canceled.connect(worker.cancel)
+
+        worker.signals.progress.connect(self._on_excel_progress)
+        worker.signals.finished.connect(self._on_excel_loaded)
+        worker.signals.failed.connect(self._on_excel_failed)
+        worker.signals.cancelled.connect(self._close_load_progress)
+
+        self.control_panel.excel_button.setEnabled(False)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_excel_progress(self, done, total):
+        """Обновление индикатора загрузки"""
+        if self._load_progress:
+            self._load_progress.setMaximum(total)
+            self._load_progress.setValue(min(done, total) if total else 0)
+
+    def _on_excel_loaded(self, result):
+        """Обработчик завершения фоновой загрузки"""
+        if self._load_worker is None or self._load_worker.is_cancelled():
+            # Отмена пришла, когда файл уже был прочитан: результат не нужен
+            self._close_load_progress()
+            return
+
+        self._finish_load_phase(rows=len(result.dataset), errors=len(result.errors))
+        self._close_load_progress()
+
+        if not len(result.dataset):
+            QMessageBox.warning(self, "Предупреждение",
+                                "Не удалось загрузить данные из файла")
+            return
+
+        self.data_panel.get_table().set_data(result.dataset)
+
+        if result.errors:
+            QMessageBox.warning(
+                self,
+                "Предупреждение",
+                f"Загружено строк: {len(result.dataset)}. "
+                f"Некорректных значений: {len(result.errors)}\n\n"
+                f"{self.excel_handler.format_errors(result.errors)}"
+            )
+
+    def _on_excel_failed(self, message):
+        """Обработчик ошибки фоновой загрузки"""
+        self._finish_load_phase(status='error')
+        self._close_load_progress()
+        QMessageBox.warning(self, "Предупреждение", message)
+
+    def _close_load_progress(self):
+        """Закрыть индикатор загрузки"""
+        self._finish_load_phase(status='cancelled')  # Не завершена - значит отменена
+        self._load_worker = None
+        self.control_panel.excel_button.setEnabled(True)
+        if self._load_progress:
+            self._load_progress.close()
+            self._load_progress = None
+
+    def _finish_load_phase(self, **details):
+        """Записать замер загрузки Excel, если он еще не записан"""
+        profiler.finish(self._load_phase, **details)
+        self._load_phase = None
 
     def _on_paste(self):
         """Обработчик вставки из буфера обмена"""
         clipboard = QApplication.clipboard()
-        self.data_panel.get_table().paste_data(clipboard.text())
+        errors = self.data_panel.get_table().paste_data(clipboard.text())
+        if errors:
+            QMessageBox.warning(
+                self,
+                "Предупреждение",
+                f"Некорректных значений: {len(errors)}\n\n"
+                f"{self.excel_handler.format_errors(errors)}"
+            )
 
     def _on_tab_changed(self, index):
         """Обработчик смены вкладки"""
@@ -259,39 +439,51 @@ class MainWindow(QMainWindow):
                 "Успех",
                 "Экспорт графиков отклонений в PDF выполнен успешно"
             )
-            # Обновляем графики после экспорта
-            self.update_deviation_plots()
+
+    def export_report_to_pdf(self):
+        """Экспорт полного отчета (диаграммы, отклонения, сводка) в PDF"""
+        if not hasattr(self, '_pdf_handler'):
+            from src.utils.pdf_export_handler import PDFExportHandler
+            self._pdf_handler = PDFExportHandler(self)
+
+        if self._pdf_handler.export_report_to_pdf():
+            QMessageBox.information(
+                self,
+                "Успех",
+                "Экспорт отчета в PDF выполнен успешно"
+            )
+
+    def show_diagnostics(self):
+        """Показать панель диагностики с замерами этапов"""
+        if not hasattr(self, '_diagnostics_dialog'):
+            from src.views.diagnostics_dialog import DiagnosticsDialog
+            self._diagnostics_dialog = DiagnosticsDialog(self)
+
+        self._diagnostics_dialog.show()
+        self._diagnostics_dialog.raise_()
+        self._diagnostics_dialog.activateWindow()
 
     # ---- Вспомогательные методы ----
-    def _update_plots(self, data, direction_values):
-        """Обновление всех графиков"""
+    def _update_plots(self):
+        """Обновление всех графиков по результатам расчета"""
+        # Допуск проверяется до перерисовки, чтобы ошибка ввода не оставила
+        # диаграммы и графики отклонений от разных расчетов
+        tolerance = self._tolerance_value()
+
         # Обновление векторных диаграмм
-        self._update_vector_plots(data, direction_values)
+        self._update_vector_plots()
 
-        # Обновление графиков отклонений
-        self._update_deviation_plots(data)
+        # Обновление графиков отклонений с допуском из поля ввода
+        self._update_deviation_plots(self._calculation.dataset(), tolerance)
 
-    def _update_vector_plots(self, data, direction_values):
+    def _update_vector_plots(self):
         """Обновление векторных диаграмм"""
-        self._clear_container(self.vector_container)
-        layout = self.vector_container.layout()
-        # Убираем отступы у layout контейнера
-        layout.setSpacing(0)
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        for i, vector_data in enumerate(data):
-            plot = VectorPlotView(self)
-            plot.setMinimumSize(250, 250)  # Минимальный размер для читаемости
-            plot.plot_vector_diagram(
-                vector_data,
-                direction_values['azimuth'],
-                direction_values['is_clockwise']
-            )
+        # Живые диаграммы сетки переиспользуются и только перерисовываются
+        self.vector_grid.set_calculation(self._calculation)
 
-            # Размещаем в сетке 3 столбца
-            row = i // 3
-            col = i % 3
-            layout.addWidget(plot, row, col, Qt.AlignmentFlag.AlignCenter)
+    def _refresh_vector_plots(self, plot_indices):
+        """Перерисовать диаграммы с указанными индексами"""
+        self.vector_grid.update_items(plot_indices)
 
     def update_deviation_plots(self):
         """Обновление графиков отклонений"""
@@ -301,24 +493,58 @@ class MainWindow(QMainWindow):
                 return
 
             # Получаем текущее значение tolerance
-            tolerance = float(self.tolerance_input.text())
+            tolerance = self._tolerance_value()
 
-            self._clear_container(self.deviation_container)
+            if (self._calculation is not None and self._deviation_analysis is not None
+                    and self._deviation_plots):
+                # Данные не менялись (правки таблицы учитываются сразу) -
+                # пересчитываются только границы допуска и маски
+                self._apply_tolerance(tolerance)
+                return
 
-            for i in range(3):
-                plot = VerticalDeviationPlot(self)
-                plot.plot_deviations(data, i, tolerance)
-                self.deviation_container.layout().addWidget(plot)
+            self._update_deviation_plots(data, tolerance)
 
         except ValueError as e:
             QMessageBox.warning(self, "Ошибка", str(e))
 
+    def _tolerance_value(self):
+        """
+        Допуск из поля ввода, мм/м (запятая допускается как разделитель)
+
+        Raises:
+            ValueError: Если значение не является числом
+        """
+        text = self.tolerance_input.text().strip()
+        try:
+            return float(text.replace(',', '.'))
+        except ValueError:
+            raise ValueError(f"Некорректное значение допуска: '{text}'") from None
+
+    def _apply_tolerance(self, tolerance):
+        """Пересчитать допуск и обновить графики отклонений на месте"""
+        self._deviation_analysis.set_tolerance(tolerance)
+        for plot in self._deviation_plots:
+            plot.update_tolerance(self._deviation_analysis)
+
+    def _on_tolerance_edited(self):
+        """Применение допуска после паузы в вводе (без сообщений об ошибках)"""
+        if (self._calculation is None or self._deviation_analysis is None
+                or not self._deviation_plots):
+            return
+        try:
+            tolerance = self._tolerance_value()
+        except ValueError:
+            return  # Ввод не завершен или некорректен
+        if tolerance != self._deviation_analysis.tolerance:
+            self._apply_tolerance(tolerance)
+
     def closeEvent(self, event):
         """Обработка закрытия окна"""
         try:
-            # Очищаем временные файлы matplotlib
-            import matplotlib.pyplot as plt
-            plt.close('all')
+            # Очищаем временные файлы matplotlib (pyplot мог быть не загружен)
+            plt = sys.modules.get('matplotlib.pyplot')
+            if plt is not None:
+                plt.close('all')
 
             # Принимаем событие закрытия
             event.accept()
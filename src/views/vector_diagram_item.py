@@ -0,0 +1,178 @@
+# src/views/vector_diagram_item.py
+"""
+Отрисовка векторной диаграммы средствами QPainter без matplotlib.
+
+Геометрия берется из diagram_geometry, поэтому диаграмма совпадает с
+вариантом matplotlib; размеры линий и шрифтов заданы в единицах диаграммы
+и масштабируются вместе с целевым прямоугольником.
+"""
+from PyQt6.QtWidgets import QGraphicsItem
+from PyQt6.QtCore import Qt, QPointF, QRectF
+from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QFontMetricsF, QPolygonF
+
+FONT_FAMILY = "ISOCPEUR"
+
+# Видимая область диаграммы: треугольник и подпись результата сверху
+VIEW_X = (-1.05, 1.05)
+VIEW_Y = (-1.05, 1.3)
+
+# Размеры в единицах диаграммы (ширина области [-1, 1] равна 2)
+TRIANGLE_WIDTH = 0.005
+PERPENDICULAR_WIDTH = 0.004
+LABEL_FONT_SIZE = 0.055
+RESULT_FONT_SIZE = 0.065
+TEXT_PADDING = 0.01
+
+# Стрелка в пропорциях matplotlib quiver (в толщинах древка)
+ARROW_WIDTH = 0.012
+ARROW_HEAD_WIDTH = 3
+ARROW_HEAD_LENGTH = 5
+ARROW_HEAD_AXIS_LENGTH = 4.5
+
+RESULT_BACKGROUND = QColor(255, 255, 255, 204)
+
+ITEM_SIZE = 600  # Размер элемента сцены, как у figure 6x6 дюймов при 100 dpi
+
+
+def paint_vector_diagram(painter, rect, static, result, font_family=FONT_FAMILY):
+    """
+    Нарисовать векторную диаграмму в прямоугольнике
+
+    Args:
+        painter (QPainter): Активный QPainter (экран, изображение или принтер)
+        rect (QRectF): Целевой прямоугольник, пропорции сохраняются
+        static (StaticGeometry): Треугольник, перпендикуляры и подписи ОП
+        result (ResultGeometry): Стрелка и подпись результата
+        font_family (str): Семейство шрифта подписей
+    """
+    width = VIEW_X[1] - VIEW_X[0]
+    height = VIEW_Y[1] - VIEW_Y[0]
+    scale = min(rect.width() / width, rect.height() / height)
+    # Левый верхний угол области диаграммы в координатах устройства
+    left = rect.center().x() - width * scale / 2
+    top = rect.center().y() - height * scale / 2
+
+    def point(x, y):
+        return QPointF(left + (x - VIEW_X[0]) * scale, top + (VIEW_Y[1] - y) * scale)
+
+    painter.save()
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+    # Треугольник
+    painter.setPen(QPen(Qt.GlobalColor.black, TRIANGLE_WIDTH * scale))
+    painter.setBrush(Qt.BrushStyle.NoBrush)
+    painter.drawPolygon(QPolygonF([point(x, y) for x, y in static.triangle]))
+
+    # Перпендикуляры с подписями ОП
+    gray = QColor(128, 128, 128)
+    pen = QPen(gray, PERPENDICULAR_WIDTH * scale)
+    pen.setStyle(Qt.PenStyle.DashLine)
+    painter.setPen(pen)
+    for (x1, y1), (x2, y2) in static.perpendiculars:
+        painter.drawLine(point(x1, y1), point(x2, y2))
+
+    painter.setFont(_font(font_family, LABEL_FONT_SIZE * scale))
+    painter.setPen(gray)
+    for (x, y), label in zip(static.label_positions, static.labels):
+        _draw_centered_text(painter, point(x, y), label)
+
+    # Результирующий вектор
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QBrush(Qt.GlobalColor.red))
+    arrow = _arrow_polygon(result.arrow, point, ARROW_WIDTH * scale / 2)
+    if arrow is not None:
+        painter.drawPolygon(arrow)
+
+    # Подпись результата на полупрозрачной подложке
+    font = _font(font_family, RESULT_FONT_SIZE * scale, bold=True)
+    painter.setFont(font)
+    center = point(*result.text_position)
+    text_rect = QFontMetricsF(font).boundingRect(
+        QRectF(), Qt.AlignmentFlag.AlignCenter, result.text)
+    text_rect.moveCenter(center)
+    padding = TEXT_PADDING * scale
+    painter.fillRect(text_rect.adjusted(-padding, -padding, padding, padding),
+                     RESULT_BACKGROUND)
+    painter.setPen(Qt.GlobalColor.red)
+    painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, result.text)
+
+    painter.restore()
+
+
+def _font(family, pixel_size, bold=False):
+    font = QFont(family)
+    font.setPixelSize(max(1, round(pixel_size)))
+    font.setBold(bold)
+    return font
+
+
+def _draw_centered_text(painter, center, text):
+    rect = QFontMetricsF(painter.font()).boundingRect(text)
+    rect.moveCenter(center)
+    painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+
+
+def _arrow_polygon(arrow, point, half_width):
+    """Контур стрелки от центра диаграммы до arrow в координатах устройства"""
+    start = point(0.0, 0.0)
+    end = point(float(arrow[0]), float(arrow[1]))
+    dx, dy = end.x() - start.x(), end.y() - start.y()
+    length = (dx * dx + dy * dy) ** 0.5
+    if length == 0:
+        return None
+
+    # Единичные векторы вдоль стрелки и поперек нее
+    ux, uy = dx / length, dy / length
+    nx, ny = -uy, ux
+
+    # Короткая стрелка уменьшается целиком, как в quiver
+    head_length = min(ARROW_HEAD_LENGTH * 2 * half_width, length)
+    shrink = head_length / (ARROW_HEAD_LENGTH * 2 * half_width)
+    head_axis = ARROW_HEAD_AXIS_LENGTH * 2 * half_width * shrink
+    head_half = ARROW_HEAD_WIDTH * half_width * shrink
+    shaft_half = half_width * shrink
+
+    def at(along, across):
+        return QPointF(start.x() + ux * along + nx * across,
+                       start.y() + uy * along + ny * across)
+
+    return QPolygonF([
+        at(0, -shaft_half),
+        at(length - head_axis, -shaft_half),
+        at(length - head_length, -head_half),
+        at(length, 0),
+        at(length - head_length, head_half),
+        at(length - head_axis, shaft_half),
+        at(0, shaft_half),
+    ])
+
+
+class VectorDiagramItem(QGraphicsItem):
+    """Элемент сцены, рисующий векторную диаграмму через QPainter"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._static = None
+        self._result = None
+        self.font_family = FONT_FAMILY
+
+    def set_diagram(self, static, result):
+        """
+        Задать геометрию диаграммы и перерисовать элемент
+
+        Args:
+            static (StaticGeometry): Статическая часть диаграммы
+            result (ResultGeometry): Результирующий вектор и подпись
+        """
+        self._static = static
+        self._result = result
+        self.update()
+
+    def boundingRect(self):
+        return QRectF(0, 0, ITEM_SIZE, ITEM_SIZE)
+
+    def paint(self, painter, option, widget=None):
+        painter.fillRect(self.boundingRect(), Qt.GlobalColor.white)
+        if self._static is not None and self._result is not None:
+            paint_vector_diagram(painter, self.boundingRect(), self._static,
+                                 self._result, self.font_family)
@@ -0,0 +1,216 @@
+# src/views/vector_grid_view.py
+import math
+import time
+from collections import OrderedDict
+
+from PyQt6.QtWidgets import QAbstractScrollArea
+from PyQt6.QtCore import Qt, QTimer
+
+from src.config.config import AppConfig
+from src.utils.profiler import RENDER, profiler
+
+
+class VectorGridView(QAbstractScrollArea):
+    """
+    Виртуализированная сетка векторных диаграмм.
+
+    Живые VectorPlotView создаются только для видимых ячеек и небольшого
+    запаса строк сверху и снизу; при прокрутке они переназначаются на новые
+    строки. За один такт цикла событий отрисовывается столько диаграмм,
+    сколько укладывается в RENDER_BUDGET (для matplotlib обычно одна),
+    готовые изображения хранятся в LRU-кэше.
+    """
+
+    COLUMNS = 3  # Диаграмм в строке сетки
+    MIN_CELL_SIZE = 250  # Минимальный размер ячейки для читаемости
+    OVERSCAN_ROWS = 1  # Запас строк сетки за пределами видимой области
+    RENDER_BUDGET = 0.015  # Время отрисовки за один такт, с
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._calculation = None
+        self._views = {}  # Индекс диаграммы -> VectorPlotView
+        self._free_views = []
+        self._pixmap_cache = OrderedDict()
+        self._render_queue = []
+        self._render_cost = [0.0, 0.0, 0]  # Время, CPU и число диаграмм текущей очереди
+
+        self._render_timer = QTimer(self)
+        self._render_timer.setInterval(0)
+        self._render_timer.timeout.connect(self._render_next)
+
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.viewport().setStyleSheet("background-color: white;")
+        self.verticalScrollBar().valueChanged.connect(self._update_visible)
+
+    def set_calculation(self, calculation):
+        """
+        Показать результаты нового расчета
+
+        Args:
+            calculation (SurveyCalculation): Результаты расчета
+        """
+        self._calculation = calculation
+        self._pixmap_cache.clear()
+        self._render_queue = []
+        self._update_scrollbar()
+        for index, view in self._views.items():
+            self._bind(index, view)
+        self._update_visible()
+
+    def update_items(self, indices):
+        """
+        Перерисовать диаграммы с указанными индексами после изменения данных
+
+        Args:
+            indices (iterable): Индексы изменившихся диаграмм
+        """
+        for index in indices:
+            index = int(index)
+            self._pixmap_cache.pop(index, None)
+            if index in self._views:
+                self._bind(index, self._views[index])
+
+        # Диаграммы за пределами нового количества строк больше не нужны
+        for index in [index for index in self._pixmap_cache if index >= self.count()]:
+            del self._pixmap_cache[index]
+
+        self._update_scrollbar()
+        self._update_visible()
+
+    def redraw_visible(self):
+        """
+        Перерисовать видимые диаграммы после смены азимута или направления
+
+        Кэш целиком устарел и очищается; видимые виджеты показывают прежнее
+        изображение, пока не будут перерисованы, поэтому сетка не мигает.
+        """
+        self._pixmap_cache.clear()
+        self._render_queue = [index for index in self._visible_indices()
+                              if index in self._views]
+        if self._render_queue:
+            self._render_timer.start()
+
+    def view_for(self, index):
+        """Живой виджет диаграммы или None, если ячейка не видна"""
+        return self._views.get(index)
+
+    def count(self):
+        return len(self._calculation) if self._calculation is not None else 0
+
+    def _cell_size(self):
+        return max(self.viewport().width() // self.COLUMNS, self.MIN_CELL_SIZE)
+
+    def _update_scrollbar(self):
+        """Пересчитать диапазон прокрутки по количеству диаграмм"""
+        cell = self._cell_size()
+        rows = math.ceil(self.count() / self.COLUMNS)
+        height = self.viewport().height()
+
+        scrollbar = self.verticalScrollBar()
+        scrollbar.setRange(0, max(0, rows * cell - height))
+        scrollbar.setPageStep(height)
+        scrollbar.setSingleStep(max(cell // 5, 1))
+
+    def _visible_indices(self):
+        """Индексы диаграмм в видимой области с запасом"""
+        cell = self._cell_size()
+        offset = self.verticalScrollBar().value()
+        first_row = max(offset // cell - self.OVERSCAN_ROWS, 0)
+        last_row = (offset + self.viewport().height()) // cell + self.OVERSCAN_ROWS
+        return range(first_row * self.COLUMNS,
+                     min((last_row + 1) * self.COLUMNS, self.count()))
+
+    def _update_visible(self):
+        """Переназначить живые виджеты видимым ячейкам и расставить их"""
+        needed = self._visible_indices()
+
+        for index in [index for index in self._views if index not in needed]:
+            view = self._views.pop(index)
+            view.hide()
+            self._free_views.append(view)
+
+        for index in needed:
+            if index not in self._views:
+                view = self._free_views.pop() if self._free_views else self._create_view()
+                self._views[index] = view
+                self._bind(index, view)
+
+        cell = self._cell_size()
+        offset = self.verticalScrollBar().value()
+        for index, view in self._views.items():
+            row, col = divmod(index, self.COLUMNS)
+            view.setGeometry(col * cell, row * cell - offset, cell, cell)
+
+    def _create_view(self):
+        # matplotlib загружается при создании первой диаграммы, а не при запуске
+        from src.views.vector_plot_view import VectorPlotView
+
+        view = VectorPlotView(self.viewport())
+        view.hide()
+        return view
+
+    def _bind(self, index, view):
+        """Показать диаграмму из кэша или поставить ее в очередь отрисовки"""
+        pixmap = self._pixmap_cache.get(index)
+        if pixmap is not None:
+            self._pixmap_cache.move_to_end(index)
+            _, resultant, _ = self._calculation.plot_item(index)
+            view.show_pixmap(pixmap, resultant)
+            view.show()
+        else:
+            view.hide()
+            if index not in self._render_queue:
+                self._render_queue.append(index)
+            self._render_timer.start()
+
+    def _render_next(self):
+        """Отрисовать диаграммы из очереди в пределах бюджета времени"""
+        started, cpu_started = time.perf_counter(), time.process_time()
+        try:
+            self._render_batch(started + self.RENDER_BUDGET)
+        finally:
+            # Замер суммирует только время отрисовки, без пауз между порциями
+            self._render_cost[0] += time.perf_counter() - started
+            self._render_cost[1] += time.process_time() - cpu_started
+
+        if not self._render_queue:
+            self._render_timer.stop()
+            wall, cpu, count = self._render_cost
+            self._render_cost = [0.0, 0.0, 0]
+            if count:
+                profiler.record("Отрисовка диаграмм", RENDER, wall, cpu,
+                                diagrams=count, renderer=AppConfig.VECTOR_RENDERER)
+
+    def _render_batch(self, deadline):
+        """Отрисовать диаграммы из очереди до наступления deadline"""
+        while self._render_queue:
+            index = self._render_queue.pop(0)
+            view = self._views.get(index)
+            if view is None or index in self._pixmap_cache or index >= self.count():
+                continue  # Ячейка ушла из видимой области или уже готова
+
+            name, resultant, magnitude = self._calculation.plot_item(index)
+            view.plot_result(name, resultant, magnitude,
+                             self._calculation.azimuth,
+                             self._calculation.is_clockwise)
+            view.show()
+            self._cache_pixmap(index, view.grab_pixmap())
+            self._render_cost[2] += 1
+            if time.perf_counter() >= deadline:
+                return
+
+    def _cache_pixmap(self, index, pixmap):
+        self._pixmap_cache[index] = pixmap
+        self._pixmap_cache.move_to_end(index)
+        while len(self._pixmap_cache) > AppConfig.VECTOR_PIXMAP_CACHE_SIZE:
+            self._pixmap_cache.popitem(last=False)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scrollbar()
+        self._update_visible()
+
+    def scrollContentsBy(self, dx, dy):
+        # Виджеты расставляются в _update_visible по значению полосы прокрутки
+        pass
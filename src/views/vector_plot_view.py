@@ -1,20 +1,33 @@
 from PyQt6.QtWidgets import (QGraphicsScene, QGraphicsView, QFrame,
-                             QVBoxLayout, QGraphicsProxyWidget, QSizePolicy)
+                             QVBoxLayout, QGraphicsProxyWidget, QGraphicsPixmapItem,
+                             QSizePolicy)
 from PyQt6.QtCore import Qt, QRectF
-from PyQt6.QtGui import QPainter, QColor
+from PyQt6.QtGui import QPainter, QColor, QImage, QPixmap
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
-from matplotlib.figure import Figure
-from matplotlib.font_manager import FontProperties
-import numpy as np
-from matplotlib.patches import Polygon
+from src.config.config import AppConfig
+from src.controllers.vector_calculator import VectorCalculator
+from src.views.diagram_figure import (get_plot_fonts, create_diagram_figure,
+                                      draw_static_layer,
+                                      draw_resultant, set_plot_properties)
+from src.views.diagram_geometry import static_geometry, result_geometry
+from src.views.vector_diagram_item import VectorDiagramItem
 
 
 class VectorPlotView(QGraphicsView):
-    def __init__(self, parent=None):
+    RENDERER_MATPLOTLIB = 'matplotlib'
+    RENDERER_NATIVE = 'native'  # QPainter без matplotlib
+
+    def __init__(self, parent=None, renderer=None):
         super().__init__(parent)
+        self.renderer = renderer or AppConfig.VECTOR_RENDERER
+        self.resultant = None  # Последний отрисованный результирующий вектор
         self.setup_font()
         self.setup_ui()
 
+    @property
+    def is_native(self):
+        return self.renderer == self.RENDERER_NATIVE
+
     def setup_font(self):
         """Настройка шрифта для графика"""
         try:
@@ -23,14 +36,7 @@ class VectorPlotView(QGraphicsView):
                 main_window = main_window.parent()
 
             if main_window and hasattr(main_window, 'font_path'):
-                # Основной шрифт для обычного текста
-                self.custom_font = FontProperties(fname=main_window.font_path)
-                self.custom_font.set_size(12)  # Уменьшили базовый размер шрифта
-
-                # Шрифт для результирующего вектора
-                self.result_font = FontProperties(fname=main_window.font_path)
-                self.result_font.set_size(14)  # Уменьшили размер шрифта результата
-                self.result_font.set_weight('bold')
+                self.custom_font, self.result_font = get_plot_fonts(main_window.font_path)
             else:
                 self.custom_font = None
                 self.result_font = None
@@ -54,166 +60,151 @@ class VectorPlotView(QGraphicsView):
         # Белый фон
         self.setBackgroundBrush(QColor(255, 255, 255))
 
-        # Уменьшаем размер figure
-        self.figure = Figure(figsize=(6, 6), dpi=100)
-        self.canvas = FigureCanvasQTAgg(self.figure)
-        # Минимальные отступы
-        self.figure.subplots_adjust(left=0.05, right=0.95, top=0.95, bottom=0.05)
-        self.axes = self.figure.add_subplot(111)
-
-        self.proxy = QGraphicsProxyWidget()
-        self.proxy.setWidget(self.canvas)
-        self.scene.addItem(self.proxy)
+        if self.is_native:
+            # Диаграмма рисуется элементом сцены, matplotlib не используется
+            self.diagram_item = VectorDiagramItem()
+            self.content = self.diagram_item
+        else:
+            self.figure, self.axes = create_diagram_figure()
+            self.canvas = FigureCanvasQTAgg(self.figure)
+
+            self.proxy = QGraphicsProxyWidget()
+            self.proxy.setWidget(self.canvas)
+            self.content = self.proxy
+
+            # Статический слой (треугольник и подписи ОП) рисуется один раз на
+            # пару (азимут, направление); для новой строки перерисовываются
+            # только стрелка и подпись результата поверх сохраненного фона
+            self._static_key = None
+            self._background = None
+            self._result_artists = None
+            self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+        self.scene.addItem(self.content)
+
+        # Готовое изображение диаграммы из кэша показывается вместо холста
+        self.pixmap_item = QGraphicsPixmapItem()
+        self.pixmap_item.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+        self.pixmap_item.setVisible(False)
+        self.scene.addItem(self.pixmap_item)
 
         self.setSizePolicy(QSizePolicy.Policy.Expanding,
                           QSizePolicy.Policy.Expanding)
         self.setMinimumSize(250, 250)
 
-
-
-
-    def _create_triangle(self, azimuth):
-        """Create triangle with specified rotation"""
-        # Уменьшаем размер треугольника
-        scale = 0.8  # Уменьшили масштаб
-        points = np.array([
-            [0, scale],
-            [-np.sqrt(3) / 2 * scale, -0.5 * scale],
-            [np.sqrt(3) / 2 * scale, -0.5 * scale]
-        ])
-
-        rotated_points = self._rotate_points(points, azimuth)
-        return Polygon(rotated_points, fill=False, color='black', linewidth=1.0)
-
-
-    def _rotate_points(self, points, angle):
-        """Rotate points by given angle"""
-        rotation_matrix = np.array([
-            [np.cos(angle), -np.sin(angle)],
-            [np.sin(angle), np.cos(angle)]
-        ])
-        return points @ rotation_matrix
-
-    def _calculate_vectors(self, lengths, is_clockwise):
-        """Calculate vectors from lengths and direction"""
-        vectors = np.zeros((3, 2))
-        angle = 0
-        for i, length in enumerate(lengths):
-            radians = np.radians(angle)
-            vectors[i] = [length * np.cos(radians), length * np.sin(radians)]
-            angle += -120 if is_clockwise else 120
-        return vectors
-
-    def _rotate_vector(self, vector, angle):
-        """Rotate vector by given angle"""
-        rotation_matrix = np.array([
-            [np.cos(angle), -np.sin(angle)],
-            [np.sin(angle), np.cos(angle)]
-        ])
-        return np.dot(rotation_matrix, vector)
-
-    def _draw_perpendiculars(self, triangle_points, is_clockwise):
-        """Draw perpendicular lines with labels"""
-        labels = ["ОП2", "ОП1", "ОП3"] if is_clockwise else ["ОП3", "ОП1", "ОП2"]
-
-        for i in range(3):
-            p1 = triangle_points[i]
-            p2 = triangle_points[(i + 1) % 3]
-            mid = (p1 + p2) / 2
-
-            center = np.array([0, 0])
-            to_mid = mid - center
-            # Уменьшаем длину перпендикулярных линий
-            perp = to_mid / np.linalg.norm(to_mid) * 0.2
-
-            self.axes.plot([mid[0], mid[0] + perp[0]],
-                           [mid[1], mid[1] + perp[1]],
-                           'gray', linestyle='--', linewidth=0.8)
-
-            label_pos = mid + perp * 1.1
-            text = self.axes.text(label_pos[0], label_pos[1],
-                                  labels[i],
-                                  color='gray',
-                                  horizontalalignment='center',
-                                  verticalalignment='center',
-                                  fontsize=10)  # Явно задаем размер шрифта
-
-            if self.custom_font:
-                text.set_fontproperties(self.custom_font)
-
-    def _draw_resultant(self, resultant, name, length):
-        """Draw resultant vector with labels"""
-        norm = np.linalg.norm(resultant)
-        if norm != 0:
-            normalized_resultant = resultant / norm * 0.7  # Уменьшили длину вектора
-        else:
-            normalized_resultant = resultant
-
-        # Рисуем результирующий вектор
-        self.axes.quiver(0, 0,
-                         normalized_resultant[0], normalized_resultant[1],
-                         angles='xy', scale_units='xy', scale=1,
-                         color='red', width=0.006)
-
-        # Подпись результата
-        text = self.axes.text(0, 1.1,  # Уменьшили отступ сверху
-                              f"отм. + {name} м\n{round(length)} мм",
-                              horizontalalignment='center',
-                              verticalalignment='center',
-                              color='red',
-                              bbox=dict(facecolor='white',
-                                        edgecolor='none',
-                                        alpha=0.8,
-                                        pad=1))  # Уменьшили отступ вокруг текста
-
-        if self.result_font:
-            text.set_fontproperties(self.result_font)
-
     def _adjust_view(self):
         """Adjust view to fit content with proper scaling"""
-        self.scene.setSceneRect(self.proxy.boundingRect())
+        self.scene.setSceneRect(self.content.boundingRect())
         self.fitInView(self.scene.sceneRect(),
                        Qt.AspectRatioMode.KeepAspectRatio)
 
     def resizeEvent(self, event):
         """Handle resize events properly"""
         super().resizeEvent(event)
-        if hasattr(self, 'proxy'):
+        if hasattr(self, 'content'):
             self._adjust_view()
 
     def plot_vector_diagram(self, vector_data, azimuth, is_clockwise):
-        """Plot vector diagram with improved error handling"""
+        """Plot vector diagram for a single row"""
         try:
-            self.axes.clear()
-
-            # Plot the diagram
-            azimuth_rad = np.radians(azimuth)
-            self.triangle = self._create_triangle(azimuth_rad)
-            self.axes.add_patch(self.triangle)
-            self._draw_perpendiculars(self.triangle.get_xy(), is_clockwise)
-
-            lengths = vector_data.as_list()
-            vectors = self._calculate_vectors(lengths, is_clockwise)
-            resultant = np.sum(vectors, axis=0)
-            rotated_resultant = self._rotate_vector(resultant, azimuth_rad)
+            rotated = VectorCalculator.rotate_vectors(
+                vector_data.resultant(is_clockwise), azimuth)
+            self.plot_result(vector_data.name, rotated,
+                             vector_data.magnitude(is_clockwise),
+                             azimuth, is_clockwise)
+        except Exception as e:
+            print(f"Error plotting vector diagram: {str(e)}")
 
-            self._draw_resultant(rotated_resultant, vector_data.name,
-                               np.linalg.norm(resultant))
-            self._set_plot_properties()
+    def plot_result(self, name, resultant, magnitude, azimuth, is_clockwise):
+        """
+        Plot vector diagram from precomputed results
+
+        Args:
+            name (str): Section name
+            resultant (NDArray): Resultant vector already rotated by azimuth
+            magnitude (float): Resultant magnitude in mm
+            azimuth (float): Azimuth in degrees
+            is_clockwise (bool): Direction of rotation
+        """
+        try:
+            self.resultant = resultant
+            if self.is_native:
+                self.diagram_item.set_diagram(static_geometry(azimuth, is_clockwise),
+                                              result_geometry(name, resultant, magnitude))
+            else:
+                result = result_geometry(name, resultant, magnitude)
+                if (azimuth, is_clockwise) != self._static_key or self._background is None:
+                    self._draw_static(azimuth, is_clockwise, result)
+                else:
+                    self._blit_result(result)
 
-            # Update canvas and adjust view
-            self.canvas.draw()
+            self._show_canvas(True)
             self._adjust_view()
 
         except Exception as e:
             print(f"Error plotting vector diagram: {str(e)}")
 
-    def _set_plot_properties(self):
-        """Set matplotlib plot properties"""
-        self.axes.set_aspect('equal')
-        self.axes.grid(True, linestyle='--', alpha=0.2, linewidth=0.5)
-        # Уменьшаем область отображения
-        self.axes.set_xlim(-1.0, 1.0)
-        self.axes.set_ylim(-1.0, 1.0)
-        self.axes.axis('off')
-        self.figure.tight_layout(pad=0.1)  # Минимальные отступы
\ No newline at end of file
+    def _draw_static(self, azimuth, is_clockwise, result):
+        """Полная перерисовка: статический слой и анимируемые артисты результата"""
+        self.axes.clear()
+        draw_static_layer(self.axes, static_geometry(azimuth, is_clockwise),
+                           self.custom_font)
+        self._result_artists = draw_resultant(self.axes, result, self.result_font,
+                                               animated=True)
+        set_plot_properties(self.figure, self.axes)
+        self._static_key = (azimuth, is_clockwise)
+        self.canvas.draw()  # Фон сохраняется в _on_canvas_draw
+
+    def _on_canvas_draw(self, event):
+        """Сохранить фон после полной отрисовки (в том числе после изменения размера)"""
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_result_artists()
+
+    def _blit_result(self, result):
+        """Перерисовать только стрелку и подпись результата поверх фона"""
+        quiver, text = self._result_artists
+        quiver.set_UVC(result.arrow[0], result.arrow[1])
+        text.set_text(result.text)
+
+        self.canvas.restore_region(self._background)
+        self._draw_result_artists()
+        self.canvas.blit(self.figure.bbox)
+
+    def _draw_result_artists(self):
+        if self._result_artists:
+            for artist in self._result_artists:
+                self.axes.draw_artist(artist)
+
+    def grab_pixmap(self):
+        """Снимок последней отрисовки для кэша"""
+        if self.is_native:
+            rect = self.diagram_item.boundingRect()
+            pixmap = QPixmap(int(rect.width()), int(rect.height()))
+            painter = QPainter(pixmap)
+            self.diagram_item.paint(painter, None)
+            painter.end()
+            return pixmap
+
+        buffer = self.canvas.buffer_rgba()
+        height, width = buffer.shape[:2]
+        image = QImage(buffer, width, height, QImage.Format.Format_RGBA8888)
+        return QPixmap.fromImage(image.copy())
+
+    def show_pixmap(self, pixmap, resultant=None):
+        """
+        Показать готовое изображение диаграммы без повторной отрисовки
+
+        Args:
+            pixmap (QPixmap): Снимок, полученный grab_pixmap
+            resultant (NDArray): Результирующий вектор этой диаграммы
+        """
+        self.resultant = resultant
+        self.pixmap_item.setPixmap(pixmap)
+        rect = self.content.boundingRect()
+        self.pixmap_item.setScale(rect.width() / max(pixmap.width(), 1))
+        self._show_canvas(False)
+        self._adjust_view()
+
+    def _show_canvas(self, visible):
+        """Переключение между живой отрисовкой и кэшированным изображением"""
+        self.content.setVisible(visible)
+        self.pixmap_item.setVisible(not visible)
@@ -0,0 +1,79 @@
+# tests/test_vector_plot_view.py
+"""
+Regression test: the resultant drawn by every vector diagram matches the
+batched calculator output.
+"""
+import os
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import numpy as np
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from src.config.config import AppConfig
+from src.controllers.survey_calculation import SurveyCalculation
+from src.controllers.vector_calculator import VectorCalculator
+from src.models.vector_data import VectorDataset
+
+NAMES = ['10', '20', '30', '40', '50', '60']
+LENGTHS = [
+    [1.0, 2.0, 3.0],
+    [0.0, 1.5, -2.0],  # Нулевая первая ОП
+    [4.0, 0.0, 1.0],  # Нулевая вторая ОП
+    [-1.0, -1.0, 0.0],  # Нулевая третья ОП
+    [0.5, 0.25, 0.125],
+    [2.0, -3.0, 1.0],
+]
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture(params=['matplotlib', 'native'])
+def renderer(request, monkeypatch):
+    monkeypatch.setattr(AppConfig, 'VECTOR_RENDERER', request.param)
+    return request.param
+
+
+@pytest.fixture
+def window(app, renderer):
+    from src.views.main_window import MainWindow
+
+    window = MainWindow()
+    window.resize(1200, 2000)
+    window.show()
+    window.tabs.setCurrentIndex(1)
+    yield window
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+
+
+def _render_all(app, grid):
+    """Прокрутить цикл событий, пока очередь отрисовки не опустеет"""
+    for _ in range(1000):
+        app.processEvents()
+        if not grid._render_queue:
+            return
+    pytest.fail("Очередь отрисовки диаграмм не опустела")
+
+
+@pytest.mark.parametrize('azimuth, is_clockwise', [(0.0, True), (37.5, False), (290.0, True)])
+def test_drawn_resultants_match_calculator(app, window, azimuth, is_clockwise):
+    dataset = VectorDataset(NAMES, LENGTHS)
+    window._calculation = SurveyCalculation(dataset, azimuth, is_clockwise)
+    window._update_vector_plots()
+    _render_all(app, window.vector_grid)
+
+    expected = VectorCalculator.rotate_vectors(
+        VectorCalculator.calculate_batch(np.array(LENGTHS), is_clockwise).resultants,
+        azimuth)
+
+    for index in range(len(NAMES)):
+        view = window.vector_grid.view_for(index)
+        assert view is not None, f"Диаграмма {index} не видна"
+        assert view.resultant is not None, f"Диаграмма {index} не отрисована"
+        np.testing.assert_allclose(view.resultant, expected[index], atol=1e-12)